@@ -5,7 +5,9 @@ Enables required GCP APIs and verifies propagation.
 import subprocess
 import asyncio
 import logging
-from typing import Dict, List
+import re
+import time
+from typing import Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,25 @@ REQUIRED_APIS = [
     "aiplatform.googleapis.com",         # Vertex AI API for ML.GENERATE_TEXT in analytics views
 ]
 
+# Retry `gcloud services enable` only on quota, unavailable and deadline errors (or a
+# timeout), doubling the wait; permission, billing and unknown-service errors won't clear
+ENABLE_API_MAX_ATTEMPTS = 3
+ENABLE_API_RETRY_BASE_DELAY = 1.0  # seconds
+TRANSIENT_ENABLE_ERROR_PATTERN = re.compile(
+    r"RESOURCE_EXHAUSTED|quota|UNAVAILABLE|DEADLINE_EXCEEDED|deadline exceeded|try again",
+    re.IGNORECASE,
+)
+
+# APIs verify_api_accessible checks with a real call rather than the enabled listing
+SMOKE_TESTED_APIS = frozenset({"bigquery.googleapis.com", "logging.googleapis.com"})
+
+# `gcloud services list` takes most of a second; reuse a recent listing. Enabling an
+# API through enable_api drops the project's entry.
+ENABLED_APIS_TTL_SECONDS = 30
+
+# project_id -> (listed_at, enabled API names)
+_enabled_apis_cache: Dict[str, Tuple[float, List[str]]] = {}
+
 
 async def enable_apis(project_id: str) -> Dict:
     """
@@ -38,36 +59,50 @@ async def enable_apis(project_id: str) -> Dict:
     failed = []
 
     try:
-        # Check which APIs are already enabled
-        currently_enabled = await get_enabled_apis(project_id)
+        # Check which APIs are already enabled (as a set: checked once per required API)
+        currently_enabled = frozenset(await get_enabled_apis(project_id))
         logger.info(f"Currently enabled APIs: {len(currently_enabled)}")
 
+        missing = []
         for api in REQUIRED_APIS:
             if api in currently_enabled:
                 logger.info(f"API already enabled: {api}")
                 enabled.append(api)
             else:
-                # Enable the API
-                logger.info(f"Enabling API: {api}")
-                success = await enable_api(project_id, api)
+                missing.append(api)
 
-                if success:
-                    enabled.append(api)
-                else:
-                    failed.append(api)
+        # Each enablement is an independent gcloud call, so run them concurrently
+        if missing:
+            logger.info(f"Enabling APIs: {', '.join(missing)}")
+        results = await asyncio.gather(*(_enable_api_with_retry(project_id, api) for api in missing))
+
+        newly_enabled = []
+        for api, success in zip(missing, results):
+            if success:
+                enabled.append(api)
+                newly_enabled.append(api)
+            else:
+                failed.append(api)
 
         # If we enabled any APIs, wait for propagation
-        newly_enabled = [api for api in enabled if api not in currently_enabled]
         if newly_enabled:
             logger.info(f"Waiting for API propagation ({len(newly_enabled)} APIs)...")
             await asyncio.sleep(30)  # Wait 30 seconds for API propagation
 
-            # Verify APIs are accessible
-            for api in newly_enabled:
-                accessible = await verify_api_accessible(project_id, api)
-                if not accessible:
-                    logger.warning(f"API {api} not yet accessible, waiting longer...")
-                    await asyncio.sleep(30)  # Additional wait
+            # One fresh listing covers every newly enabled API; BigQuery and Logging
+            # also get a real call to prove they answer
+            _enabled_apis_cache.pop(project_id, None)
+            smoke_tested = [api for api in newly_enabled if api in SMOKE_TESTED_APIS]
+            listing, *smoke_results = await asyncio.gather(
+                get_enabled_apis(project_id),
+                *(verify_api_accessible(project_id, api) for api in smoke_tested)
+            )
+            listed = frozenset(listing)
+            failed_smoke = {api for api, ok in zip(smoke_tested, smoke_results) if not ok}
+            not_ready = [api for api in newly_enabled if api not in listed or api in failed_smoke]
+            if not_ready:
+                logger.warning(f"APIs not yet accessible, waiting longer: {', '.join(not_ready)}")
+                await asyncio.sleep(30)  # Additional wait
 
         if failed:
             raise Exception(f"Failed to enable APIs: {', '.join(failed)}")
@@ -84,9 +119,14 @@ async def enable_apis(project_id: str) -> Dict:
 
 
 async def get_enabled_apis(project_id: str) -> List[str]:
-    """Get list of currently enabled APIs."""
+    """Get list of currently enabled APIs, cached for ENABLED_APIS_TTL_SECONDS."""
+    cached = _enabled_apis_cache.get(project_id)
+    if cached and time.monotonic() - cached[0] < ENABLED_APIS_TTL_SECONDS:
+        return cached[1]
+
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             [
                 "gcloud", "services", "list",
                 f"--project={project_id}",
@@ -100,6 +140,7 @@ async def get_enabled_apis(project_id: str) -> List[str]:
 
         if result.returncode == 0:
             apis = [api.strip() for api in result.stdout.strip().split('\n') if api.strip()]
+            _enabled_apis_cache[project_id] = (time.monotonic(), apis)
             return apis
         else:
             logger.warning(f"Could not get enabled APIs: {result.stderr}")
@@ -112,8 +153,15 @@ async def get_enabled_apis(project_id: str) -> List[str]:
 
 async def enable_api(project_id: str, api: str) -> bool:
     """Enable a single API."""
+    enabled, _ = await _try_enable_api(project_id, api)
+    return enabled
+
+
+async def _try_enable_api(project_id: str, api: str) -> Tuple[bool, bool]:
+    """Enable a single API, returning (enabled, failure is worth retrying)."""
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             [
                 "gcloud", "services", "enable", api,
                 f"--project={project_id}"
@@ -125,17 +173,35 @@ async def enable_api(project_id: str, api: str) -> bool:
 
         if result.returncode == 0:
             logger.info(f"Successfully enabled API: {api}")
-            return True
+            _enabled_apis_cache.pop(project_id, None)
+            return True, False
         else:
             logger.error(f"Failed to enable API {api}: {result.stderr}")
-            return False
+            return False, bool(TRANSIENT_ENABLE_ERROR_PATTERN.search(result.stderr or ""))
 
     except subprocess.TimeoutExpired:
         logger.error(f"API enablement timed out for: {api}")
-        return False
+        return False, True
     except Exception as e:
         logger.error(f"Failed to enable API {api}: {str(e)}")
-        return False
+        return False, False
+
+
+async def _enable_api_with_retry(project_id: str, api: str) -> bool:
+    """Enable a single API, retrying transient failures up to ENABLE_API_MAX_ATTEMPTS times."""
+    for attempt in range(ENABLE_API_MAX_ATTEMPTS):
+        if attempt > 0:
+            retry_delay = ENABLE_API_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+            logger.info(f"Retrying API {api} ({attempt + 1}/{ENABLE_API_MAX_ATTEMPTS}) after {retry_delay:.1f}s...")
+            await asyncio.sleep(retry_delay)
+
+        enabled, transient = await _try_enable_api(project_id, api)
+        if enabled:
+            return True
+        if not transient:
+            break
+
+    return False
 
 
 async def verify_api_accessible(project_id: str, api: str) -> bool:
@@ -163,7 +229,8 @@ async def verify_api_accessible(project_id: str, api: str) -> bool:
 async def verify_bigquery_api(project_id: str) -> bool:
     """Verify BigQuery API is accessible."""
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             [
                 "gcloud", "bq", "ls",
                 f"--project_id={project_id}",
@@ -185,7 +252,8 @@ async def verify_bigquery_api(project_id: str) -> bool:
 async def verify_logging_api(project_id: str) -> bool:
     """Verify Cloud Logging API is accessible."""
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             [
                 "gcloud", "logging", "logs", "list",
                 f"--project={project_id}",
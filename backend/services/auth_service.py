@@ -3,6 +3,7 @@ Authentication service.
 Handles Google Cloud authentication.
 """
 import subprocess
+import asyncio
 import logging
 import os
 from typing import Dict
@@ -17,7 +18,8 @@ async def authenticate() -> Dict:
     """
     try:
         # Check if already authenticated
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             ["gcloud", "auth", "list", "--filter=status:ACTIVE", "--format=value(account)"],
             capture_output=True,
             text=True,
@@ -61,7 +63,8 @@ async def setup_application_default_credentials() -> bool:
     This is required for the Google Cloud libraries to work.
     """
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             ["gcloud", "auth", "application-default", "print-access-token"],
             capture_output=True,
             text=True,
@@ -89,7 +92,8 @@ async def setup_application_default_credentials() -> bool:
 async def get_active_account() -> str:
     """Get the currently active gcloud account."""
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             ["gcloud", "auth", "list", "--filter=status:ACTIVE", "--format=value(account)"],
             capture_output=True,
             text=True,
@@ -133,7 +137,8 @@ async def check_auth_status() -> Dict:
 
     try:
         # Check if gcloud is installed by running gcloud version
-        version_check = subprocess.run(
+        version_check = await asyncio.to_thread(
+            subprocess.run,
             ["gcloud", "version"],
             capture_output=True,
             text=True,
@@ -153,7 +158,8 @@ async def check_auth_status() -> Dict:
 
     # If gcloud is installed, check authentication
     try:
-        auth_check = subprocess.run(
+        auth_check = await asyncio.to_thread(
+            subprocess.run,
             ["gcloud", "auth", "list", "--filter=status:ACTIVE", "--format=value(account)"],
             capture_output=True,
             text=True,
@@ -204,7 +210,8 @@ async def initiate_oauth_flow() -> Dict:
         logger.info("Initiating OAuth flow (no-launch-browser mode)")
 
         # Run gcloud auth login with --no-launch-browser to get URL
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             ["gcloud", "auth", "login", "--no-launch-browser"],
             capture_output=True,
             text=True,
@@ -266,7 +273,8 @@ async def authenticate_oauth_flow(project_id: str) -> Dict:
 
         # Use gcloud auth application-default login to create ADC
         # This is required for Gemini CLI OAuth authentication
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             ["gcloud", "auth", "application-default", "login", "--project", project_id, "--quiet"],
             capture_output=True,
             text=True,
@@ -279,7 +287,8 @@ async def authenticate_oauth_flow(project_id: str) -> Dict:
                 logger.warning("Browser didn't open automatically, providing manual URL...")
 
                 # Get manual auth URL for ADC
-                url_result = subprocess.run(
+                url_result = await asyncio.to_thread(
+                    subprocess.run,
                     ["gcloud", "auth", "application-default", "login", "--project", project_id, "--no-launch-browser"],
                     capture_output=True,
                     text=True,
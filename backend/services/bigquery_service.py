@@ -174,7 +174,7 @@ async def verify_dataset_exists(project_id: str, dataset_name: str) -> bool:
         client = bigquery.Client(project=project_id)
         dataset_id = f"{project_id}.{dataset_name}"
 
-        client.get_dataset(dataset_id)
+        await asyncio.to_thread(client.get_dataset, dataset_id)
         logger.info(f"Dataset {dataset_id} exists")
         return True
 
@@ -204,7 +204,7 @@ async def verify_table_exists(project_id: str, dataset_name: str, table_name: st
         client = bigquery.Client(project=project_id)
         table_id = f"{project_id}.{dataset_name}.{table_name}"
 
-        client.get_table(table_id)
+        await asyncio.to_thread(client.get_table, table_id)
         logger.info(f"Table {table_id} exists")
         return True
 
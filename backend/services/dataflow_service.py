@@ -637,7 +637,8 @@ async def get_job_status(
             "--format", "json"
         ]
 
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             command,
             capture_output=True,
             text=True,
@@ -827,7 +828,8 @@ async def list_dataflow_jobs(
         if status_filter:
             command.extend(["--status", status_filter])
 
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             command,
             capture_output=True,
             text=True,
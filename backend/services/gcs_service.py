@@ -12,6 +12,7 @@ Per IMPLEMENTATION_PLAN.md Step 8b:
 - Public access: Disabled (private bucket)
 """
 
+import asyncio
 import logging
 import os
 from typing import Dict
@@ -239,8 +240,8 @@ async def verify_bucket_exists(
         storage_client = storage.Client(project=project_id)
         bucket = storage_client.bucket(bucket_name)
 
-        # Check if bucket exists
-        bucket.reload()
+        # Check if bucket exists (blocking request; keep it off the event loop)
+        await asyncio.to_thread(bucket.reload)
         logger.info(f"Bucket gs://{bucket_name} exists")
         return True
 
@@ -292,7 +293,7 @@ async def verify_file_exists(
         blob = bucket.blob(file_name)
 
         # Check if file exists
-        exists = blob.exists()
+        exists = await asyncio.to_thread(blob.exists)
 
         if exists:
             logger.info(f"File gs://{bucket_name}/{file_name} exists")
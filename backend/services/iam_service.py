@@ -19,6 +19,11 @@ REQUIRED_ROLES = [
     "roles/storage.admin",          # GCS bucket for UDF storage
 ]
 
+# Settle time after granting a role on a single resource (topic, subscription).
+# IAM changes are typically enforced within about a minute; reading the policy
+# back can't tell us when, since it shows the new binding straight away
+IAM_GRANT_SETTLE_SECONDS = 60
+
 
 async def check_permissions(project_id: str) -> Dict:
     """
@@ -145,13 +150,17 @@ async def attempt_grant_roles(project_id: str, user_email: str, roles: List[str]
         return False
 
 
-async def wait_for_iam_propagation(seconds: int = 90) -> None:
+async def wait_for_iam_propagation(seconds: int = 90) -> int:
     """
     Wait for IAM policy changes to propagate globally.
 
     IAM changes can take up to 7 minutes to propagate, but we use 90 seconds
     as a reasonable balance per the implementation plan.
+
+    Returns:
+        Seconds waited
     """
     logger.info(f"Waiting {seconds} seconds for IAM propagation...")
     await asyncio.sleep(seconds)
     logger.info("IAM propagation wait complete")
+    return seconds
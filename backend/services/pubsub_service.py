@@ -10,12 +10,19 @@ Per IMPLEMENTATION_PLAN.md Step 8:
 - Grant Pub/Sub Publisher role to sink service account
 """
 
+import atexit
 import logging
 import asyncio
-from typing import Dict
+import subprocess
+import time
+from typing import Awaitable, Callable, Dict, Set, Tuple
 from google.cloud import pubsub_v1
-from google.api_core.exceptions import AlreadyExists, NotFound
+from google.cloud.pubsub_v1 import types as pubsub_types
+from google.pubsub_v1.services.publisher.transports import PublisherGrpcTransport
+from google.pubsub_v1.services.subscriber.transports import SubscriberGrpcTransport
+from google.api_core.exceptions import AlreadyExists, Aborted, NotFound
 from google.cloud import resourcemanager_v3
+from services import iam_service
 from utils.validators import (
     validate_gcp_project_id,
     validate_topic_name,
@@ -24,6 +31,210 @@ from utils.validators import (
 
 logger = logging.getLogger(__name__)
 
+# Attempts for IAM read-modify-write when a concurrent change invalidates the etag
+IAM_POLICY_MAX_ATTEMPTS = 3
+
+# Seconds a project's topic/subscription listing is reused by the verify_* functions
+RESOURCE_LIST_TTL_SECONDS = 5
+
+# project_id -> (listed_at, resource short names)
+_topic_names_cache: Dict[str, Tuple[float, Set[str]]] = {}
+_subscription_names_cache: Dict[str, Tuple[float, Set[str]]] = {}
+
+# Keepalive pings stop idle connections being dropped during long IAM waits
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+# "channel", "publisher", "subscriber" -> shared instance, created on first use
+_clients: Dict[str, object] = {}
+
+
+def _create_channel():
+    """Open a gRPC channel to the Pub/Sub API with keepalive enabled."""
+    return PublisherGrpcTransport.create_channel(options=GRPC_CHANNEL_OPTIONS)
+
+
+def _close_channel() -> None:
+    """Close the shared channel and forget the clients built on it."""
+    channel = _clients.pop("channel", None)
+    _clients.clear()
+    if channel is not None:
+        channel.close()
+
+
+def _get_channel():
+    """Channel shared by the module's publisher and subscriber clients."""
+    if "channel" not in _clients:
+        _clients["channel"] = _create_channel()
+        atexit.register(_close_channel)
+    return _clients["channel"]
+
+
+def _get_publisher() -> pubsub_v1.PublisherClient:
+    """PublisherClient on the shared channel, reused across calls."""
+    if "publisher" not in _clients:
+        _clients["publisher"] = pubsub_v1.PublisherClient(
+            transport=PublisherGrpcTransport(channel=_get_channel())
+        )
+    return _clients["publisher"]
+
+
+def _get_subscriber() -> pubsub_v1.SubscriberClient:
+    """SubscriberClient on the shared channel, reused across calls."""
+    if "subscriber" not in _clients:
+        _clients["subscriber"] = pubsub_v1.SubscriberClient(
+            transport=SubscriberGrpcTransport(channel=_get_channel())
+        )
+    return _clients["subscriber"]
+
+
+def _list_topic_names(project_id: str) -> Set[str]:
+    """Short names of all topics in the project, cached for RESOURCE_LIST_TTL_SECONDS."""
+    cached = _topic_names_cache.get(project_id)
+    if cached and time.monotonic() - cached[0] < RESOURCE_LIST_TTL_SECONDS:
+        return cached[1]
+
+    publisher = _get_publisher()
+    names = {
+        topic.name.rsplit("/", 1)[-1]
+        for topic in publisher.list_topics(request={"project": f"projects/{project_id}"})
+    }
+    _topic_names_cache[project_id] = (time.monotonic(), names)
+    return names
+
+
+def _list_subscription_names(project_id: str) -> Set[str]:
+    """Short names of all subscriptions in the project, cached for RESOURCE_LIST_TTL_SECONDS."""
+    cached = _subscription_names_cache.get(project_id)
+    if cached and time.monotonic() - cached[0] < RESOURCE_LIST_TTL_SECONDS:
+        return cached[1]
+
+    subscriber = _get_subscriber()
+    names = {
+        subscription.name.rsplit("/", 1)[-1]
+        for subscription in subscriber.list_subscriptions(request={"project": f"projects/{project_id}"})
+    }
+    _subscription_names_cache[project_id] = (time.monotonic(), names)
+    return names
+
+
+def _ensure_iam_binding(policy, role: str, member: str) -> bool:
+    """
+    Add member to role in an IAM policy, creating the binding if needed.
+
+    Returns:
+        True if the policy was mutated, False if member already had the role
+    """
+    for binding in policy.bindings:
+        if binding.role == role:
+            if member in binding.members:
+                return False
+            binding.members.append(member)
+            return True
+
+    policy.bindings.append(pubsub_types.Binding(role=role, members=[member]))
+    return True
+
+
+async def _no_propagation_wait() -> int:
+    """Propagation wait for a binding that already existed."""
+    return 0
+
+
+async def _grant_role(client, resource: str, role: str, member: str) -> asyncio.Task:
+    """
+    Grant role to member on a topic or subscription.
+
+    The policy is re-read and the write retried if a concurrent change
+    invalidated its etag. When member already has the role nothing is
+    written and there is no propagation wait.
+
+    A new grant gets a fixed IAM_GRANT_SETTLE_SECONDS propagation wait,
+    run as a background task so callers can overlap it with other work and
+    await it only before the grant is needed.
+
+    Args:
+        client: PublisherClient or SubscriberClient owning the resource
+        resource: Topic or subscription path
+        role: IAM role to grant
+        member: Member to grant it to (e.g. "serviceAccount:...")
+
+    Returns:
+        Task resolving to seconds waited for IAM propagation
+        (0 if the binding already existed)
+    """
+    for attempt in range(1, IAM_POLICY_MAX_ATTEMPTS + 1):
+        policy = client.get_iam_policy(request={"resource": resource})
+
+        if not _ensure_iam_binding(policy, role, member):
+            logger.info("%s already has %s on %s", member, role, resource)
+            return asyncio.create_task(_no_propagation_wait())
+
+        try:
+            client.set_iam_policy(request={"resource": resource, "policy": policy})
+            break
+        except Aborted:
+            if attempt == IAM_POLICY_MAX_ATTEMPTS:
+                raise
+            logger.warning("IAM policy on %s changed concurrently, retrying (%s/%s)...", resource, attempt, IAM_POLICY_MAX_ATTEMPTS)
+
+    logger.info("✓ Granted %s to %s", role, member)
+    logger.info("  - Resource: %s", resource)
+
+    return asyncio.create_task(iam_service.wait_for_iam_propagation(iam_service.IAM_GRANT_SETTLE_SECONDS))
+
+
+async def _longest_propagation_wait(*propagations: asyncio.Task) -> int:
+    """Await concurrent propagation waits and return the longest one."""
+    return max(await asyncio.gather(*propagations))
+
+
+async def _granted(grant: Awaitable[Tuple[Dict, asyncio.Task]]) -> Dict:
+    """Await a private grant helper and its IAM propagation wait."""
+    result, propagation = await grant
+    result["iam_propagation_wait"] = await propagation
+    logger.info("✓ IAM propagation complete")
+    return result
+
+
+async def _run_steps(steps: Dict[str, Tuple[Tuple[str, ...], Callable[[], Awaitable]]]) -> Dict:
+    """
+    Run deployment steps as a dependency graph.
+
+    Every step starts as soon as the steps it depends on have finished, so
+    independent branches run concurrently. If any step fails the remaining
+    steps are cancelled and the error is re-raised.
+
+    Args:
+        steps: name -> (names of steps it depends on, zero-argument coroutine
+            function); dependencies must be listed before their dependents
+
+    Returns:
+        name -> step result
+    """
+    tasks: Dict[str, asyncio.Task] = {}
+
+    async def run(deps: Tuple[str, ...], step: Callable[[], Awaitable]):
+        await asyncio.gather(*(tasks[dep] for dep in deps))
+        return await step()
+
+    for name, (deps, step) in steps.items():
+        tasks[name] = asyncio.create_task(run(deps, step))
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except Exception:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    return {name: task.result() for name, task in tasks.items()}
+
 
 async def create_topic(project_id: str, topic_name: str = "gemini-telemetry-topic") -> Dict:
     """
@@ -46,17 +257,24 @@ async def create_topic(project_id: str, topic_name: str = "gemini-telemetry-topi
         project_id = validate_gcp_project_id(project_id)
         topic_name = validate_topic_name(topic_name)
     except ValidationError as e:
-        logger.error(f"Input validation failed: {str(e)}")
+        logger.error("Input validation failed: %s", e)
         raise ValueError(f"Invalid input: {str(e)}")
 
+    return await _create_topic(project_id, topic_name)
+
+
+async def _create_topic(project_id: str, topic_name: str = "gemini-telemetry-topic") -> Dict:
+    """Create the topic. Inputs must already be validated (see create_topic)."""
+    _topic_names_cache.pop(project_id, None)
+
     try:
-        publisher = pubsub_v1.PublisherClient()
+        publisher = _get_publisher()
         topic_path = publisher.topic_path(project_id, topic_name)
 
         try:
             # Attempt to create the topic
             topic = publisher.create_topic(request={"name": topic_path})
-            logger.info(f"✓ Pub/Sub topic created: {topic.name}")
+            logger.info("✓ Pub/Sub topic created: %s", topic.name)
 
             return {
                 "topic": topic.name,
@@ -66,7 +284,7 @@ async def create_topic(project_id: str, topic_name: str = "gemini-telemetry-topi
             }
 
         except AlreadyExists:
-            logger.info(f"Topic {topic_path} already exists")
+            logger.info("Topic %s already exists", topic_path)
 
             return {
                 "topic": topic_path,
@@ -76,7 +294,7 @@ async def create_topic(project_id: str, topic_name: str = "gemini-telemetry-topi
             }
 
     except Exception as e:
-        logger.error(f"Failed to create Pub/Sub topic: {str(e)}")
+        logger.error("Failed to create Pub/Sub topic: %s", e)
         raise
 
 
@@ -88,8 +306,9 @@ async def create_subscription(
     """
     Create a Pull subscription for Dataflow to consume messages from the topic.
 
-    If subscription already exists, delete and recreate it to ensure it points
-    to the current topic (avoids "_deleted-topic_" errors).
+    If subscription already exists and is bound to the current topic it is
+    reused as-is. Only a subscription pointing at a different topic (e.g.
+    "_deleted-topic_") is deleted and recreated.
 
     Args:
         project_id: GCP project ID
@@ -103,7 +322,7 @@ async def create_subscription(
             "name": subscription_name,
             "topic": topic_path,
             "delivery_type": "Pull",
-            "status": "created" or "already_exists"
+            "status": "created", "already_exists" or "recreated"
         }
     """
     # Validate inputs
@@ -112,12 +331,23 @@ async def create_subscription(
         topic_name = validate_topic_name(topic_name)
         subscription_name = validate_topic_name(subscription_name)  # Same validation rules
     except ValidationError as e:
-        logger.error(f"Input validation failed: {str(e)}")
+        logger.error("Input validation failed: %s", e)
         raise ValueError(f"Invalid input: {str(e)}")
 
+    return await _create_subscription(project_id, topic_name, subscription_name)
+
+
+async def _create_subscription(
+    project_id: str,
+    topic_name: str = "gemini-telemetry-topic",
+    subscription_name: str = "gemini-telemetry-sub"
+) -> Dict:
+    """Create the subscription. Inputs must already be validated (see create_subscription)."""
+    _subscription_names_cache.pop(project_id, None)
+
     try:
-        publisher = pubsub_v1.PublisherClient()
-        subscriber = pubsub_v1.SubscriberClient()
+        publisher = _get_publisher()
+        subscriber = _get_subscriber()
 
         topic_path = publisher.topic_path(project_id, topic_name)
         subscription_path = subscriber.subscription_path(project_id, subscription_name)
@@ -131,9 +361,10 @@ async def create_subscription(
                 }
             )
 
-            logger.info(f"✓ Pull subscription created: {subscription.name}")
-            logger.info(f"  - Topic: {topic_path}")
-            logger.info(f"  - Delivery type: Pull (for Dataflow)")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✓ Pull subscription created: %s", subscription.name)
+                logger.info("  - Topic: %s", topic_path)
+                logger.info("  - Delivery type: Pull (for Dataflow)")
 
             return {
                 "subscription": subscription.name,
@@ -145,14 +376,28 @@ async def create_subscription(
             }
 
         except AlreadyExists:
-            logger.info(f"Subscription {subscription_path} already exists - deleting and recreating to ensure correct topic binding...")
+            existing = subscriber.get_subscription(request={"subscription": subscription_path})
+
+            if existing.topic == topic_path:
+                logger.info("Subscription %s already exists and is bound to %s", subscription_path, topic_path)
+
+                return {
+                    "subscription": subscription_path,
+                    "name": subscription_name,
+                    "topic": topic_path,
+                    "delivery_type": "Pull",
+                    "status": "already_exists",
+                    "note": f"Subscription {subscription_name} already exists and will be reused"
+                }
+
+            logger.info("Subscription %s is bound to %s - deleting and recreating to bind to %s...", subscription_path, existing.topic, topic_path)
 
             # Delete existing subscription to avoid stale topic references
             try:
                 subscriber.delete_subscription(request={"subscription": subscription_path})
-                logger.info(f"  Deleted old subscription")
+                logger.info("  Deleted old subscription")
             except NotFound:
-                logger.info(f"  Subscription already deleted")
+                logger.info("  Subscription already deleted")
 
             # Recreate subscription with current topic
             subscription = subscriber.create_subscription(
@@ -162,9 +407,10 @@ async def create_subscription(
                 }
             )
 
-            logger.info(f"✓ Pull subscription recreated: {subscription.name}")
-            logger.info(f"  - Topic: {topic_path}")
-            logger.info(f"  - Delivery type: Pull (for Dataflow)")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✓ Pull subscription recreated: %s", subscription.name)
+                logger.info("  - Topic: %s", topic_path)
+                logger.info("  - Delivery type: Pull (for Dataflow)")
 
             return {
                 "subscription": subscription.name,
@@ -176,7 +422,7 @@ async def create_subscription(
             }
 
     except Exception as e:
-        logger.error(f"Failed to create Pub/Sub subscription: {str(e)}")
+        logger.error("Failed to create Pub/Sub subscription: %s", e)
         raise
 
 
@@ -202,7 +448,8 @@ async def grant_publisher_to_sink(
             "service_account": sink_service_account,
             "role": "roles/pubsub.publisher",
             "status": "granted",
-            "iam_propagation_wait": 90
+            "iam_propagation_wait": seconds waited (IAM_GRANT_SETTLE_SECONDS,
+                                    or 0 if the role was already granted)
         }
     """
     # Validate inputs
@@ -210,61 +457,46 @@ async def grant_publisher_to_sink(
         project_id = validate_gcp_project_id(project_id)
         topic_name = validate_topic_name(topic_name)
     except ValidationError as e:
-        logger.error(f"Input validation failed: {str(e)}")
+        logger.error("Input validation failed: %s", e)
         raise ValueError(f"Invalid input: {str(e)}")
 
-    try:
-        publisher = pubsub_v1.PublisherClient()
-        topic_path = publisher.topic_path(project_id, topic_name)
-
-        # Get current IAM policy
-        policy = publisher.get_iam_policy(request={"resource": topic_path})
-
-        # Add the binding if not already present
-        binding_exists = False
-        for binding in policy.bindings:
-            if binding.role == "roles/pubsub.publisher":
-                if f"serviceAccount:{sink_service_account}" in binding.members:
-                    binding_exists = True
-                    logger.info(f"Service account {sink_service_account} already has Publisher role")
-                else:
-                    # Add to existing binding
-                    binding.members.append(f"serviceAccount:{sink_service_account}")
-                    binding_exists = True
-                break
-
-        if not binding_exists:
-            # Create new binding
-            from google.cloud.pubsub_v1 import types
-            new_binding = types.Binding(
-                role="roles/pubsub.publisher",
-                members=[f"serviceAccount:{sink_service_account}"]
-            )
-            policy.bindings.append(new_binding)
+    return await _granted(_grant_publisher_to_sink(project_id, sink_service_account, topic_name))
 
-        # Set the updated policy
-        publisher.set_iam_policy(request={"resource": topic_path, "policy": policy})
 
-        logger.info(f"✓ Granted roles/pubsub.publisher to {sink_service_account}")
-        logger.info(f"  - Topic: {topic_path}")
-        logger.info(f"  - Waiting 90 seconds for IAM propagation...")
+async def _grant_publisher_to_sink(
+    project_id: str,
+    sink_service_account: str,
+    topic_name: str = "gemini-telemetry-topic"
+) -> Tuple[Dict, asyncio.Task]:
+    """
+    Grant the Publisher role. Inputs must already be validated (see grant_publisher_to_sink).
 
-        # Wait for IAM propagation (critical for sink to work)
-        await asyncio.sleep(90)
+    Returns the result dict (without "iam_propagation_wait") and the
+    pending propagation task, which must be awaited before the sink relies
+    on the grant (critical for sink to work).
+    """
+    try:
+        publisher = _get_publisher()
+        topic_path = publisher.topic_path(project_id, topic_name)
 
-        logger.info(f"✓ IAM propagation complete")
+        logger.info("Granting roles/pubsub.publisher to %s...", sink_service_account)
+        propagation = await _grant_role(
+            publisher,
+            topic_path,
+            "roles/pubsub.publisher",
+            f"serviceAccount:{sink_service_account}"
+        )
 
         return {
             "topic": topic_path,
             "service_account": sink_service_account,
             "role": "roles/pubsub.publisher",
             "status": "granted",
-            "iam_propagation_wait": 90,
             "note": "Sink can now publish to Pub/Sub topic"
-        }
+        }, propagation
 
     except Exception as e:
-        logger.error(f"Failed to grant Pub/Sub Publisher role: {str(e)}")
+        logger.error("Failed to grant Pub/Sub Publisher role: %s", e)
         raise
 
 
@@ -272,6 +504,9 @@ async def verify_topic_exists(project_id: str, topic_name: str = "gemini-telemet
     """
     Verify that a Pub/Sub topic exists.
 
+    Checks membership in the project's topic listing (cached for
+    RESOURCE_LIST_TTL_SECONDS) rather than a per-topic get.
+
     Args:
         project_id: GCP project ID
         topic_name: Name of the topic to verify
@@ -284,22 +519,19 @@ async def verify_topic_exists(project_id: str, topic_name: str = "gemini-telemet
         project_id = validate_gcp_project_id(project_id)
         topic_name = validate_topic_name(topic_name)
     except ValidationError as e:
-        logger.error(f"Input validation failed: {str(e)}")
+        logger.error("Input validation failed: %s", e)
         raise ValueError(f"Invalid input: {str(e)}")
 
     try:
-        publisher = pubsub_v1.PublisherClient()
-        topic_path = publisher.topic_path(project_id, topic_name)
+        if topic_name in await asyncio.to_thread(_list_topic_names, project_id):
+            logger.info("Topic %s exists in %s", topic_name, project_id)
+            return True
 
-        publisher.get_topic(request={"topic": topic_path})
-        logger.info(f"Topic {topic_path} exists")
-        return True
-
-    except NotFound:
-        logger.warning(f"Topic {topic_path} not found")
+        logger.warning("Topic %s not found in %s", topic_name, project_id)
         return False
+
     except Exception as e:
-        logger.error(f"Topic verification failed: {str(e)}")
+        logger.error("Topic verification failed: %s", e)
         return False
 
 
@@ -310,6 +542,9 @@ async def verify_subscription_exists(
     """
     Verify that a Pub/Sub subscription exists.
 
+    Checks membership in the project's subscription listing (cached for
+    RESOURCE_LIST_TTL_SECONDS) rather than a per-subscription get.
+
     Args:
         project_id: GCP project ID
         subscription_name: Name of the subscription to verify
@@ -322,22 +557,19 @@ async def verify_subscription_exists(
         project_id = validate_gcp_project_id(project_id)
         subscription_name = validate_topic_name(subscription_name)  # Same validation rules
     except ValidationError as e:
-        logger.error(f"Input validation failed: {str(e)}")
+        logger.error("Input validation failed: %s", e)
         raise ValueError(f"Invalid input: {str(e)}")
 
     try:
-        subscriber = pubsub_v1.SubscriberClient()
-        subscription_path = subscriber.subscription_path(project_id, subscription_name)
+        if subscription_name in await asyncio.to_thread(_list_subscription_names, project_id):
+            logger.info("Subscription %s exists in %s", subscription_name, project_id)
+            return True
 
-        subscriber.get_subscription(request={"subscription": subscription_path})
-        logger.info(f"Subscription {subscription_path} exists")
-        return True
-
-    except NotFound:
-        logger.warning(f"Subscription {subscription_path} not found")
+        logger.warning("Subscription %s not found in %s", subscription_name, project_id)
         return False
+
     except Exception as e:
-        logger.error(f"Subscription verification failed: {str(e)}")
+        logger.error("Subscription verification failed: %s", e)
         return False
 
 
@@ -367,12 +599,25 @@ async def grant_dataflow_subscription_permissions(
         subscription_name = validate_topic_name(subscription_name)  # Same validation rules
         topic_name = validate_topic_name(topic_name)
     except ValidationError as e:
-        logger.error(f"Input validation failed: {str(e)}")
+        logger.error("Input validation failed: %s", e)
         raise ValueError(f"Invalid input: {str(e)}")
 
+    return await _granted(_grant_dataflow_subscription_permissions(project_id, subscription_name, topic_name))
+
+
+async def _grant_dataflow_subscription_permissions(
+    project_id: str,
+    subscription_name: str = "gemini-telemetry-sub",
+    topic_name: str = "gemini-telemetry-topic"
+) -> Tuple[Dict, asyncio.Task]:
+    """
+    Grant Dataflow worker permissions. Inputs must already be validated (see grant_dataflow_subscription_permissions).
+
+    Returns the result dict (without "iam_propagation_wait") and the
+    pending propagation task covering both grants.
+    """
     try:
         # Get project number for the Compute Engine default service account
-        import subprocess
         result = subprocess.run(
             ["gcloud", "projects", "describe", project_id, "--format=value(projectNumber)"],
             capture_output=True,
@@ -386,92 +631,33 @@ async def grant_dataflow_subscription_permissions(
         project_number = result.stdout.strip()
         compute_sa = f"serviceAccount:{project_number}-compute@developer.gserviceaccount.com"
 
-        logger.info(f"Granting Pub/Sub permissions to Dataflow worker: {compute_sa}")
-
-        # Grant permissions on SUBSCRIPTION
-        subscriber = pubsub_v1.SubscriberClient()
-        subscription_path = subscriber.subscription_path(project_id, subscription_name)
-
-        # Get existing IAM policy for subscription
-        sub_policy = subscriber.get_iam_policy(request={"resource": subscription_path})
+        logger.info("Granting Pub/Sub permissions to Dataflow worker: %s", compute_sa)
 
         # Grant roles/pubsub.editor instead of subscriber for full access including metadata
         # This includes pubsub.subscriptions.get needed for ack deadline retrieval
-        binding_exists = False
-        for binding in sub_policy.bindings:
-            if binding.role == "roles/pubsub.editor":
-                if compute_sa in binding.members:
-                    binding_exists = True
-                    logger.info(f"Compute Engine SA already has Editor role on subscription")
-                else:
-                    binding.members.append(compute_sa)
-                    binding_exists = True
-                break
-
-        if not binding_exists:
-            from google.cloud.pubsub_v1 import types
-            new_binding = types.Binding(
-                role="roles/pubsub.editor",
-                members=[compute_sa]
-            )
-            sub_policy.bindings.append(new_binding)
-
-        # Set the updated policy for subscription
-        subscriber.set_iam_policy(request={"resource": subscription_path, "policy": sub_policy})
-
-        logger.info(f"✓ Granted roles/pubsub.editor to Dataflow worker on subscription")
-        logger.info(f"  - Subscription: {subscription_path}")
+        subscriber = _get_subscriber()
+        subscription_path = subscriber.subscription_path(project_id, subscription_name)
 
-        # Grant permissions on TOPIC (needed to retrieve topic metadata)
-        publisher = pubsub_v1.PublisherClient()
+        # Editor on the topic is needed to retrieve topic metadata
+        publisher = _get_publisher()
         topic_path = publisher.topic_path(project_id, topic_name)
 
-        # Get existing IAM policy for topic
-        topic_policy = publisher.get_iam_policy(request={"resource": topic_path})
-
-        # Add editor role for topic full access
-        editor_binding_exists = False
-        for binding in topic_policy.bindings:
-            if binding.role == "roles/pubsub.editor":
-                if compute_sa in binding.members:
-                    editor_binding_exists = True
-                    logger.info(f"Compute Engine SA already has Editor role on topic")
-                else:
-                    binding.members.append(compute_sa)
-                    editor_binding_exists = True
-                break
-
-        if not editor_binding_exists:
-            from google.cloud.pubsub_v1 import types
-            new_editor_binding = types.Binding(
-                role="roles/pubsub.editor",
-                members=[compute_sa]
-            )
-            topic_policy.bindings.append(new_editor_binding)
-
-        # Set the updated policy for topic
-        publisher.set_iam_policy(request={"resource": topic_path, "policy": topic_policy})
-
-        logger.info(f"✓ Granted roles/pubsub.editor to Dataflow worker on topic")
-        logger.info(f"  - Topic: {topic_path}")
-
-        # Wait for IAM propagation (critical for Dataflow to access Pub/Sub)
-        # Increased to 120 seconds to ensure permissions propagate before Dataflow job starts
-        logger.info(f"⏳ Waiting 120 seconds for IAM propagation...")
-        await asyncio.sleep(120)
-        logger.info(f"✓ IAM propagation complete")
+        # IAM propagation is critical for Dataflow to access Pub/Sub; both
+        # waits run concurrently and finish before the Dataflow job starts
+        sub_propagation = await _grant_role(subscriber, subscription_path, "roles/pubsub.editor", compute_sa)
+        topic_propagation = await _grant_role(publisher, topic_path, "roles/pubsub.editor", compute_sa)
+        propagation = asyncio.create_task(_longest_propagation_wait(sub_propagation, topic_propagation))
 
         return {
             "subscription": subscription_path,
             "topic": topic_path,
             "service_account": compute_sa,
             "roles": ["roles/pubsub.editor on subscription", "roles/pubsub.editor on topic"],
-            "status": "granted",
-            "iam_propagation_wait": 120
-        }
+            "status": "granted"
+        }, propagation
 
     except Exception as e:
-        logger.error(f"Failed to grant Dataflow subscription permissions: {str(e)}")
+        logger.error("Failed to grant Dataflow subscription permissions: %s", e)
         raise
 
 
@@ -482,11 +668,14 @@ async def create_pubsub_resources(
     """
     Create all Pub/Sub resources for the ELT pipeline.
 
-    This is a convenience function that:
+    This is a convenience function that runs these steps as a dependency graph:
     1. Creates the topic
-    2. Creates the subscription
-    3. Grants Dataflow worker permission to consume from subscription
-    4. Grants publisher role to sink service account (if provided)
+    2. Creates the subscription (after 1)
+    3. Grants Dataflow worker permission to consume from subscription (after 2)
+    4. Grants publisher role to sink service account, if provided (after 1)
+
+    Steps 2-3 and step 4 run concurrently, including their IAM propagation
+    waits. All grants have propagated when this returns.
 
     Args:
         project_id: GCP project ID
@@ -501,38 +690,36 @@ async def create_pubsub_resources(
             "permissions": {...} (if sink_service_account provided)
         }
     """
-    # Validate inputs
+    # Validate inputs once; the internal helpers below trust these values
+    # (resource names are the module defaults)
     try:
         project_id = validate_gcp_project_id(project_id)
     except ValidationError as e:
-        logger.error(f"Input validation failed: {str(e)}")
+        logger.error("Input validation failed: %s", e)
         raise ValueError(f"Invalid input: {str(e)}")
 
     try:
-        result = {}
-
-        # Create topic
-        topic_result = await create_topic(project_id)
-        result["topic"] = topic_result
-
-        # Create subscription
-        subscription_result = await create_subscription(project_id)
-        result["subscription"] = subscription_result
-
-        # Grant Dataflow worker permissions to consume from subscription
-        dataflow_perms = await grant_dataflow_subscription_permissions(project_id)
-        result["dataflow_permissions"] = dataflow_perms
+        steps = {
+            "topic": ((), lambda: _create_topic(project_id)),
+            "subscription": (("topic",), lambda: _create_subscription(project_id)),
+            "dataflow_permissions": (
+                ("subscription",),
+                lambda: _granted(_grant_dataflow_subscription_permissions(project_id))
+            ),
+        }
 
-        # Grant permissions if sink service account provided
+        # Grant permissions if sink service account provided (only needs the topic)
         if sink_service_account:
-            permissions_result = await grant_publisher_to_sink(
-                project_id=project_id,
-                sink_service_account=sink_service_account
+            steps["permissions"] = (
+                ("topic",),
+                lambda: _granted(_grant_publisher_to_sink(
+                    project_id=project_id,
+                    sink_service_account=sink_service_account
+                ))
             )
-            result["permissions"] = permissions_result
 
-        return result
+        return await _run_steps(steps)
 
     except Exception as e:
-        logger.error(f"Failed to create Pub/Sub resources: {str(e)}")
+        logger.error("Failed to create Pub/Sub resources: %s", e)
         raise
@@ -2,11 +2,18 @@
 Log sink service.
 Creates and verifies Cloud Logging sinks to Pub/Sub (ELT pattern).
 """
-import subprocess
 import asyncio
 import logging
-from typing import Dict
-from google.cloud import logging as cloud_logging
+import os
+import random
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+from google.api_core.exceptions import Aborted, GoogleAPICallError, NotFound
+from google.cloud import pubsub_v1
+from google.cloud.logging_v2.services.config_service_v2 import ConfigServiceV2Client
+from google.cloud.logging_v2.types import LogExclusion, LogSink
+from services import iam_service
 from utils.validators import (
     validate_gcp_project_id,
     validate_topic_name,
@@ -15,6 +22,51 @@ from utils.validators import (
 
 logger = logging.getLogger(__name__)
 
+# Predefined roles that include pubsub.topics.publish when bound on a topic
+PUBLISH_ROLES = frozenset({"roles/pubsub.publisher", "roles/pubsub.editor", "roles/pubsub.admin"})
+
+# pubsub.googleapis.com/projects/{project}/topics/{topic}
+_PUBSUB_DESTINATION_PATTERN = re.compile(r'^pubsub\.googleapis\.com/projects/([^/]+)/topics/([^/]+)$')
+
+# Set to "1" to skip the propagation wait entirely (e.g. fast CI re-runs)
+SKIP_IAM_PROPAGATION_WAIT_ENV = "GEMINI_SKIP_IAM_PROPAGATION_WAIT"
+
+# Retries while the sink's writer identity is provisioned: 1s, 2s, 4s, 8s plus
+# up to 50% jitter, doubling to at most 30s between attempts
+GRANT_MAX_ATTEMPTS = 5
+GRANT_RETRY_BASE_DELAY = 1.0
+GRANT_RETRY_MAX_DELAY = 30.0
+GRANT_RETRY_JITTER = 0.5
+
+# Seconds a project's sink listing is reused by list_sinks
+SINK_LIST_TTL_SECONDS = 60
+
+# project_id -> (listed_at, sink names); dropped when this module creates or deletes a sink
+_sink_names_cache: Dict[str, Tuple[float, List[str]]] = {}
+
+# Seconds verify_sink trusts what create_sink just wrote instead of re-reading it
+SINK_VERIFY_TTL_SECONDS = 60
+
+# (project_id, sink_name) -> (created_at, verify_sink result); dropped when the sink is deleted
+_created_sinks: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+
+# "config", "publisher" -> shared instance, created on first use
+_clients: Dict[str, object] = {}
+
+
+def _get_config_client() -> ConfigServiceV2Client:
+    """Cloud Logging ConfigServiceV2Client reused across sink operations."""
+    if "config" not in _clients:
+        _clients["config"] = ConfigServiceV2Client()
+    return _clients["config"]
+
+
+def _get_publisher() -> pubsub_v1.PublisherClient:
+    """PublisherClient reused across calls so its connection stays open."""
+    if "publisher" not in _clients:
+        _clients["publisher"] = pubsub_v1.PublisherClient()
+    return _clients["publisher"]
+
 
 async def create_sink(
     gemini_cli_project_id: str,
@@ -73,39 +125,59 @@ async def create_sink(
         logger.info(f"  Filter: {log_filter}")
         logger.info(f"  Exclusion: {exclusion_filter}")
 
-        # Step 1: Check if sink already exists in telemetry project
-        existing_sinks = await list_sinks(telemetry_project_id)
+        # Step 1: Check if sink already exists in telemetry project, and read the
+        # destination topic's IAM policy at the same time. The policy read doubles
+        # as the topic existence check and saves grant_pubsub_publisher a GET.
+        # The delete-or-not decision needs a fresh listing: a sink created since
+        # the cached one (by another process, or in the console) would otherwise
+        # make the create fail with AlreadyExists.
+        _sink_names_cache.pop(telemetry_project_id, None)
+        try:
+            existing_sinks, topic_policy = await asyncio.gather(
+                list_sinks(telemetry_project_id),
+                _get_topic_policy(telemetry_project_id, topic_name)
+            )
+        except NotFound:
+            logger.error(f"Pub/Sub topic {topic_name} not found in telemetry project")
+            raise Exception(f"Pub/Sub topic {topic_name} not found in project {telemetry_project_id}")
+
+        _created_sinks.pop((telemetry_project_id, sink_name), None)
         if sink_name in existing_sinks:
             logger.info(f"Sink '{sink_name}' already exists in telemetry project. Deleting it to ensure clean configuration...")
             await delete_sink(telemetry_project_id, sink_name)
             logger.info("Old sink deleted successfully")
 
-        # Step 2: Create sink using gcloud in the TELEMETRY project
+        # Step 2: Create sink in the TELEMETRY project
         # The sink filters logs from the Gemini CLI project (cross-project routing)
-        # NOTE: Do NOT use --use-partitioned-tables (that's BigQuery-only)
-        # Use --exclusion to filter out diagnostic logs
-        result = subprocess.run(
-            [
-                "gcloud", "logging", "sinks", "create", sink_name,
-                destination,
-                f"--log-filter={log_filter}",
-                f"--exclusion=name=exclude-diagnostic-logs,filter={exclusion_filter}",
-                f"--project={telemetry_project_id}"  # Create sink in telemetry project
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60
+        # NOTE: Do NOT set BigQuery options (use_partitioned_tables) on a Pub/Sub sink
+        # The exclusion filters out diagnostic logs
+        sink = LogSink(
+            name=sink_name,
+            destination=destination,
+            filter=log_filter,
+            exclusions=[LogExclusion(name="exclude-diagnostic-logs", filter=exclusion_filter)]
         )
 
-        if result.returncode != 0:
-            logger.error(f"Sink creation failed: {result.stderr}")
-            raise Exception(f"Failed to create sink: {result.stderr}")
+        try:
+            client = _get_config_client()
+            created = await asyncio.to_thread(
+                client.create_sink,
+                request={
+                    "parent": f"projects/{telemetry_project_id}",  # Create sink in telemetry project
+                    "sink": sink,
+                    "unique_writer_identity": True
+                },
+                timeout=60
+            )
+        except GoogleAPICallError as e:
+            logger.error(f"Sink creation failed: {str(e)}")
+            raise Exception(f"Failed to create sink: {str(e)}")
 
+        _sink_names_cache.pop(telemetry_project_id, None)
         logger.info("Sink created successfully in telemetry project")
 
-        # Extract service account from output
-        # The sink creation returns the service account immediately
-        service_account = await get_sink_service_account(telemetry_project_id, sink_name)
+        # The create response carries the writerIdentity; only describe the sink if it didn't
+        service_account = created.writer_identity or await get_sink_service_account(telemetry_project_id, sink_name)
 
         if not service_account:
             logger.error("Failed to retrieve sink service account - sink may not work!")
@@ -114,7 +186,17 @@ async def create_sink(
         logger.info(f"Sink created with service account: {service_account}")
 
         # Grant Pub/Sub Publisher permissions to the sink's service account
-        await grant_pubsub_publisher(telemetry_project_id, topic_name, service_account)
+        await grant_pubsub_publisher(telemetry_project_id, topic_name, service_account, policy=topic_policy)
+
+        # Everything verify_sink would re-read is known here; let it skip the round-trips
+        _created_sinks[(telemetry_project_id, sink_name)] = (time.monotonic(), {
+            "verified": True,
+            "destination": destination,
+            "destination_type": "pubsub",
+            "writer_identity": service_account,
+            "filter": log_filter,
+            "has_permissions": True
+        })
 
         return {
             "sink_name": sink_name,
@@ -124,14 +206,21 @@ async def create_sink(
             "filter": log_filter
         }
 
-    except subprocess.TimeoutExpired:
-        logger.error("Sink creation timed out")
-        raise Exception("Sink creation timed out")
     except Exception as e:
         logger.error(f"Sink creation failed: {str(e)}")
         raise
 
 
+async def _get_topic_policy(project_id: str, topic_name: str):
+    """Read a topic's IAM policy off the event loop. Raises NotFound if the topic is missing."""
+    publisher = _get_publisher()
+    return await asyncio.to_thread(
+        publisher.get_iam_policy,
+        request={"resource": publisher.topic_path(project_id, topic_name)},
+        timeout=30
+    )
+
+
 async def get_sink_service_account(project_id: str, sink_name: str) -> str:
     """Get the service account associated with a sink."""
     # Validate inputs
@@ -142,31 +231,23 @@ async def get_sink_service_account(project_id: str, sink_name: str) -> str:
         raise ValueError(f"Invalid input: {str(e)}")
 
     try:
-        result = subprocess.run(
-            [
-                "gcloud", "logging", "sinks", "describe", sink_name,
-                f"--project={project_id}",
-                "--format=value(writerIdentity)"
-            ],
-            capture_output=True,
-            text=True,
+        client = _get_config_client()
+        sink = await asyncio.to_thread(
+            client.get_sink,
+            request={"sink_name": f"projects/{project_id}/sinks/{sink_name}"},
             timeout=30
         )
 
-        if result.returncode == 0:
-            service_account = result.stdout.strip()
-            logger.info(f"Sink service account: {service_account}")
-            return service_account
-        else:
-            logger.warning("Could not get sink service account")
-            return ""
+        service_account = sink.writer_identity
+        logger.info(f"Sink service account: {service_account}")
+        return service_account
 
     except Exception as e:
         logger.warning(f"Failed to get sink service account: {str(e)}")
         return ""
 
 
-async def grant_pubsub_publisher(project_id: str, topic_name: str, service_account: str) -> None:
+async def grant_pubsub_publisher(project_id: str, topic_name: str, service_account: str, policy=None) -> None:
     """
     Grant Pub/Sub Publisher permissions to the sink's service account.
 
@@ -174,13 +255,18 @@ async def grant_pubsub_publisher(project_id: str, topic_name: str, service_accou
     The sink creates its own service account (writerIdentity) which needs
     explicit permission to publish to Pub/Sub.
 
-    Retries up to 3 times if the service account doesn't exist yet, as Google-managed
-    service accounts may take time to be provisioned.
+    Retries with jittered exponential backoff (up to GRANT_MAX_ATTEMPTS attempts) if
+    the service account doesn't exist yet, as Google-managed service accounts may
+    take time to be provisioned, or if the policy changed since it was read (etag
+    conflict), re-reading the policy before each retry.
 
     Args:
         project_id: GCP project ID
         topic_name: Pub/Sub topic name
         service_account: Sink service account (writerIdentity)
+        policy: Topic IAM policy the caller has already read (optional). Used for
+            the first attempt instead of reading it again; if it has gone stale
+            the write is retried with a fresh read.
     """
     # Validate inputs
     try:
@@ -197,53 +283,63 @@ async def grant_pubsub_publisher(project_id: str, topic_name: str, service_accou
 
         logger.info(f"Granting Pub/Sub Publisher role to sink service account: {service_account}")
 
+        publisher = _get_publisher()
+        topic_path = publisher.topic_path(project_id, topic_name)
+        member = f"serviceAccount:{service_account}"
+        role = "roles/pubsub.publisher"
+
         # Retry logic for service account provisioning
-        max_retries = 3
-        retry_delay = 20  # seconds
-        last_error = ""
+        max_retries = GRANT_MAX_ATTEMPTS
+        waited = 0.0
 
         for attempt in range(max_retries):
             if attempt > 0:
-                logger.info(f"Retry attempt {attempt + 1}/{max_retries} after {retry_delay}s wait...")
+                retry_delay = min(GRANT_RETRY_MAX_DELAY, GRANT_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                retry_delay *= 1 + random.uniform(0, GRANT_RETRY_JITTER)
+                logger.info(f"Retry attempt {attempt + 1}/{max_retries} after {retry_delay:.1f}s wait...")
                 await asyncio.sleep(retry_delay)
+                waited += retry_delay
+
+            try:
+                # Add IAM binding to Pub/Sub topic (read-modify-write of the topic policy)
+                if policy is None:
+                    policy = await asyncio.to_thread(
+                        publisher.get_iam_policy, request={"resource": topic_path}, timeout=30
+                    )
+
+                binding = next((b for b in policy.bindings if b.role == role), None)
+                if binding is not None and member in binding.members:
+                    # Nothing written by this call; the binding comes from an earlier
+                    # grant, which had its own propagation wait
+                    logger.info("Permission already exists, skipping propagation wait")
+                    return  # Success - exit function
 
-            # Use gcloud to add IAM binding to Pub/Sub topic
-            result = subprocess.run(
-                [
-                    "gcloud", "pubsub", "topics", "add-iam-policy-binding", topic_name,
-                    f"--member=serviceAccount:{service_account}",
-                    "--role=roles/pubsub.publisher",
-                    f"--project={project_id}"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+                if binding is None:
+                    policy.bindings.add(role=role, members=[member])
+                else:
+                    binding.members.append(member)
+
+                await asyncio.to_thread(
+                    publisher.set_iam_policy, request={"resource": topic_path, "policy": policy}, timeout=30
+                )
 
-            # Check if successful
-            if result.returncode == 0:
                 logger.info("✓ Pub/Sub Publisher role granted successfully")
                 logger.info(f"  Service Account: {service_account}")
-                logger.info(f"  Role: roles/pubsub.publisher")
+                logger.info(f"  Role: {role}")
                 logger.info(f"  Topic: {topic_name}")
 
                 # Wait for IAM propagation (critical for sink to work)
-                logger.info("Waiting for IAM propagation (90 seconds)...")
-                await asyncio.sleep(90)
-                logger.info("IAM propagation wait complete")
+                await _wait_for_grant_propagation()
                 return  # Success - exit function
-            else:
-                error_msg = result.stderr.strip()
-                last_error = error_msg
-
-                # Check if permission already exists
-                if "already has" in error_msg.lower() or "already exists" in error_msg.lower():
-                    logger.info("Permission already exists - skipping")
-                    # Still wait for propagation to be safe
-                    logger.info("Waiting for IAM propagation (90 seconds)...")
-                    await asyncio.sleep(90)
-                    logger.info("IAM propagation wait complete")
-                    return  # Success - exit function
+
+            except GoogleAPICallError as e:
+                error_msg = str(e)
+                policy = None  # Re-read on retry; this copy may have been modified
+
+                # The policy changed since it was read (stale etag); retry on a fresh read
+                if isinstance(e, Aborted) and attempt < max_retries - 1:
+                    logger.warning(f"Topic IAM policy changed concurrently (attempt {attempt + 1}/{max_retries})")
+                    continue  # Retry
 
                 # Check if service account doesn't exist yet
                 if "does not exist" in error_msg.lower() and attempt < max_retries - 1:
@@ -251,21 +347,44 @@ async def grant_pubsub_publisher(project_id: str, topic_name: str, service_accou
                     continue  # Retry
                 elif "does not exist" in error_msg.lower():
                     logger.error(f"Service account still doesn't exist after {max_retries} attempts")
-                    raise Exception(f"Failed to grant Pub/Sub permissions: Service account not provisioned after {max_retries * retry_delay}s")
+                    raise Exception(f"Failed to grant Pub/Sub permissions: Service account not provisioned after {waited:.0f}s")
                 else:
                     # Other error - don't retry
                     logger.error(f"Failed to grant permissions: {error_msg}")
                     raise Exception(f"Failed to grant Pub/Sub permissions to sink service account: {error_msg}")
 
-    except subprocess.TimeoutExpired:
-        logger.error("Permission granting timed out")
-        raise Exception("Failed to grant permissions: command timed out")
     except Exception as e:
         logger.error(f"Failed to grant sink permissions: {str(e)}")
         raise
 
 
-async def verify_sink(project_id: str, sink_name: str = "gemini-cli-to-pubsub") -> Dict:
+async def _wait_for_grant_propagation() -> int:
+    """
+    Let a new publisher grant settle for iam_service.IAM_GRANT_SETTLE_SECONDS.
+
+    Returns immediately if SKIP_IAM_PROPAGATION_WAIT_ENV is set to "1".
+
+    Returns:
+        Seconds waited
+    """
+    if os.environ.get(SKIP_IAM_PROPAGATION_WAIT_ENV) == "1":
+        logger.info(f"{SKIP_IAM_PROPAGATION_WAIT_ENV}=1, skipping IAM propagation wait")
+        return 0
+
+    return await iam_service.wait_for_iam_propagation(iam_service.IAM_GRANT_SETTLE_SECONDS)
+
+
+def _parse_pubsub_destination(destination: str) -> Optional[Tuple[str, str]]:
+    """(project_id, topic_name) of a Pub/Sub sink destination, or None for any other destination."""
+    match = _PUBSUB_DESTINATION_PATTERN.match(destination)
+    return (match.group(1), match.group(2)) if match else None
+
+
+async def verify_sink(
+    project_id: str,
+    sink_name: str = "gemini-cli-to-pubsub",
+    cached: Optional[Dict] = None
+) -> Dict:
     """
     Verify that the log sink is properly configured for Pub/Sub (ELT pattern).
 
@@ -275,9 +394,14 @@ async def verify_sink(project_id: str, sink_name: str = "gemini-cli-to-pubsub")
     3. Sink has service account (writerIdentity)
     4. Service account has Pub/Sub Publisher permissions
 
+    A sink this process created and granted within the last
+    SINK_VERIFY_TTL_SECONDS is reported from what create_sink wrote, without
+    reading the sink or the topic policy again.
+
     Args:
         project_id: GCP project ID
         sink_name: Sink name (default: gemini-cli-to-pubsub)
+        cached: Result to return as-is instead of re-reading the sink (optional)
 
     Returns:
         {
@@ -296,32 +420,33 @@ async def verify_sink(project_id: str, sink_name: str = "gemini-cli-to-pubsub")
         logger.error(f"Input validation failed: {str(e)}")
         raise ValueError(f"Invalid input: {str(e)}")
 
+    if cached is None:
+        entry = _created_sinks.get((project_id, sink_name))
+        if entry and time.monotonic() - entry[0] < SINK_VERIFY_TTL_SECONDS:
+            cached = entry[1]
+    if cached is not None:
+        logger.info(f"✓ Sink {sink_name} was just created and granted - skipping re-read")
+        return dict(cached)
+
     try:
         logger.info(f"Verifying sink: {sink_name}")
 
         # Get sink details
-        result = subprocess.run(
-            [
-                "gcloud", "logging", "sinks", "describe", sink_name,
-                f"--project={project_id}",
-                "--format=json"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
-            logger.error(f"Sink not found: {result.stderr}")
+        client = _get_config_client()
+        try:
+            sink = await asyncio.to_thread(
+                client.get_sink,
+                request={"sink_name": f"projects/{project_id}/sinks/{sink_name}"},
+                timeout=30
+            )
+        except NotFound as e:
+            logger.error(f"Sink not found: {str(e)}")
             raise Exception(f"Sink {sink_name} not found")
 
-        import json
-        sink_info = json.loads(result.stdout)
-
         # Verify sink properties
-        destination = sink_info.get("destination", "")
-        writer_identity = sink_info.get("writerIdentity", "")
-        filter_str = sink_info.get("filter", "")
+        destination = sink.destination
+        writer_identity = sink.writer_identity
+        filter_str = sink.filter
 
         # Verify destination is Pub/Sub
         destination_type = "unknown"
@@ -368,7 +493,10 @@ async def verify_service_account_permissions(project_id: str, service_account: s
     """
     Verify that the service account has Pub/Sub Publisher permissions.
 
-    Checks the IAM policy to ensure the sink's service account can publish to Pub/Sub topic.
+    Checks the topic's IAM policy for a binding that lets the sink's service account
+    publish: Pub/Sub Publisher or any role in PUBLISH_ROLES that includes it.
+    (testIamPermissions can't be used here; it only reports the caller's own
+    permissions, not another principal's.)
 
     Args:
         project_id: GCP project ID
@@ -376,7 +504,7 @@ async def verify_service_account_permissions(project_id: str, service_account: s
         destination: Sink destination (pubsub.googleapis.com/projects/.../topics/...)
 
     Returns:
-        True if service account has publisher role, False otherwise
+        True if service account can publish to the topic, False otherwise
     """
     # Validate inputs
     try:
@@ -392,46 +520,36 @@ async def verify_service_account_permissions(project_id: str, service_account: s
         else:
             sa_email = service_account
 
-        # Extract topic name from destination
-        # Format: pubsub.googleapis.com/projects/{project}/topics/{topic}
-        if "pubsub.googleapis.com" in destination:
-            topic_name = destination.split("/topics/")[-1]
-        else:
+        parsed = _parse_pubsub_destination(destination)
+        if parsed is None:
             logger.warning("Not a Pub/Sub destination, skipping permission check")
             return False
+        topic_project_id, topic_name = parsed
 
         logger.info(f"Checking IAM permissions for {sa_email} on topic {topic_name}...")
 
         # Get IAM policy for the Pub/Sub topic
-        result = subprocess.run(
-            [
-                "gcloud", "pubsub", "topics", "get-iam-policy", topic_name,
-                f"--project={project_id}",
-                "--flatten=bindings[].members",
-                f"--filter=bindings.members:serviceAccount:{sa_email}",
-                "--format=value(bindings.role)"
-            ],
-            capture_output=True,
-            text=True,
+        publisher = _get_publisher()
+        policy = await asyncio.to_thread(
+            publisher.get_iam_policy,
+            request={"resource": publisher.topic_path(topic_project_id, topic_name)},
             timeout=30
         )
 
-        if result.returncode == 0:
-            roles = result.stdout.strip().split('\n')
-            roles = [r for r in roles if r]  # Remove empty strings
-
-            # Check if Pub/Sub Publisher role is present
-            has_publisher_role = "roles/pubsub.publisher" in roles
+        member = f"serviceAccount:{sa_email}"
+        publish_role = next(
+            (binding.role for binding in policy.bindings
+             if binding.role in PUBLISH_ROLES and member in binding.members),
+            None
+        )
 
-            if has_publisher_role:
-                logger.info(f"✓ Service account has Pub/Sub Publisher role")
-                return True
-            else:
-                logger.warning(f"✗ Service account missing Pub/Sub Publisher role")
-                logger.warning(f"  Current roles: {roles}")
-                return False
+        if publish_role:
+            logger.info(f"✓ Service account can publish to the topic ({publish_role})")
+            return True
         else:
-            logger.warning(f"Could not verify permissions: {result.stderr}")
+            roles = [binding.role for binding in policy.bindings if member in binding.members]
+            logger.warning(f"✗ Service account missing Pub/Sub Publisher role")
+            logger.warning(f"  Current roles: {roles}")
             return False
 
     except Exception as e:
@@ -439,8 +557,15 @@ async def verify_service_account_permissions(project_id: str, service_account: s
         return False
 
 
+def _list_sink_names(project_id: str) -> List[str]:
+    """Walk every page of the project's sink listing, taking only the names."""
+    client = _get_config_client()
+    pager = client.list_sinks(request={"parent": f"projects/{project_id}"}, timeout=30)
+    return [sink.name for sink in pager]
+
+
 async def list_sinks(project_id: str) -> list:
-    """List all sinks in the project."""
+    """List all sinks in the project, cached for SINK_LIST_TTL_SECONDS."""
     # Validate inputs
     try:
         project_id = validate_gcp_project_id(project_id)
@@ -448,23 +573,14 @@ async def list_sinks(project_id: str) -> list:
         logger.error(f"Input validation failed: {str(e)}")
         raise ValueError(f"Invalid input: {str(e)}")
 
-    try:
-        result = subprocess.run(
-            [
-                "gcloud", "logging", "sinks", "list",
-                f"--project={project_id}",
-                "--format=value(name)"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+    cached = _sink_names_cache.get(project_id)
+    if cached and time.monotonic() - cached[0] < SINK_LIST_TTL_SECONDS:
+        return list(cached[1])
 
-        if result.returncode == 0:
-            sinks = [s.strip() for s in result.stdout.strip().split('\n') if s.strip()]
-            return sinks
-        else:
-            return []
+    try:
+        names = await asyncio.to_thread(_list_sink_names, project_id)
+        _sink_names_cache[project_id] = (time.monotonic(), names)
+        return list(names)
 
     except Exception as e:
         logger.warning(f"Failed to list sinks: {str(e)}")
@@ -483,26 +599,24 @@ async def delete_sink(project_id: str, sink_name: str) -> None:
     try:
         logger.info(f"Deleting sink: {sink_name}")
 
-        result = subprocess.run(
-            [
-                "gcloud", "logging", "sinks", "delete", sink_name,
-                f"--project={project_id}",
-                "--quiet"  # Skip confirmation prompt
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
+        _sink_names_cache.pop(project_id, None)
+        _created_sinks.pop((project_id, sink_name), None)
+        client = _get_config_client()
+        try:
+            await asyncio.to_thread(
+                client.delete_sink,
+                request={"sink_name": f"projects/{project_id}/sinks/{sink_name}"},
+                timeout=30
+            )
+        except NotFound:
             # If sink doesn't exist, that's fine
-            if "not found" in result.stderr.lower():
-                logger.info(f"Sink {sink_name} does not exist (already deleted)")
-            else:
-                logger.error(f"Failed to delete sink: {result.stderr}")
-                raise Exception(f"Failed to delete sink: {result.stderr}")
-        else:
-            logger.info(f"Sink {sink_name} deleted successfully")
+            logger.info(f"Sink {sink_name} does not exist (already deleted)")
+            return
+        except GoogleAPICallError as e:
+            logger.error(f"Failed to delete sink: {str(e)}")
+            raise Exception(f"Failed to delete sink: {str(e)}")
+
+        logger.info(f"Sink {sink_name} deleted successfully")
 
     except Exception as e:
         logger.error(f"Failed to delete sink: {str(e)}")
@@ -2,17 +2,51 @@
 Telemetry configuration service.
 Configures Gemini CLI telemetry settings via settings.json file.
 """
+import asyncio
+import copy
 import json
 import os
+import re
+import shutil
 import logging
-from typing import Dict
+from typing import Dict, List, Tuple
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Path to Gemini CLI settings file
 GEMINI_SETTINGS_PATH = Path.home() / ".gemini" / "settings.json"
 
+# settings path -> ((st_mtime_ns, st_size), parsed settings) as last read or written;
+# reused until the file's mtime or size changes
+_settings_cache: Dict[Path, Tuple[Tuple[int, int], Dict]] = {}
+
+# $SHELL -> (shell name, profile file), resolved once per process
+_profile_file_cache: Dict[str, Tuple[str, Path]] = {}
+
+# Serializes configure_telemetry's read-modify-write of the settings and profile files
+_configure_lock = asyncio.Lock()
+
+# Every environment variable this service manages in settings.json and the shell profile
+_TELEMETRY_ENV_VARS = ("GOOGLE_CLOUD_PROJECT", "OTLP_GOOGLE_CLOUD_PROJECT", "GOOGLE_CLOUD_LOCATION")
+
+# Characters that keep their special meaning inside a double-quoted shell string
+_DOUBLE_QUOTE_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "$": "\\$", "`": "\\`"})
+
+# Markers delimiting the block this service owns in the shell profile
+_PROFILE_MARKER_START = "# >>> Gemini CLI Telemetry Configuration >>>"
+_PROFILE_MARKER_END = "# <<< Gemini CLI Telemetry Configuration <<<"
+
+# Matches a previously written block and its trailing newline, plus the blank line
+# _update_profile_file adds before it (a newline at the start of the file or right
+# after another newline). The newline ending the line before the block is kept.
+_PROFILE_BLOCK_RE = re.compile(
+    r"(?:(?:^|(?<=\n))\n)?" + re.escape(_PROFILE_MARKER_START) + r".*?" + re.escape(_PROFILE_MARKER_END) + r"\n?",
+    re.DOTALL
+)
+
 
 async def configure_telemetry(
     log_prompts: bool,
@@ -39,41 +73,57 @@ async def configure_telemetry(
         if auth_method == "vertex-ai" and not gemini_region:
             raise ValueError("Gemini region is required for Vertex AI authentication")
 
-        logger.info(f"Configuring Gemini CLI telemetry (log_prompts={log_prompts}, inference={inference_project_id}, telemetry={telemetry_project_id}, auth={auth_method}, region={gemini_region})...")
-
-        # Step 1: Read current settings
-        settings = await read_gemini_settings()
-
-        # Step 2: Update telemetry configuration
-        if "telemetry" not in settings:
-            settings["telemetry"] = {}
-
-        settings["telemetry"]["enabled"] = True
-        settings["telemetry"]["target"] = "gcp"
-
-        # Explicitly set logPrompts (camelCase, not snake_case!)
-        # Default is true, so we must explicitly set to false to disable prompt logging
-        settings["telemetry"]["logPrompts"] = log_prompts
-
-        # Step 3: Configure environment variables in settings.json
-        await configure_environment_variables_in_settings(
-            settings,
-            inference_project_id,
-            telemetry_project_id,
-            auth_method,
-            gemini_region
+        logger.info(
+            "Configuring Gemini CLI telemetry (log_prompts=%s, inference=%s, telemetry=%s, auth=%s, region=%s)...",
+            log_prompts, inference_project_id, telemetry_project_id, auth_method, gemini_region
         )
 
-        # Step 4: Write updated settings back
-        await write_gemini_settings(settings)
-
-        # Step 5: Configure environment variables in shell profile
-        shell_result = await configure_environment_variables_in_shell(
-            inference_project_id,
-            telemetry_project_id,
-            auth_method,
-            gemini_region
-        )
+        # Steps 1-5 read, modify and write settings.json and the shell profile, so
+        # concurrent calls (e.g. a double-clicked Save) run one at a time. A repeated
+        # identical request then finds nothing to change and skips its writes.
+        async with _configure_lock:
+            # Step 1: Read current settings
+            settings = await read_gemini_settings()
+            original_settings = copy.deepcopy(settings)
+
+            # Step 2: Update telemetry configuration
+            telemetry = settings.setdefault("telemetry", {})
+            telemetry["enabled"] = True
+            telemetry["target"] = "gcp"
+
+            # Explicitly set logPrompts (camelCase, not snake_case!)
+            # Default is true, so we must explicitly set to false to disable prompt logging
+            telemetry["logPrompts"] = log_prompts
+
+            # Step 3: Configure environment variables in settings.json
+            configure_environment_variables_in_settings(
+                settings,
+                inference_project_id,
+                telemetry_project_id,
+                auth_method,
+                gemini_region
+            )
+
+            # Steps 4-5: Write updated settings back and configure environment variables
+            # in the shell profile. They touch different files, so run them concurrently,
+            # but let both finish before releasing the lock, even if one fails.
+            shell_step = configure_environment_variables_in_shell(
+                inference_project_id,
+                telemetry_project_id,
+                auth_method,
+                gemini_region
+            )
+            if settings == original_settings:
+                # Re-submitting the same configuration: nothing to write
+                logger.info("settings.json already up to date, skipping write")
+                shell_result = await shell_step
+            else:
+                write_result, shell_result = await asyncio.gather(
+                    write_gemini_settings(settings), shell_step, return_exceptions=True
+                )
+                for outcome in (write_result, shell_result):
+                    if isinstance(outcome, BaseException):
+                        raise outcome
 
         logger.info("Telemetry configured successfully")
         return {
@@ -85,11 +135,11 @@ async def configure_telemetry(
         }
 
     except Exception as e:
-        logger.error(f"Telemetry configuration failed: {str(e)}")
+        logger.error("Telemetry configuration failed: %s", e)
         raise
 
 
-async def configure_environment_variables_in_settings(
+def configure_environment_variables_in_settings(
     settings: Dict,
     inference_project_id: str,
     telemetry_project_id: str,
@@ -107,37 +157,24 @@ async def configure_environment_variables_in_settings(
         gemini_region: Region for Gemini API calls (required for Vertex AI headless mode)
     """
     try:
-        if "env" not in settings:
-            settings["env"] = {}
-
-        # Handle case where inference_project_id is None or empty (use telemetry_project_id for both)
-        if not inference_project_id:
-            inference_project_id = telemetry_project_id
-
-        # Logic: If same project, set only GOOGLE_CLOUD_PROJECT
-        #        If different projects, set BOTH variables
-        if inference_project_id == telemetry_project_id:
-            # Same project: only GOOGLE_CLOUD_PROJECT
-            settings["env"]["GOOGLE_CLOUD_PROJECT"] = telemetry_project_id
-            # Remove OTLP_GOOGLE_CLOUD_PROJECT if it exists
-            settings["env"].pop("OTLP_GOOGLE_CLOUD_PROJECT", None)
-            logger.info(f"Using same project for inference and telemetry: {telemetry_project_id}")
-        else:
-            # Different projects: set BOTH variables
-            settings["env"]["GOOGLE_CLOUD_PROJECT"] = inference_project_id
-            settings["env"]["OTLP_GOOGLE_CLOUD_PROJECT"] = telemetry_project_id
-            logger.info(f"Using different projects - inference: {inference_project_id}, telemetry: {telemetry_project_id}")
-
-        # CRITICAL: For Vertex AI, set GOOGLE_CLOUD_LOCATION (required for headless mode)
-        if auth_method == "vertex-ai" and gemini_region:
-            settings["env"]["GOOGLE_CLOUD_LOCATION"] = gemini_region
-            logger.info(f"Set GOOGLE_CLOUD_LOCATION={gemini_region} for Vertex AI headless mode")
+        env = settings.setdefault("env", {})
+        env_vars = _telemetry_env_vars(inference_project_id, telemetry_project_id, auth_method, gemini_region)
+
+        env.update(env_vars)
+        # Remove variables left over from a previous setup (different projects, Vertex AI)
+        for name in _TELEMETRY_ENV_VARS:
+            if name not in env_vars:
+                env.pop(name, None)
+
+        if "OTLP_GOOGLE_CLOUD_PROJECT" in env_vars:
+            logger.info("Using different projects - inference: %s, telemetry: %s", env_vars["GOOGLE_CLOUD_PROJECT"], telemetry_project_id)
         else:
-            # Remove GOOGLE_CLOUD_LOCATION if switching from Vertex AI to OAuth
-            settings["env"].pop("GOOGLE_CLOUD_LOCATION", None)
+            logger.info("Using same project for inference and telemetry: %s", telemetry_project_id)
+        if "GOOGLE_CLOUD_LOCATION" in env_vars:
+            logger.info("Set GOOGLE_CLOUD_LOCATION=%s for Vertex AI headless mode", gemini_region)
 
     except Exception as e:
-        logger.error(f"Failed to configure environment variables in settings: {str(e)}")
+        logger.error("Failed to configure environment variables in settings: %s", e)
         raise
 
 
@@ -160,95 +197,33 @@ async def configure_environment_variables_in_shell(
         Dict with shell configuration status
     """
     try:
-        # Step 1: Detect user's shell
+        # Steps 1-2: Detect user's shell and its profile file (cached after the first call)
         shell_path = os.environ.get("SHELL", "")
-        shell_name = Path(shell_path).name if shell_path else "bash"
-
-        # Step 2: Determine profile file based on shell
-        profile_file = None
-        home = Path.home()
-
-        if "zsh" in shell_name:
-            profile_file = home / ".zshrc"
-        elif "bash" in shell_name:
-            # Check for .bashrc first, then .bash_profile
-            bashrc = home / ".bashrc"
-            bash_profile = home / ".bash_profile"
-            profile_file = bashrc if bashrc.exists() else bash_profile
-        else:
-            # Default to .bashrc for unknown shells
-            profile_file = home / ".bashrc"
+        if shell_path not in _profile_file_cache:
+            _profile_file_cache[shell_path] = await asyncio.to_thread(_resolve_profile_file, shell_path)
+        shell_name, profile_file = _profile_file_cache[shell_path]
 
-        logger.info(f"Detected shell: {shell_name}, using profile: {profile_file}")
+        logger.info("Detected shell: %s, using profile: %s", shell_name, profile_file)
 
         # Step 3: Prepare export statements
-        export_lines = []
-        marker_start = "# >>> Gemini CLI Telemetry Configuration >>>"
-        marker_end = "# <<< Gemini CLI Telemetry Configuration <<<"
+        env_vars = _telemetry_env_vars(inference_project_id, telemetry_project_id, auth_method, gemini_region)
+        export_lines = [
+            f'export {name}="{value.translate(_DOUBLE_QUOTE_ESCAPES)}"' for name, value in env_vars.items()
+        ]
 
-        # Handle case where inference_project_id is None or empty (use telemetry_project_id for both)
-        if not inference_project_id:
-            inference_project_id = telemetry_project_id
+        # Steps 4-6: Replace the configuration block in a single worker-thread hop
+        await asyncio.to_thread(_update_profile_file, profile_file, export_lines)
 
-        if inference_project_id == telemetry_project_id:
-            # Same project: only GOOGLE_CLOUD_PROJECT
-            export_lines.append(f'export GOOGLE_CLOUD_PROJECT="{telemetry_project_id}"')
-        else:
-            # Different projects: both variables
-            export_lines.append(f'export GOOGLE_CLOUD_PROJECT="{inference_project_id}"')
-            export_lines.append(f'export OTLP_GOOGLE_CLOUD_PROJECT="{telemetry_project_id}"')
-
-        # CRITICAL: For Vertex AI, add GOOGLE_CLOUD_LOCATION (required for headless mode)
-        if auth_method == "vertex-ai" and gemini_region:
-            export_lines.append(f'export GOOGLE_CLOUD_LOCATION="{gemini_region}"')
-
-        # Step 4: Read existing profile content
-        if profile_file.exists():
-            with open(profile_file, 'r') as f:
-                profile_content = f.read()
-        else:
-            profile_content = ""
-            logger.info(f"Profile file {profile_file} does not exist, will create it")
-
-        # Step 5: Remove old Gemini CLI configuration block if it exists
-        if marker_start in profile_content:
-            # Find and remove old block
-            start_idx = profile_content.find(marker_start)
-            end_idx = profile_content.find(marker_end)
-            if end_idx != -1:
-                # Remove old block (including the end marker line)
-                end_of_line = profile_content.find('\n', end_idx)
-                if end_of_line != -1:
-                    profile_content = profile_content[:start_idx] + profile_content[end_of_line + 1:]
-                else:
-                    profile_content = profile_content[:start_idx]
-            logger.info("Removed existing Gemini CLI configuration block")
-
-        # Step 6: Append new configuration block
-        new_block = "\n" + marker_start + "\n"
-        new_block += "\n".join(export_lines) + "\n"
-        new_block += marker_end + "\n"
-
-        # Ensure there's a newline at the end if content exists
-        if profile_content and not profile_content.endswith('\n'):
-            profile_content += '\n'
-
-        profile_content += new_block
-
-        # Step 7: Write updated profile
-        with open(profile_file, 'w') as f:
-            f.write(profile_content)
-
-        logger.info(f"Successfully wrote environment variables to {profile_file}")
+        logger.info("Successfully wrote environment variables to %s", profile_file)
 
         return {
             "profile_file": str(profile_file),
             "shell": shell_name,
-            "variables_set": list(settings_key for settings_key in ["GOOGLE_CLOUD_PROJECT", "OTLP_GOOGLE_CLOUD_PROJECT"] if any(settings_key in line for line in export_lines))
+            "variables_set": list(env_vars)
         }
 
     except Exception as e:
-        logger.error(f"Failed to configure environment variables in shell profile: {str(e)}")
+        logger.error("Failed to configure environment variables in shell profile: %s", e)
         # Don't raise - shell profile configuration is optional, settings.json is the primary method
         return {
             "profile_file": None,
@@ -257,52 +232,191 @@ async def configure_environment_variables_in_shell(
         }
 
 
-async def read_gemini_settings() -> Dict:
-    """Read Gemini CLI settings from settings.json."""
+def _telemetry_env_vars(
+    inference_project_id: str,
+    telemetry_project_id: str,
+    auth_method: str,
+    gemini_region: str
+) -> Dict[str, str]:
+    """Environment variables Gemini CLI needs for this setup, shared by settings.json and the shell profile."""
+    # Handle case where inference_project_id is None or empty (use telemetry_project_id for both)
+    if not inference_project_id:
+        inference_project_id = telemetry_project_id
+
+    # Logic: If same project, set only GOOGLE_CLOUD_PROJECT
+    #        If different projects, set BOTH variables
+    env_vars = {"GOOGLE_CLOUD_PROJECT": inference_project_id}
+    if inference_project_id != telemetry_project_id:
+        env_vars["OTLP_GOOGLE_CLOUD_PROJECT"] = telemetry_project_id
+
+    # CRITICAL: For Vertex AI, set GOOGLE_CLOUD_LOCATION (required for headless mode)
+    if auth_method == "vertex-ai" and gemini_region:
+        env_vars["GOOGLE_CLOUD_LOCATION"] = gemini_region
+
+    return env_vars
+
+
+def _resolve_profile_file(shell_path: str) -> Tuple[str, Path]:
+    """Shell name and profile file to edit for the given $SHELL. Blocking."""
+    shell_name = Path(shell_path).name if shell_path else "bash"
+    home = Path.home()
+
+    if "zsh" in shell_name:
+        profile_file = home / ".zshrc"
+    elif "bash" in shell_name:
+        # Check for .bashrc first, then .bash_profile
+        bashrc = home / ".bashrc"
+        bash_profile = home / ".bash_profile"
+        profile_file = bashrc if bashrc.exists() else bash_profile
+    else:
+        # Default to .bashrc for unknown shells
+        profile_file = home / ".bashrc"
+
+    return shell_name, profile_file
+
+
+def _update_profile_file(profile_file: Path, export_lines: List[str]) -> None:
+    """Replace the Gemini CLI block in the shell profile with export_lines. Blocking."""
+    # Read existing profile content
     try:
-        if not GEMINI_SETTINGS_PATH.exists():
-            logger.warning(f"Settings file not found at {GEMINI_SETTINGS_PATH}")
-            return {}
+        with open(profile_file, 'r') as f:
+            original_content = f.read()
+    except FileNotFoundError:
+        logger.info("Profile file %s does not exist, will create it", profile_file)
+        original_content = None
+    profile_content = original_content or ""
+
+    # Remove old Gemini CLI configuration block if it exists
+    profile_content, removed = _PROFILE_BLOCK_RE.subn('', profile_content, count=1)
+    if removed:
+        logger.info("Removed existing Gemini CLI configuration block")
+
+    # Append new configuration block
+    new_block = "\n" + "\n".join([_PROFILE_MARKER_START, *export_lines, _PROFILE_MARKER_END]) + "\n"
+
+    # Ensure there's a newline at the end if content exists
+    if profile_content and not profile_content.endswith('\n'):
+        profile_content += '\n'
+
+    profile_content += new_block
+
+    if profile_content == original_content:
+        logger.info("%s already up to date, skipping write", profile_file)
+        return
+
+    # Write a temp file next to the profile and swap it in, so a crash never leaves
+    # the profile truncated. Resolve symlinks first to keep dotfile-manager links intact.
+    target = os.path.realpath(profile_file)
+    tmp_file = target + ".tmp"
+    with open(tmp_file, 'w') as f:
+        f.write(profile_content)
+    try:
+        shutil.copymode(target, tmp_file)
+    except FileNotFoundError:
+        pass
+    os.replace(tmp_file, target)
+
+
+def _parse_settings(raw) -> Dict:
+    """Parse settings.json content (bytes or str). Raises json.JSONDecodeError on bad JSON."""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(raw)
+
+
+def _load_settings() -> Dict:
+    """
+    Parsed settings.json, or {} if it doesn't exist. Blocking.
+
+    The parsed settings are cached against the file's mtime and size, so
+    repeated reads of an unchanged file skip the open and JSON parse. The
+    returned dict is shared with the cache and must not be modified.
+    """
+    try:
+        stat = GEMINI_SETTINGS_PATH.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _settings_cache.get(GEMINI_SETTINGS_PATH)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        with open(GEMINI_SETTINGS_PATH, 'rb') as f:
+            settings = _parse_settings(f.read())
+    except FileNotFoundError:
+        logger.warning("Settings file not found at %s", GEMINI_SETTINGS_PATH)
+        return {}
+
+    _settings_cache[GEMINI_SETTINGS_PATH] = (version, settings)
+    logger.info("Successfully read settings from %s", GEMINI_SETTINGS_PATH)
+    return settings
+
 
-        with open(GEMINI_SETTINGS_PATH, 'r') as f:
-            settings = json.load(f)
+def _read_settings_file() -> Dict:
+    """Read settings.json into a copy the caller may modify. Blocking."""
+    return copy.deepcopy(_load_settings())
 
-        logger.info(f"Successfully read settings from {GEMINI_SETTINGS_PATH}")
-        return settings
+
+def _read_telemetry_config() -> Dict:
+    """Copy of just the telemetry section of settings.json. Blocking."""
+    return copy.deepcopy(_load_settings().get("telemetry", {}))
+
+
+def _write_settings_file(settings: Dict) -> None:
+    """Write settings.json, creating ~/.gemini if needed. Blocking."""
+    # Ensure directory exists
+    GEMINI_SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write with pretty formatting to a temp file and swap it in, so readers
+    # (including the Gemini CLI itself) never see a truncated settings.json.
+    # As with the shell profile, symlinks are resolved first and the mode is kept.
+    content = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    target = os.path.realpath(GEMINI_SETTINGS_PATH)
+    tmp_file = target + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(content)
+    try:
+        shutil.copymode(target, tmp_file)
+    except FileNotFoundError:
+        pass
+    os.replace(tmp_file, target)
+
+    # What we just wrote is what the next read would parse
+    stat = GEMINI_SETTINGS_PATH.stat()
+    _settings_cache[GEMINI_SETTINGS_PATH] = ((stat.st_mtime_ns, stat.st_size), copy.deepcopy(settings))
+
+
+async def read_gemini_settings() -> Dict:
+    """Read Gemini CLI settings from settings.json."""
+    try:
+        # File I/O runs in a worker thread so slow home directories don't stall the event loop
+        return await asyncio.to_thread(_read_settings_file)
 
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse settings.json: {str(e)}")
+        logger.error("Failed to parse settings.json: %s", e)
         raise Exception(f"Invalid JSON in settings file: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to read settings: {str(e)}")
+        logger.error("Failed to read settings: %s", e)
         raise
 
 
 async def write_gemini_settings(settings: Dict) -> None:
     """Write Gemini CLI settings to settings.json."""
     try:
-        # Ensure directory exists
-        GEMINI_SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write with pretty formatting
-        with open(GEMINI_SETTINGS_PATH, 'w') as f:
-            json.dump(settings, f, indent=2)
+        await asyncio.to_thread(_write_settings_file, settings)
 
-        logger.info(f"Successfully wrote settings to {GEMINI_SETTINGS_PATH}")
+        logger.info("Successfully wrote settings to %s", GEMINI_SETTINGS_PATH)
 
     except Exception as e:
-        logger.error(f"Failed to write settings: {str(e)}")
+        logger.error("Failed to write settings: %s", e)
         raise
 
 
 async def get_telemetry_config() -> Dict:
     """Get current telemetry configuration."""
     try:
-        settings = await read_gemini_settings()
-        return settings.get("telemetry", {})
+        # Only the telemetry section is copied out of the cached settings
+        return await asyncio.to_thread(_read_telemetry_config)
 
     except Exception as e:
-        logger.error(f"Failed to get telemetry config: {str(e)}")
+        logger.error("Failed to get telemetry config: %s", e)
         return {}
 
 
@@ -313,5 +427,5 @@ async def verify_telemetry_enabled() -> bool:
         return config.get("enabled", False)
 
     except Exception as e:
-        logger.error(f"Failed to verify telemetry: {str(e)}")
+        logger.error("Failed to verify telemetry: %s", e)
         return False
@@ -2,17 +2,130 @@
 End-to-end verification service.
 Verifies complete data flow from Gemini CLI to BigQuery.
 """
-import subprocess
 import asyncio
+import concurrent.futures
 import uuid
 import logging
 import os
-from typing import Dict
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
 from google.cloud import bigquery
 from google.cloud import logging as cloud_logging
+from utils.validators import (
+    validate_gcp_project_id,
+    validate_dataset_name,
+    ValidationError
+)
 
 logger = logging.getLogger(__name__)
 
+# Polling for data to show up in Cloud Logging / BigQuery: start checking quickly,
+# then back off so a slow pipeline isn't hammered with queries
+POLL_INITIAL_INTERVAL = 2  # seconds
+POLL_MAX_INTERVAL = 15  # seconds
+POLL_BACKOFF_FACTOR = 1.5
+# poll_bigquery_for_data runs a billed query per check, so it starts slower and backs
+# off further (about 12 checks over the default 5 minutes), with up to 20% jitter
+BIGQUERY_POLL_INITIAL_INTERVAL = 5  # seconds
+BIGQUERY_POLL_MAX_INTERVAL = 45  # seconds
+BIGQUERY_POLL_JITTER = 0.2
+LOG_PROPAGATION_TIMEOUT = 30  # seconds to wait for test prompt logs in Cloud Logging
+GEMINI_PROMPT_TIMEOUT = 60  # seconds per gemini CLI test prompt
+GEMINI_TEST_MODEL = "gemini-2.5-flash"  # fast model for verification prompts
+ADC_CREDENTIALS_PATH = os.path.expanduser("~/.config/gcloud/application_default_credentials.json")
+BIGQUERY_QUERY_TIMEOUT = 30  # seconds to wait for a verification query job
+
+# Cloud Logging filters; {cutoff} comes from _logging_cutoff()
+GEMINI_CLI_LOG_FILTER = 'logName="projects/{project_id}/logs/gemini_cli" AND timestamp>="{cutoff}"'
+# The query language gives OR precedence over AND; the parentheses make the grouping explicit
+SINK_AUDIT_LOG_FILTER = (
+    'logName:"logs/cloudaudit.googleapis.com" '
+    'AND protoPayload.serviceName="logging.googleapis.com" '
+    'AND (protoPayload.methodName:"google.logging.v2.ConfigServiceV2.CreateSink" '
+    'OR protoPayload.methodName:"google.logging.v2.ConfigServiceV2.UpdateSink") '
+    'AND protoPayload.status.code>0 '
+    'AND timestamp>="{cutoff}"'
+)
+
+# ("bigquery" | "logging", project_id) -> shared client, created on first use
+_clients: Dict[Tuple[str, str], object] = {}
+
+
+def _get_bigquery_client(project_id: str) -> bigquery.Client:
+    """BigQuery client for project_id, reused so auth and connections are set up once."""
+    key = ("bigquery", project_id)
+    if key not in _clients:
+        _clients[key] = bigquery.Client(project=project_id)
+    return _clients[key]
+
+
+def _get_logging_client(project_id: str) -> cloud_logging.Client:
+    """Cloud Logging client for project_id, reused across polls and checks."""
+    key = ("logging", project_id)
+    if key not in _clients:
+        _clients[key] = cloud_logging.Client(project=project_id)
+    return _clients[key]
+
+
+def _wait_for_query(client: bigquery.Client, query: str, job_config=None, timeout: float = BIGQUERY_QUERY_TIMEOUT):
+    """
+    Start a query job and wait for its rows, at most timeout seconds (capped at
+    BIGQUERY_QUERY_TIMEOUT, and at least 1s).
+    """
+    timeout = max(1.0, min(BIGQUERY_QUERY_TIMEOUT, timeout))
+    query_job = client.query(query, job_config=job_config)
+    try:
+        return query_job.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        logger.warning(
+            f"⚠ BigQuery job {query_job.job_id} did not finish within {timeout:.0f}s"
+        )
+        raise
+
+
+async def _query_rows(client: bigquery.Client, query: str, job_config=None, timeout: float = BIGQUERY_QUERY_TIMEOUT) -> list:
+    """Run a BigQuery query and fetch its rows in a worker thread, off the event loop."""
+    return await asyncio.to_thread(
+        lambda: list(_wait_for_query(client, query, job_config, timeout))
+    )
+
+
+async def _query_first_row(client: bigquery.Client, query: str, job_config=None, timeout: float = BIGQUERY_QUERY_TIMEOUT):
+    """Like _query_rows, but stop at the first row (or None) for single-row aggregates."""
+    return await asyncio.to_thread(
+        lambda: next(iter(_wait_for_query(client, query, job_config, timeout)), None)
+    )
+
+
+async def _capture_exception(coro):
+    """Await coro, returning any exception it raises instead of propagating it."""
+    try:
+        return await coro
+    except Exception as e:
+        return e
+
+
+async def _gather_fail_fast(*coros) -> list:
+    """
+    Like asyncio.gather, but as soon as one check raises, cancel the others and
+    re-raise once they have unwound, instead of waiting for them to finish. Wrap
+    a check in _capture_exception if its failure shouldn't stop the rest.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+        return [task.result() for task in tasks]
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let cancelled checks run their cleanup and retrieve their exceptions
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 async def verify_end_to_end(
     project_id: str,
@@ -26,8 +139,9 @@ async def verify_end_to_end(
     This verification uses a pragmatic approach:
     1. Send test Gemini CLI prompts
     2. Get the latest gemini_cli log timestamp from Cloud Logging
-    3. Wait 60-90 seconds for pipeline processing (Logging → Pub/Sub → Dataflow → BigQuery)
-    4. Check if logs from that time period made it to BigQuery
+    3. Poll BigQuery (with backoff) until logs from that time period arrive
+       (Logging → Pub/Sub → Dataflow → BigQuery) or max_wait_seconds pass
+    4. Report the observed pipeline latency
     5. Query analytics view to verify data transformation
 
     This approach avoids false negatives from checking Pub/Sub messages
@@ -44,7 +158,6 @@ async def verify_end_to_end(
         {
             "success": bool,
             "test_id": str,
-            "cloud_logging_count": int,
             "cloud_logging_latest_timestamp": str,
             "bigquery_matched_count": int,
             "analytics_view_count": int,
@@ -52,6 +165,14 @@ async def verify_end_to_end(
             "message": str
         }
     """
+    # Validate inputs: table IDs can't be query parameters, so they are interpolated into SQL
+    try:
+        project_id = validate_gcp_project_id(project_id)
+        dataset_name = validate_dataset_name(dataset_name)
+    except ValidationError as e:
+        logger.error(f"Input validation failed: {str(e)}")
+        raise ValueError(f"Invalid input: {str(e)}")
+
     try:
         test_id = str(uuid.uuid4())
         logger.info(f"Starting E2E verification (timestamp comparison method) with test ID: {test_id}")
@@ -60,13 +181,14 @@ async def verify_end_to_end(
         logger.info("Step 1/4: Sending test prompts...")
         await _send_test_prompts(test_id)
 
-        # Wait for logs to propagate to Cloud Logging
-        logger.info("Waiting 30s for logs to propagate to Cloud Logging...")
-        await asyncio.sleep(30)
-
-        # Step 2: Get latest gemini_cli log from Cloud Logging
-        logger.info("Step 2/4: Getting latest gemini_cli log from Cloud Logging...")
-        cloud_logging_result = await _get_latest_gemini_cli_log(project_id)
+        # Step 2: Get latest gemini_cli log from Cloud Logging, polling until the
+        # test prompts' logs have propagated
+        logger.info("Step 2/4: Waiting for gemini_cli logs in Cloud Logging...")
+        cloud_logging_result, _ = await _poll_until(
+            lambda remaining: _get_latest_gemini_cli_log(project_id),
+            lambda result: result["found"],
+            LOG_PROPAGATION_TIMEOUT
+        )
 
         if not cloud_logging_result["found"]:
             return {
@@ -76,29 +198,30 @@ async def verify_end_to_end(
             }
 
         latest_log_timestamp = cloud_logging_result["latest_timestamp"]
-        log_count = cloud_logging_result["count"]
 
-        logger.info(f"Found {log_count} gemini_cli logs in Cloud Logging")
         logger.info(f"Latest log timestamp: {latest_log_timestamp}")
 
-        # Step 3: Wait for pipeline to process (Logging → Pub/Sub → Dataflow → BigQuery)
-        pipeline_wait_time = 90  # 90 seconds for full pipeline processing
-        logger.info(f"Step 3/4: Waiting {pipeline_wait_time}s for pipeline to process logs...")
+        # Steps 3-4: Poll BigQuery until logs from that time arrive
+        # (Cloud Logging → Pub/Sub → Dataflow → BigQuery)
+        logger.info(f"Steps 3-4/4: Waiting up to {max_wait_seconds}s for logs to reach BigQuery...")
         logger.info("  (Cloud Logging → Pub/Sub → Dataflow → BigQuery)")
 
-        await asyncio.sleep(pipeline_wait_time)
-
-        # Step 4: Check if logs made it to BigQuery
-        logger.info("Step 4/4: Verifying logs reached BigQuery...")
-        bigquery_result = await _check_bigquery_for_timestamp(
-            project_id, dataset_name, latest_log_timestamp
+        bigquery_result, pipeline_latency = await _poll_until(
+            lambda remaining: _check_bigquery_for_timestamp(
+                project_id, dataset_name, latest_log_timestamp, test_id, timeout=remaining
+            ),
+            lambda result: result.get("matched_count", 0) > 0 or result.get("test_id_count", 0) > 0,
+            max_wait_seconds
         )
+        pipeline_latency_seconds = int(pipeline_latency)
 
         matched_count = bigquery_result.get("matched_count", 0)
         total_recent_count = bigquery_result.get("total_recent_count", 0)
+        test_id_count = bigquery_result.get("test_id_count", 0)
 
         logger.info(f"BigQuery results:")
         logger.info(f"  - Logs matching timestamp: {matched_count}")
+        logger.info(f"  - Logs tagged with test ID: {test_id_count}")
         logger.info(f"  - Total recent logs (last 10 min): {total_recent_count}")
 
         # Step 5: Query analytics view
@@ -113,37 +236,38 @@ async def verify_end_to_end(
 
         if pipeline_working:
             logger.info("✓ ELT Pipeline end-to-end verification PASSED")
-            logger.info(f"  - Cloud Logging: {log_count} gemini_cli logs")
+            logger.info(f"  - Cloud Logging: latest gemini_cli log at {latest_log_timestamp}")
             logger.info(f"  - BigQuery: {total_recent_count} recent rows")
             logger.info(f"  - Analytics View: {analytics_count} rows")
-            logger.info(f"  - Pipeline latency: ~{pipeline_wait_time}s")
+            logger.info(f"  - Pipeline latency: ~{pipeline_latency_seconds}s")
 
             return {
                 "success": True,
                 "test_id": test_id,
-                "cloud_logging_count": log_count,
                 "cloud_logging_latest_timestamp": latest_log_timestamp,
                 "bigquery_matched_count": matched_count,
                 "bigquery_recent_count": total_recent_count,
+                "bigquery_test_id_count": test_id_count,
                 "analytics_view_count": analytics_count,
-                "pipeline_latency_seconds": pipeline_wait_time,
+                "pipeline_latency_seconds": pipeline_latency_seconds,
                 "message": f"Pipeline verified! {total_recent_count} logs in BigQuery, {analytics_count} in analytics view",
                 "pipeline_flow": "Gemini CLI → Cloud Logging → Pub/Sub → Dataflow → BigQuery"
             }
         else:
             logger.warning("✗ ELT Pipeline end-to-end verification FAILED")
-            logger.warning(f"  - Cloud Logging: {log_count} logs found")
+            logger.warning(f"  - Cloud Logging: latest log at {latest_log_timestamp}")
             logger.warning(f"  - BigQuery: {total_recent_count} recent rows (expected > 0)")
 
             return {
                 "success": False,
                 "test_id": test_id,
-                "cloud_logging_count": log_count,
+                "cloud_logging_latest_timestamp": latest_log_timestamp,
                 "bigquery_matched_count": matched_count,
                 "bigquery_recent_count": total_recent_count,
+                "bigquery_test_id_count": test_id_count,
                 "analytics_view_count": analytics_count,
                 "error": "No recent logs found in BigQuery",
-                "message": f"Pipeline verification failed: {log_count} logs in Cloud Logging but {total_recent_count} in BigQuery"
+                "message": f"Pipeline verification failed: logs in Cloud Logging but {total_recent_count} in BigQuery"
             }
 
     except Exception as e:
@@ -155,6 +279,56 @@ async def verify_end_to_end(
         }
 
 
+async def _poll_until(
+    check,
+    done,
+    timeout: float,
+    initial_interval: float = POLL_INITIAL_INTERVAL,
+    max_interval: float = POLL_MAX_INTERVAL,
+    jitter: float = 0.0
+):
+    """
+    Call check() until done(result) is true or timeout seconds have passed,
+    backing off between attempts. Time spent inside check() counts against
+    the timeout, and no sleep runs past it.
+
+    Args:
+        check: Callable taking the seconds left in the budget (to bound its own
+            calls) and returning an awaitable result
+        done: Predicate on the result that ends polling
+        timeout: Maximum total seconds to poll for
+        initial_interval: Seconds between the first two checks
+        max_interval: Cap on the gap between checks, before jitter
+        jitter: Each gap is lengthened by up to this fraction, at random
+
+    Returns:
+        (last result, seconds elapsed until it was obtained)
+    """
+    start_time = time.monotonic()
+    interval = initial_interval
+
+    while True:
+        result = await check(timeout - (time.monotonic() - start_time))
+        elapsed = time.monotonic() - start_time
+
+        if done(result) or elapsed >= timeout:
+            return result, elapsed
+
+        await asyncio.sleep(min(interval * (1 + random.uniform(0, jitter)), timeout - elapsed))
+        interval = min(interval * POLL_BACKOFF_FACTOR, max_interval)
+
+
+def _logging_cutoff(minutes: int) -> str:
+    """Cloud Logging filter timestamp (UTC) for the given number of minutes ago."""
+    cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+    return cutoff_time.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _test_marker(test_id: str) -> str:
+    """Tag put in test prompts so their logs can be matched to a verification run."""
+    return f"verification_id={test_id}"
+
+
 async def _send_test_prompts(test_id: str) -> Dict:
     """
     Send test Gemini CLI prompts with unique test ID.
@@ -168,7 +342,7 @@ async def _send_test_prompts(test_id: str) -> Dict:
     """
     try:
         logger.info(f"Sending test prompts with ID: {test_id}")
-        prompts_sent = await run_multiple_gemini_test_commands()
+        prompts_sent = await run_multiple_gemini_test_commands(test_id)
 
         success = prompts_sent > 0
 
@@ -382,13 +556,13 @@ async def _wait_for_bigquery_data(
     try:
         logger.info(f"Waiting for BigQuery data (max {max_wait_seconds}s)...")
 
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
         check_interval = 30  # Check every 30 seconds
         attempt = 0
 
         while True:
             attempt += 1
-            elapsed = int(asyncio.get_event_loop().time() - start_time)
+            elapsed = int(time.monotonic() - start_time)
 
             logger.info(f"Checking BigQuery (attempt {attempt}, elapsed: {elapsed}s/{max_wait_seconds}s)...")
 
@@ -444,7 +618,7 @@ async def _check_bigquery_raw_table(project_id: str, dataset_name: str) -> Dict:
         }
     """
     try:
-        client = bigquery.Client(project=project_id)
+        client = _get_bigquery_client(project_id)
         table_id = f"{project_id}.{dataset_name}.gemini_raw_logs"
 
         # Query for recent data (last 15 minutes)
@@ -454,12 +628,8 @@ async def _check_bigquery_raw_table(project_id: str, dataset_name: str) -> Dict:
         WHERE timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 15 MINUTE)
         """
 
-        query_job = client.query(query)
-        results = query_job.result()
-
-        row_count = 0
-        for row in results:
-            row_count = row.row_count
+        row = await _query_first_row(client, query)
+        row_count = row.row_count if row else 0
 
         logger.info(f"Found {row_count} recent rows in gemini_raw_logs")
 
@@ -491,31 +661,26 @@ async def _verify_json_string_schema(project_id: str, dataset_name: str, test_id
         }
     """
     try:
-        client = bigquery.Client(project=project_id)
+        client = _get_bigquery_client(project_id)
         table_id = f"{project_id}.{dataset_name}.gemini_raw_logs"
 
         logger.info(f"Verifying JSON string schema for test ID: {test_id}")
 
-        # Query for a sample row to verify schema
+        # Query for a sample row to verify schema (only the columns checked below;
+        # BigQuery bills every selected column over the whole window, LIMIT or not)
         query = f"""
         SELECT
-            timestamp,
-            logName,
-            severity,
             resource_json,
             labels_json,
-            jsonPayload_json,
-            operation_json,
-            httpRequest_json
+            jsonPayload_json
         FROM `{table_id}`
         WHERE timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 15 MINUTE)
         LIMIT 1
         """
 
-        query_job = client.query(query)
-        results = query_job.result()
+        row = await _query_first_row(client, query)
 
-        for row in results:
+        if row is not None:
             # Verify all complex fields are strings
             valid_schema = (
                 isinstance(row.resource_json, str) and
@@ -576,21 +741,14 @@ async def _query_analytics_view(project_id: str, dataset_name: str, test_id: str
         }
     """
     try:
-        client = bigquery.Client(project=project_id)
+        client = _get_bigquery_client(project_id)
         view_id = f"{project_id}.{dataset_name}.gemini_analytics_view"
 
         logger.info(f"Querying analytics view for test ID: {test_id}")
 
-        # Query analytics view for recent data
+        # Query analytics view for recent data, selecting only the parsed JSON fields checked below
         query = f"""
         SELECT
-            timestamp,
-            event_name,
-            session_id,
-            model,
-            input_tokens,
-            output_tokens,
-            total_tokens,
             resource,
             labels,
             payload
@@ -599,10 +757,7 @@ async def _query_analytics_view(project_id: str, dataset_name: str, test_id: str
         LIMIT 10
         """
 
-        query_job = client.query(query)
-        results = query_job.result()
-
-        rows = list(results)
+        rows = await _query_rows(client, query)
         row_count = len(rows)
 
         # Check if fields were extracted
@@ -637,39 +792,34 @@ async def _query_analytics_view(project_id: str, dataset_name: str, test_id: str
         }
 
 
-async def run_multiple_gemini_test_commands() -> int:
+async def run_multiple_gemini_test_commands(test_id: Optional[str] = None) -> int:
     """
     Run multiple gemini CLI commands in headless mode to generate telemetry.
 
-    Sends 5 prompts using gemini-2.5-flash for fast responses:
+    Sends 5 prompts concurrently using gemini-2.5-flash for fast responses:
     - Some prompts trigger web grounding tool use
     - Uses flash model for speed
+    - Prompts are tagged with test_id (if given) so their logs can be found exactly
     - Returns number of successfully sent prompts
     """
     try:
-        # Read Gemini CLI settings to get project configuration
-        import json
-        settings_path = os.path.expanduser("~/.gemini/settings.json")
+        # Read Gemini CLI settings to get project configuration (cached against the
+        # file's mtime by telemetry_service, so repeat verifications skip the parse)
         gemini_project = None
         telemetry_project = None
 
         try:
-            with open(settings_path, 'r') as f:
-                settings = json.load(f)
-                gemini_project = settings.get("env", {}).get("GOOGLE_CLOUD_PROJECT")
-                telemetry_project = settings.get("env", {}).get("OTLP_GOOGLE_CLOUD_PROJECT")
-                logger.info(f"Read Gemini CLI configuration from settings.json")
-                logger.info(f"  Inference project: {gemini_project}")
-                logger.info(f"  Telemetry project: {telemetry_project}")
+            from services import telemetry_service
+            settings = await telemetry_service.read_gemini_settings()
+            gemini_project = settings.get("env", {}).get("GOOGLE_CLOUD_PROJECT")
+            telemetry_project = settings.get("env", {}).get("OTLP_GOOGLE_CLOUD_PROJECT")
+            logger.info(f"Read Gemini CLI configuration from settings.json")
+            logger.info(f"  Inference project: {gemini_project}")
+            logger.info(f"  Telemetry project: {telemetry_project}")
         except Exception as e:
             logger.warning(f"Could not read Gemini CLI settings: {str(e)}")
 
-        env = {
-            **os.environ,
-            "GOOGLE_APPLICATION_CREDENTIALS": os.path.expanduser(
-                "~/.config/gcloud/application_default_credentials.json"
-            )
-        }
+        env = {**os.environ, "GOOGLE_APPLICATION_CREDENTIALS": ADC_CREDENTIALS_PATH}
 
         # Add project configuration to environment if available
         if gemini_project:
@@ -688,73 +838,84 @@ async def run_multiple_gemini_test_commands() -> int:
             "List 3 programming languages"  # Simple list
         ]
 
-        successful = 0
-
-        for i, prompt in enumerate(prompts, 1):
-            logger.info(f"Sending prompt {i}/5: {prompt[:50]}...")
-
-            # Run gemini in headless mode with flash model
-            result = subprocess.run(
-                [
-                    "gemini",
-                    "--prompt", prompt,
-                    "--model", "gemini-2.5-flash",
-                    "--output-format", "json"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60,
-                env=env
-            )
+        # Send all prompts at once; total time is the slowest prompt, not the sum
+        logger.info(f"Sending {len(prompts)} prompts concurrently...")
+        tag = f"[{_test_marker(test_id)}] " if test_id else ""
+        results = await asyncio.gather(
+            *(_run_gemini_prompt(tag + prompt, env) for prompt in prompts),
+            return_exceptions=True
+        )
 
-            if result.returncode == 0:
-                logger.info(f"✓ Prompt {i}/5 completed successfully")
-                successful += 1
+        successful = 0
+        for i, (prompt, result) in enumerate(zip(prompts, results), 1):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.error(f"✗ Prompt {i}/5 timed out: {prompt[:50]}")
+            elif isinstance(result, Exception):
+                logger.error(f"✗ Prompt {i}/5 failed: {str(result)}")
             else:
-                logger.warning(f"⚠ Prompt {i}/5 had non-zero exit: {result.stderr[:100]}")
+                returncode, stderr = result
+                if returncode == 0:
+                    logger.info(f"✓ Prompt {i}/5 completed successfully")
+                else:
+                    logger.warning(f"⚠ Prompt {i}/5 had non-zero exit: {stderr[:100]}")
                 successful += 1  # Still count as sent
 
-            # Small delay between prompts
-            await asyncio.sleep(2)
-
         logger.info(f"Completed sending {successful}/5 prompts")
         return successful
 
-    except subprocess.TimeoutExpired:
-        logger.error("Gemini test command timed out")
-        return successful
     except Exception as e:
         logger.error(f"Failed to run gemini commands: {str(e)}")
-        return successful
+        return 0
+
+
+async def _run_gemini_prompt(prompt: str, env: Dict, model: Optional[str] = GEMINI_TEST_MODEL) -> Tuple[int, str]:
+    """
+    Run one gemini CLI prompt in headless mode without blocking the event loop.
+
+    Args:
+        prompt: Prompt text
+        env: Environment for the gemini process
+        model: Model to use, or None for the CLI default
+
+    Returns:
+        (exit code, stderr); raises asyncio.TimeoutError after GEMINI_PROMPT_TIMEOUT seconds
+    """
+    model_args = ["--model", model] if model else []
+    process = await asyncio.create_subprocess_exec(
+        "gemini",
+        "--prompt", prompt,
+        *model_args,
+        "--output-format", "json",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env
+    )
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), timeout=GEMINI_PROMPT_TIMEOUT)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+
+    return process.returncode, stderr.decode(errors="replace")
 
 
 async def run_gemini_test_command() -> bool:
     """Run a simple gemini CLI command in headless mode to generate telemetry (legacy)."""
     try:
-        env = {
-            **os.environ,
-            "GOOGLE_APPLICATION_CREDENTIALS": os.path.expanduser(
-                "~/.config/gcloud/application_default_credentials.json"
-            )
-        }
+        env = {**os.environ, "GOOGLE_APPLICATION_CREDENTIALS": ADC_CREDENTIALS_PATH}
 
         # Run gemini in headless mode with a simple prompt
-        result = subprocess.run(
-            ["gemini", "--prompt", "What is 2+2?", "--output-format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            env=env
-        )
+        returncode, stderr = await _run_gemini_prompt("What is 2+2?", env, model=None)
 
-        if result.returncode == 0:
+        if returncode == 0:
             logger.info("Gemini test command executed successfully")
             return True
         else:
-            logger.warning(f"Gemini command had non-zero exit: {result.stderr}")
+            logger.warning(f"Gemini command had non-zero exit: {stderr}")
             return True  # Still return True as command ran
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         logger.error("Gemini test command timed out")
         return False
     except Exception as e:
@@ -769,50 +930,34 @@ async def _get_latest_gemini_cli_log(project_id: str) -> Dict:
     Returns:
         {
             "found": bool,
-            "latest_timestamp": str (ISO format),
-            "count": int (total recent logs)
+            "latest_timestamp": str (ISO format)
         }
     """
     try:
-        client = cloud_logging.Client(project=project_id)
-
         # Filter for recent gemini_cli logs (last 10 minutes)
-        import datetime
-        cutoff_time = datetime.datetime.utcnow() - datetime.timedelta(minutes=10)
-        timestamp_str = cutoff_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp_str = _logging_cutoff(minutes=10)
 
-        filter_str = f'logName="projects/{project_id}/logs/gemini_cli" AND timestamp>="{timestamp_str}"'
+        filter_str = GEMINI_CLI_LOG_FILTER.format(project_id=project_id, cutoff=timestamp_str)
 
         logger.info(f"Searching for gemini_cli logs with filter: {filter_str}")
 
-        iterator = client.list_entries(
-            filter_=filter_str,
-            order_by="timestamp desc",
-            max_results=100
-        )
+        # Client setup and paging are blocking RPCs; keep them off the event loop
+        latest_log = await asyncio.to_thread(_fetch_latest_gemini_cli_log, project_id, filter_str)
 
-        logs = list(iterator)
-        log_count = len(logs)
-
-        if log_count > 0:
-            # Get the latest log (first one due to desc order)
-            latest_log = logs[0]
+        if latest_log is not None:
             latest_timestamp = latest_log.timestamp.isoformat()
 
-            logger.info(f"Found {log_count} gemini_cli logs in Cloud Logging")
-            logger.info(f"Latest log timestamp: {latest_timestamp}")
+            logger.info(f"Latest gemini_cli log timestamp: {latest_timestamp}")
 
             return {
                 "found": True,
-                "latest_timestamp": latest_timestamp,
-                "count": log_count
+                "latest_timestamp": latest_timestamp
             }
         else:
             logger.warning("No gemini_cli logs found in Cloud Logging")
             return {
                 "found": False,
-                "latest_timestamp": None,
-                "count": 0
+                "latest_timestamp": None
             }
 
     except Exception as e:
@@ -820,15 +965,30 @@ async def _get_latest_gemini_cli_log(project_id: str) -> Dict:
         return {
             "found": False,
             "latest_timestamp": None,
-            "count": 0,
             "error": str(e)
         }
 
 
+def _fetch_latest_gemini_cli_log(project_id: str, filter_str: str):
+    """Newest gemini_cli log entry matching filter_str, or None. Blocking."""
+    client = _get_logging_client(project_id)
+    # max_results only stops the client-side iterator; page_size keeps the
+    # server from returning a full default-sized page for one entry
+    entries = client.list_entries(
+        filter_=filter_str,
+        order_by="timestamp desc",
+        page_size=1,
+        max_results=1
+    )
+    return next(iter(entries), None)
+
+
 async def _check_bigquery_for_timestamp(
     project_id: str,
     dataset_name: str,
-    cloud_logging_timestamp: str
+    cloud_logging_timestamp: str,
+    test_id: Optional[str] = None,
+    timeout: float = BIGQUERY_QUERY_TIMEOUT
 ) -> Dict:
     """
     Check if logs from Cloud Logging timestamp made it to BigQuery.
@@ -839,48 +999,61 @@ async def _check_bigquery_for_timestamp(
         project_id: GCP project ID
         dataset_name: BigQuery dataset name
         cloud_logging_timestamp: ISO timestamp from Cloud Logging
+        test_id: Verification run ID the test prompts were tagged with
+        timeout: Seconds to wait for the query (capped at BIGQUERY_QUERY_TIMEOUT)
 
     Returns:
         {
             "matched_count": int (logs matching or near the timestamp),
-            "total_recent_count": int (all recent logs in last 10 min)
+            "total_recent_count": int (all recent logs in last 10 min),
+            "test_id_count": int (recent logs carrying the test ID; only
+                                  non-zero when prompt logging is enabled)
         }
     """
     try:
-        client = bigquery.Client(project=project_id)
+        client = _get_bigquery_client(project_id)
         table_id = f"{project_id}.{dataset_name}.gemini_raw_logs"
 
-        # Query 1: Count logs from around the Cloud Logging timestamp (within 2 minutes)
-        query_matched = f"""
-        SELECT COUNT(*) as matched_count
-        FROM `{table_id}`
-        WHERE timestamp >= TIMESTAMP_SUB(TIMESTAMP('{cloud_logging_timestamp}'), INTERVAL 2 MINUTE)
-          AND timestamp <= TIMESTAMP_ADD(TIMESTAMP('{cloud_logging_timestamp}'), INTERVAL 2 MINUTE)
-        """
-
-        # Query 2: Count all recent logs (last 10 minutes) as a broader check
-        query_recent = f"""
-        SELECT COUNT(*) as recent_count
+        # One query counts logs from around the Cloud Logging timestamp (within
+        # 2 minutes), all recent logs (last 10 minutes) as a broader check, and
+        # recent logs whose prompt carries this run's test ID (exact, but only
+        # present when prompt logging is on; a NULL marker counts nothing)
+        query = f"""
+        SELECT
+          COUNTIF(timestamp BETWEEN TIMESTAMP_SUB(TIMESTAMP(@log_timestamp), INTERVAL 2 MINUTE)
+                                AND TIMESTAMP_ADD(TIMESTAMP(@log_timestamp), INTERVAL 2 MINUTE)) AS matched_count,
+          COUNTIF(timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 10 MINUTE)) AS recent_count,
+          COUNTIF(timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 10 MINUTE)
+                  AND STRPOS(jsonPayload_json, @test_marker) > 0) AS test_id_count
         FROM `{table_id}`
-        WHERE timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 10 MINUTE)
+        WHERE timestamp >= LEAST(
+          TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 10 MINUTE),
+          TIMESTAMP_SUB(TIMESTAMP(@log_timestamp), INTERVAL 2 MINUTE)
+        )
         """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("log_timestamp", "STRING", cloud_logging_timestamp),
+                bigquery.ScalarQueryParameter(
+                    "test_marker", "STRING", _test_marker(test_id) if test_id else None
+                )
+            ]
+        )
 
-        # Execute both queries
-        job_matched = client.query(query_matched)
-        results_matched = job_matched.result()
-        matched_count = list(results_matched)[0].matched_count
-
-        job_recent = client.query(query_recent)
-        results_recent = job_recent.result()
-        total_recent_count = list(results_recent)[0].recent_count
+        row = await _query_first_row(client, query, job_config=job_config, timeout=timeout)
+        matched_count = row.matched_count
+        total_recent_count = row.recent_count
+        test_id_count = row.test_id_count
 
         logger.info(f"BigQuery timestamp check:")
         logger.info(f"  - Logs matching timestamp ±2min: {matched_count}")
         logger.info(f"  - Total recent logs (last 10 min): {total_recent_count}")
+        logger.info(f"  - Logs tagged with test ID: {test_id_count}")
 
         return {
             "matched_count": matched_count,
-            "total_recent_count": total_recent_count
+            "total_recent_count": total_recent_count,
+            "test_id_count": test_id_count
         }
 
     except Exception as e:
@@ -888,37 +1061,38 @@ async def _check_bigquery_for_timestamp(
         return {
             "matched_count": 0,
             "total_recent_count": 0,
+            "test_id_count": 0,
             "error": str(e)
         }
 
 
 async def check_logs_in_cloud_logging_detailed(project_id: str) -> Dict:
-    """Check if gemini_cli logs exist in Cloud Logging with detailed results."""
+    """
+    Check if gemini_cli logs exist in Cloud Logging with detailed results.
+
+    Only one entry is fetched: it answers whether logs exist and serves as the
+    structure sample, so "count" is 1 when logs were found and 0 otherwise.
+    """
     try:
-        client = cloud_logging.Client(project=project_id)
+        client = _get_logging_client(project_id)
 
         # Filter for recent gemini_cli logs (last 5 minutes)
-        import datetime
-        cutoff_time = datetime.datetime.utcnow() - datetime.timedelta(minutes=5)
-        timestamp_str = cutoff_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp_str = _logging_cutoff(minutes=5)
 
-        filter_str = f'logName="projects/{project_id}/logs/gemini_cli" AND timestamp>="{timestamp_str}"'
+        filter_str = GEMINI_CLI_LOG_FILTER.format(project_id=project_id, cutoff=timestamp_str)
 
         logger.info(f"Searching for logs with filter: {filter_str}")
 
-        iterator = client.list_entries(
-            filter_=filter_str,
-            max_results=50
+        # Listing is a blocking RPC; fetch just the first matching entry off the event loop
+        sample_log = await asyncio.to_thread(
+            lambda: next(iter(client.list_entries(filter_=filter_str, page_size=1, max_results=1)), None)
         )
-
-        logs = list(iterator)
-        log_count = len(logs)
+        log_count = 1 if sample_log is not None else 0
 
         if log_count > 0:
-            logger.info(f"Found {log_count} gemini_cli logs in Cloud Logging")
+            logger.info("Found gemini_cli logs in Cloud Logging")
 
             # Validate log structure
-            sample_log = logs[0]
             has_valid_structure = (
                 hasattr(sample_log, 'timestamp') and
                 hasattr(sample_log, 'payload')
@@ -950,30 +1124,19 @@ async def check_logs_in_cloud_logging_detailed(project_id: str) -> Dict:
 async def check_sink_errors(project_id: str) -> Dict:
     """Check for sink export errors in Cloud Logging."""
     try:
-        client = cloud_logging.Client(project=project_id)
+        client = _get_logging_client(project_id)
 
         # Filter for sink errors (last 10 minutes)
-        import datetime
-        cutoff_time = datetime.datetime.utcnow() - datetime.timedelta(minutes=10)
-        timestamp_str = cutoff_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp_str = _logging_cutoff(minutes=10)
 
         # Look for export errors
-        filter_str = f'logName:"logs/cloudaudit.googleapis.com" AND protoPayload.serviceName="logging.googleapis.com" AND protoPayload.methodName:"google.logging.v2.ConfigServiceV2.CreateSink" OR protoPayload.methodName:"google.logging.v2.ConfigServiceV2.UpdateSink" AND timestamp>="{timestamp_str}"'
+        filter_str = SINK_AUDIT_LOG_FILTER.format(cutoff=timestamp_str)
 
-        iterator = client.list_entries(
-            filter_=filter_str,
-            max_results=20
+        # The filter only matches failed calls (non-zero status), so every entry
+        # returned is an error; count them without keeping the entries
+        error_count = await asyncio.to_thread(
+            lambda: sum(1 for _ in client.list_entries(filter_=filter_str, page_size=20, max_results=20))
         )
-
-        error_logs = []
-        for entry in iterator:
-            if hasattr(entry, 'payload'):
-                payload = entry.payload if isinstance(entry.payload, dict) else {}
-                status = payload.get('status', {})
-                if isinstance(status, dict) and status.get('code', 0) != 0:
-                    error_logs.append(entry)
-
-        error_count = len(error_logs)
         has_critical_errors = error_count > 0
 
         if error_count > 0:
@@ -1000,8 +1163,9 @@ async def poll_bigquery_for_data(project_id: str, dataset_name: str, max_wait_se
     """
     Continuously poll BigQuery for data with timeout.
 
-    Checks every 20 seconds for up to max_wait_seconds (default 5 minutes).
-    Returns immediately if data is found.
+    Checks immediately, then backs off between checks (BIGQUERY_POLL_INITIAL_INTERVAL
+    growing to BIGQUERY_POLL_MAX_INTERVAL, jittered) for up to max_wait_seconds
+    (default 5 minutes). Returns as soon as data is found.
 
     Args:
         project_id: GCP project ID
@@ -1011,41 +1175,48 @@ async def poll_bigquery_for_data(project_id: str, dataset_name: str, max_wait_se
     Returns:
         Dict with detailed verification results
     """
-    start_time = asyncio.get_event_loop().time()
-    check_interval = 20  # Check every 20 seconds
     attempt = 0
 
-    while True:
+    # The table won't disappear mid-poll, so look it up once rather than on every attempt.
+    # If it doesn't exist yet, each attempt checks for it again.
+    try:
+        client = _get_bigquery_client(project_id)
+        table = await asyncio.to_thread(client.get_table, f"{project_id}.{dataset_name}.gemini_cli")
+        known_total_rows = table.num_rows or 0
+    except Exception:
+        known_total_rows = None
+
+    async def check(remaining):
+        nonlocal attempt
         attempt += 1
-        elapsed = asyncio.get_event_loop().time() - start_time
-
-        logger.info(f"Polling BigQuery (attempt {attempt}, elapsed: {int(elapsed)}s/{max_wait_seconds}s)...")
+        logger.info(f"Polling BigQuery (attempt {attempt}, max wait: {max_wait_seconds}s)...")
+        return await check_data_in_bigquery_detailed(project_id, dataset_name, known_total_rows, timeout=remaining)
 
-        # Check BigQuery
-        result = await check_data_in_bigquery_detailed(project_id, dataset_name)
+    result, elapsed = await _poll_until(
+        check,
+        lambda result: result["has_data"],
+        max_wait_seconds,
+        initial_interval=BIGQUERY_POLL_INITIAL_INTERVAL,
+        max_interval=BIGQUERY_POLL_MAX_INTERVAL,
+        jitter=BIGQUERY_POLL_JITTER
+    )
 
-        # If data found, return immediately
-        if result["has_data"]:
-            logger.info(f"✓ Data found in BigQuery after {int(elapsed)}s!")
-            return result
+    if result["has_data"]:
+        logger.info(f"✓ Data found in BigQuery after {int(elapsed)}s!")
+        return result
 
-        # Check if we've exceeded timeout
-        if elapsed >= max_wait_seconds:
-            logger.error(f"✗ Timeout after {int(elapsed)}s - no data in BigQuery")
-            result["timeout"] = True
-            result["elapsed_seconds"] = int(elapsed)
-            return result
+    logger.error(f"✗ Timeout after {int(elapsed)}s - no data in BigQuery")
+    result["timeout"] = True
+    result["elapsed_seconds"] = int(elapsed)
+    return result
 
-        # Wait before next check
-        remaining = max_wait_seconds - elapsed
-        wait_time = min(check_interval, remaining)
 
-        if wait_time > 0:
-            logger.info(f"No data yet. Waiting {int(wait_time)}s before next check...")
-            await asyncio.sleep(wait_time)
-
-
-async def check_data_in_bigquery_detailed(project_id: str, dataset_name: str) -> Dict:
+async def check_data_in_bigquery_detailed(
+    project_id: str,
+    dataset_name: str,
+    known_total_rows: Optional[int] = None,
+    timeout: float = BIGQUERY_QUERY_TIMEOUT
+) -> Dict:
     """
     Check if data has been exported to BigQuery with detailed validation.
 
@@ -1054,66 +1225,65 @@ async def check_data_in_bigquery_detailed(project_id: str, dataset_name: str) ->
     2. Table has actual rows (not just schema)
     3. Recent data exists (last 10 minutes)
     4. Data structure is valid
+
+    Checks 1 and 2 are skipped when known_total_rows is given (the caller has
+    already fetched the table); it is then only used as the historical row count.
+    The recent-data query waits at most timeout seconds (capped at
+    BIGQUERY_QUERY_TIMEOUT).
     """
     try:
-        client = bigquery.Client(project=project_id)
+        client = _get_bigquery_client(project_id)
         # Table name must match log name ID: "gemini_cli"
         table_id = f"{project_id}.{dataset_name}.gemini_cli"
 
         # Check 1: Table exists
-        try:
-            table = client.get_table(table_id)
-            total_rows = table.num_rows or 0
-            logger.info(f"Table exists with {total_rows} total rows")
-
-            # If table is completely empty, fail immediately
-            if total_rows == 0:
-                logger.error("Table exists but has ZERO rows - no data has ever been exported")
+        if known_total_rows is not None:
+            total_rows = known_total_rows
+        else:
+            try:
+                table = await asyncio.to_thread(client.get_table, table_id)
+                total_rows = table.num_rows or 0
+                logger.info(f"Table exists with {total_rows} total rows")
+
+                # If table is completely empty, fail immediately
+                if total_rows == 0:
+                    logger.error("Table exists but has ZERO rows - no data has ever been exported")
+                    return {
+                        "has_data": False,
+                        "row_count": 0,
+                        "recent_row_count": 0,
+                        "error": "Table is completely empty - sink may not be exporting data"
+                    }
+            except Exception as e:
+                logger.error(f"Table not found: {str(e)}")
                 return {
                     "has_data": False,
                     "row_count": 0,
                     "recent_row_count": 0,
-                    "error": "Table is completely empty - sink may not be exporting data"
+                    "error": "Table not found"
                 }
-        except Exception as e:
-            logger.error(f"Table not found: {str(e)}")
-            return {
-                "has_data": False,
-                "row_count": 0,
-                "recent_row_count": 0,
-                "error": "Table not found"
-            }
 
-        # Check 2: Query for recent data (last 10 minutes)
+        # Check 2: Query for recent data (last 10 minutes), fetching one sample row
+        # in the same job for the structure check below
         query_recent = f"""
-        SELECT COUNT(*) as row_count
+        SELECT
+          COUNT(*) AS row_count,
+          ARRAY_AGG(STRUCT(timestamp, logName) LIMIT 1)[SAFE_OFFSET(0)] AS sample
         FROM `{table_id}`
         WHERE timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 10 MINUTE)
         """
 
         logger.info("Querying for recent data (last 10 minutes)...")
-        query_job = client.query(query_recent)
-        results = query_job.result()
-
-        recent_row_count = 0
-        for row in results:
-            recent_row_count = row.row_count
+        row = await _query_first_row(client, query_recent, timeout=timeout)
+        recent_row_count = row.row_count if row else 0
 
         logger.info(f"Found {recent_row_count} rows in last 10 minutes")
 
         # Check 3: If no recent data, this is a FAILURE for E2E test
         # We need recent data from THIS test run, not historical data
         if recent_row_count == 0:
-            query_all = f"""
-            SELECT COUNT(*) as row_count
-            FROM `{table_id}`
-            """
-            query_job = client.query(query_all)
-            results = query_job.result()
-
-            total_count = 0
-            for row in results:
-                total_count = row.row_count
+            # Total from the table metadata fetched above; no need for another query job
+            total_count = total_rows
 
             logger.warning(f"No recent data found! Total rows in table: {total_count}")
 
@@ -1125,26 +1295,14 @@ async def check_data_in_bigquery_detailed(project_id: str, dataset_name: str) ->
                 "message": f"FAILURE: No recent data exported to BigQuery. Table has {total_count} historical rows but no new data from this test run."
             }
 
-        # Check 4: Validate data structure by sampling a row
-        query_sample = f"""
-        SELECT timestamp, logName, jsonPayload
-        FROM `{table_id}`
-        WHERE timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 10 MINUTE)
-        LIMIT 1
-        """
-
-        query_job = client.query(query_sample)
-        results = query_job.result()
-
-        has_valid_structure = False
-        for row in results:
-            has_valid_structure = (
-                row.timestamp is not None and
-                row.logName is not None
-            )
-            if has_valid_structure:
-                logger.info("✓ Data structure validation passed")
-            break
+        # Check 4: Validate data structure using the sampled row
+        sample = row.sample
+        has_valid_structure = bool(sample) and (
+            sample["timestamp"] is not None and
+            sample["logName"] is not None
+        )
+        if has_valid_structure:
+            logger.info("✓ Data structure validation passed")
 
         return {
             "has_data": recent_row_count > 0,
@@ -1169,7 +1327,7 @@ async def check_table_exists(client: bigquery.Client, project_id: str, dataset_n
     try:
         # Table name must match log name ID: "gemini_cli"
         table_id = f"{project_id}.{dataset_name}.gemini_cli"
-        table = client.get_table(table_id)
+        table = await asyncio.to_thread(client.get_table, table_id)
 
         logger.info(f"Table exists: {table.num_rows} total rows")
         return True
@@ -1194,25 +1352,21 @@ async def verify_complete_setup(project_id: str, dataset_name: str) -> Dict:
     results = {}
 
     try:
-        # Check dataset
-        results["dataset_exists"] = await bigquery_service.verify_dataset_exists(
-            project_id, dataset_name
+        # Independent checks, run concurrently. A missing/broken sink just counts as
+        # not verified; any other failure propagates and cancels the remaining checks
+        dataset_exists, table_exists, sink_info, telemetry_enabled = await _gather_fail_fast(
+            bigquery_service.verify_dataset_exists(project_id, dataset_name),
+            bigquery_service.verify_table_exists(project_id, dataset_name),
+            _capture_exception(sink_service.verify_sink(project_id, "gemini-cli-to-bigquery")),
+            telemetry_service.verify_telemetry_enabled()
         )
 
-        # Check table
-        results["table_exists"] = await bigquery_service.verify_table_exists(
-            project_id, dataset_name
+        results["dataset_exists"] = dataset_exists
+        results["table_exists"] = table_exists
+        results["sink_exists"] = (
+            False if isinstance(sink_info, BaseException) else sink_info.get("verified", False)
         )
-
-        # Check sink
-        try:
-            sink_info = await sink_service.verify_sink(project_id, "gemini-cli-to-bigquery")
-            results["sink_exists"] = sink_info.get("verified", False)
-        except:
-            results["sink_exists"] = False
-
-        # Check telemetry enabled
-        results["telemetry_enabled"] = await telemetry_service.verify_telemetry_enabled()
+        results["telemetry_enabled"] = telemetry_enabled
 
         # Overall success
         results["all_verified"] = all([
@@ -1232,7 +1386,8 @@ async def verify_complete_setup(project_id: str, dataset_name: str) -> Dict:
 async def verify_elt_pipeline(
     project_id: str,
     dataset_name: str,
-    region: str = "us-central1"
+    region: str = "us-central1",
+    fail_fast: bool = False
 ) -> Dict:
     """
     Verify complete ELT pipeline: Sink → Pub/Sub → Dataflow → BigQuery.
@@ -1249,6 +1404,8 @@ async def verify_elt_pipeline(
         project_id: GCP project ID
         dataset_name: BigQuery dataset name
         region: GCP region (default: us-central1)
+        fail_fast: Check Pub/Sub first and skip the remaining checks when the
+            topic or subscription is missing (default: False)
 
     Returns:
         {
@@ -1270,13 +1427,73 @@ async def verify_elt_pipeline(
     details = {}
 
     try:
-        # Step 1: Verify Pub/Sub resources
-        logger.info("Step 1/5: Verifying Pub/Sub resources...")
-        from . import pubsub_service
+        # The five checks hit different APIs and don't depend on each other, so run
+        # them concurrently: total time is the slowest check rather than the sum
+        logger.info("Verifying Pub/Sub, sink, Dataflow, GCS and BigQuery (5 checks in parallel)...")
+        from . import pubsub_service, sink_service, dataflow_service, gcs_service, bigquery_service
+
+        bucket_name = f"{project_id}-dataflow"
 
-        topic_exists = await pubsub_service.verify_topic_exists(project_id, "gemini-telemetry-topic")
-        subscription_exists = await pubsub_service.verify_subscription_exists(project_id, "gemini-telemetry-sub")
+        def pubsub_checks():
+            return (
+                pubsub_service.verify_topic_exists(project_id, "gemini-telemetry-topic"),
+                pubsub_service.verify_subscription_exists(project_id, "gemini-telemetry-sub")
+            )
+
+        pubsub_results = ()
+        if fail_fast:
+            # Without the topic and subscription Dataflow has no input, so nothing
+            # downstream can pass; check them on their own and stop if either is missing
+            pubsub_results = tuple(await _gather_fail_fast(*pubsub_checks()))
+            if not all(pubsub_results):
+                topic_exists, subscription_exists = pubsub_results
+                if not topic_exists:
+                    issues.append("Pub/Sub topic 'gemini-telemetry-topic' not found")
+                if not subscription_exists:
+                    issues.append("Pub/Sub subscription 'gemini-telemetry-sub' not found")
+                issues.append("Skipped sink, Dataflow, GCS and BigQuery checks: Pub/Sub resources are missing")
+
+                logger.warning("✗ Pub/Sub resources missing, skipping remaining ELT pipeline checks")
+
+                return {
+                    "pipeline_ready": False,
+                    "pubsub_topic_exists": topic_exists,
+                    "pubsub_subscription_exists": subscription_exists,
+                    "sink_configured": False,
+                    "dataflow_running": False,
+                    "gcs_bucket_exists": False,
+                    "udf_exists": False,
+                    "bigquery_table_exists": False,
+                    "issues": issues,
+                    "details": {
+                        "pubsub": {
+                            "topic_exists": topic_exists,
+                            "subscription_exists": subscription_exists
+                        },
+                        "skipped": ["sink", "dataflow", "gcs", "bigquery"]
+                    }
+                }
 
+        (
+            topic_exists,
+            subscription_exists,
+            sink_result,
+            dataflow_result,
+            bucket_exists,
+            udf_exists,
+            table_exists
+        ) = pubsub_results + tuple(await _gather_fail_fast(
+            *(() if pubsub_results else pubsub_checks()),
+            # Only a sink failure is reported as an issue; any other check raising
+            # fails the whole verification without waiting for the rest
+            _capture_exception(sink_service.verify_sink(project_id, "gemini-cli-to-pubsub")),
+            dataflow_service.verify_dataflow_pipeline(project_id, dataset_name, region),
+            gcs_service.verify_bucket_exists(project_id, bucket_name),
+            gcs_service.verify_file_exists(project_id, bucket_name, "transform.js"),
+            bigquery_service.verify_table_exists(project_id, dataset_name, "gemini_raw_logs")
+        ))
+
+        # Step 1: Pub/Sub resources
         details["pubsub"] = {
             "topic_exists": topic_exists,
             "subscription_exists": subscription_exists
@@ -1287,29 +1504,19 @@ async def verify_elt_pipeline(
         if not subscription_exists:
             issues.append("Pub/Sub subscription 'gemini-telemetry-sub' not found")
 
-        # Step 2: Verify Cloud Logging sink
-        logger.info("Step 2/5: Verifying Cloud Logging sink...")
-        from . import sink_service
-
-        try:
-            sink_result = await sink_service.verify_sink(project_id, "gemini-cli-to-pubsub")
+        # Step 2: Cloud Logging sink
+        if isinstance(sink_result, Exception):
+            sink_configured = False
+            issues.append(f"Sink verification failed: {str(sink_result)}")
+            details["sink"] = {"error": str(sink_result)}
+        else:
             sink_configured = sink_result.get("verified", False)
             details["sink"] = sink_result
 
             if not sink_configured:
                 issues.append("Cloud Logging sink is not properly configured")
-        except Exception as e:
-            sink_configured = False
-            issues.append(f"Sink verification failed: {str(e)}")
-            details["sink"] = {"error": str(e)}
 
-        # Step 3: Verify Dataflow pipeline
-        logger.info("Step 3/5: Verifying Dataflow pipeline...")
-        from . import dataflow_service
-
-        dataflow_result = await dataflow_service.verify_dataflow_pipeline(
-            project_id, dataset_name, region
-        )
+        # Step 3: Dataflow pipeline
         dataflow_running = dataflow_result.get("is_running", False)
         details["dataflow"] = dataflow_result
 
@@ -1317,14 +1524,7 @@ async def verify_elt_pipeline(
             dataflow_issues = dataflow_result.get("issues", [])
             issues.extend([f"Dataflow: {issue}" for issue in dataflow_issues])
 
-        # Step 4: Verify GCS resources
-        logger.info("Step 4/5: Verifying GCS resources...")
-        from . import gcs_service
-
-        bucket_name = f"{project_id}-dataflow"
-        bucket_exists = await gcs_service.verify_bucket_exists(project_id, bucket_name)
-        udf_exists = await gcs_service.verify_file_exists(project_id, bucket_name, "transform.js")
-
+        # Step 4: GCS resources
         details["gcs"] = {
             "bucket_exists": bucket_exists,
             "udf_exists": udf_exists,
@@ -1336,14 +1536,7 @@ async def verify_elt_pipeline(
         if not udf_exists:
             issues.append("JavaScript UDF file 'transform.js' not found in GCS bucket")
 
-        # Step 5: Verify BigQuery table
-        logger.info("Step 5/5: Verifying BigQuery table...")
-        from . import bigquery_service
-
-        table_exists = await bigquery_service.verify_table_exists(
-            project_id, dataset_name, "gemini_raw_logs"
-        )
-
+        # Step 5: BigQuery table
         details["bigquery"] = {
             "table_exists": table_exists,
             "table_name": "gemini_raw_logs"
@@ -14,11 +14,14 @@ import logging
 from typing import Dict, Optional
 from google.cloud import bigquery
 from google.cloud import bigquery_connection_v1
+from google.cloud.exceptions import NotFound
 from google.cloud import resourcemanager_v3
 from google.iam.v1 import iam_policy_pb2, policy_pb2
 
 logger = logging.getLogger(__name__)
 
+MODEL_CREATION_TIMEOUT = 120  # seconds to wait for the CREATE MODEL job
+
 
 def create_vertex_ai_connection(
     project_id: str,
@@ -111,7 +114,6 @@ def grant_vertex_ai_permissions(
     """
     try:
         # Initialize IAM client
-        from google.cloud import resourcemanager_v3
         projects_client = resourcemanager_v3.ProjectsClient()
 
         # Get current IAM policy
@@ -122,41 +124,27 @@ def grant_vertex_ai_permissions(
         vertex_ai_role = "roles/aiplatform.user"
         member = f"serviceAccount:{service_account}"
 
-        # Check if binding already exists
-        binding_exists = False
-        for binding in policy.bindings:
-            if binding.role == vertex_ai_role:
-                if member in binding.members:
-                    binding_exists = True
-                    logger.info(f"✓ Service account already has {vertex_ai_role}")
-                    break
-                else:
-                    binding.members.append(member)
-                    binding_exists = True
-                    break
-
-        # Create new binding if it doesn't exist
-        if not binding_exists:
-            from google.iam.v1 import policy_pb2
-            new_binding = policy_pb2.Binding(
-                role=vertex_ai_role,
-                members=[member]
-            )
-            policy.bindings.append(new_binding)
+        # Find the existing binding for the role, if any
+        target_binding = next((b for b in policy.bindings if b.role == vertex_ai_role), None)
 
-        # Set the updated policy
-        if not binding_exists or member not in [b.members for b in policy.bindings if b.role == vertex_ai_role][0]:
-            projects_client.set_iam_policy(
-                request={
-                    "resource": resource,
-                    "policy": policy
-                }
-            )
-            logger.info(f"✓ Granted {vertex_ai_role} to {service_account}")
-            return {"status": "granted", "role": vertex_ai_role, "service_account": service_account}
+        if target_binding is None:
+            policy.bindings.append(policy_pb2.Binding(role=vertex_ai_role, members=[member]))
+        elif member not in target_binding.members:
+            target_binding.members.append(member)
         else:
+            logger.info(f"✓ Service account already has {vertex_ai_role}")
             return {"status": "existing", "role": vertex_ai_role, "service_account": service_account}
 
+        # Set the updated policy
+        projects_client.set_iam_policy(
+            request={
+                "resource": resource,
+                "policy": policy
+            }
+        )
+        logger.info(f"✓ Granted {vertex_ai_role} to {service_account}")
+        return {"status": "granted", "role": vertex_ai_role, "service_account": service_account}
+
     except Exception as e:
         logger.error(f"✗ Failed to grant permissions: {str(e)}")
         logger.warning(
@@ -199,8 +187,23 @@ def create_remote_gemini_model(
         model_id = f"{project_id}.{dataset_name}.{model_name}"
         connection_path = f"{project_id}.{region}.{connection_id}"
 
+        # Check if model already exists
+        try:
+            client.get_model(model_id)
+            logger.info(f"✓ Remote Gemini model already exists: {model_id}")
+            return {
+                "model_id": model_id,
+                "model_name": model_name,
+                "endpoint": endpoint,
+                "connection": connection_path,
+                "status": "existing"
+            }
+        except NotFound:
+            # Model doesn't exist, create it
+            pass
+
         query = f"""
-        CREATE OR REPLACE MODEL `{model_id}`
+        CREATE MODEL IF NOT EXISTS `{model_id}`
         REMOTE WITH CONNECTION `{connection_path}`
         OPTIONS (
           endpoint = '{endpoint}'
@@ -209,7 +212,7 @@ def create_remote_gemini_model(
 
         logger.info(f"Creating remote Gemini model: {model_name}")
         query_job = client.query(query)
-        query_job.result()
+        query_job.result(timeout=MODEL_CREATION_TIMEOUT)
 
         logger.info(f"✓ Created remote Gemini model: {model_id}")
         logger.info(f"  Endpoint: {endpoint}")
@@ -1,6 +1,7 @@
 """
 Pytest configuration and fixtures
 """
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, MagicMock
 from fastapi.testclient import TestClient
@@ -77,9 +78,33 @@ def test_client():
 
 @pytest.fixture
 def mock_asyncio_sleep(monkeypatch):
-    """Mock asyncio.sleep to speed up tests"""
-    async def _mock_sleep(seconds):
-        pass
+    """Mock asyncio.sleep to speed up tests.
+
+    Sleeps return immediately but still yield to the event loop once, so
+    concurrently running tasks keep getting scheduled as with a real sleep.
+    """
+    real_sleep = asyncio.sleep
+
+    async def _mock_sleep(seconds, result=None):
+        await real_sleep(0)
+        return result
 
-    import asyncio
     monkeypatch.setattr(asyncio, 'sleep', _mock_sleep)
+
+
+@pytest.fixture(autouse=True)
+def clear_verification_clients():
+    """Reset verification_service's shared clients so each test's mocked Client is used."""
+    from services import verification_service
+    verification_service._clients.clear()
+    yield
+    verification_service._clients.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_enabled_apis_cache():
+    """Reset api_service's enabled-APIs cache so each test's mocked gcloud output is used."""
+    from services import api_service
+    api_service._enabled_apis_cache.clear()
+    yield
+    api_service._enabled_apis_cache.clear()
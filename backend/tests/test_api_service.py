@@ -22,24 +22,135 @@ class TestEnableApis:
     @pytest.mark.asyncio
     async def test_enable_new_apis(self, mock_asyncio_sleep):
         """Test enabling new APIs"""
-        with patch('services.api_service.get_enabled_apis', return_value=[]), \
-             patch('services.api_service.enable_api', return_value=True), \
-             patch('services.api_service.verify_api_accessible', return_value=True):
+        with patch('services.api_service.get_enabled_apis',
+                   side_effect=[[], api_service.REQUIRED_APIS]) as mock_list, \
+             patch('services.api_service._try_enable_api', return_value=(True, False)) as mock_enable, \
+             patch('services.api_service.verify_api_accessible', return_value=True) as mock_verify:
 
             result = await api_service.enable_apis("test-project")
 
             assert result["success"] is True
             assert len(result["enabled"]) == len(api_service.REQUIRED_APIS)
+            assert mock_enable.await_count == len(api_service.REQUIRED_APIS)
+            assert {c.args[1] for c in mock_enable.await_args_list} == set(api_service.REQUIRED_APIS)
+            # Propagation is checked with one listing plus the BigQuery/Logging smoke tests
+            assert mock_list.await_count == 2
+            assert {c.args[1] for c in mock_verify.await_args_list} == api_service.SMOKE_TESTED_APIS
+
+    @pytest.mark.asyncio
+    async def test_enable_apis_waits_again_when_not_listed(self, monkeypatch):
+        """Test a newly enabled API missing from the post-propagation listing triggers one more wait"""
+        sleeps = []
+
+        async def mock_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(api_service.asyncio, 'sleep', mock_sleep)
+        missing = api_service.REQUIRED_APIS[:2]
+        already = api_service.REQUIRED_APIS[2:]
+        with patch('services.api_service.get_enabled_apis', side_effect=[already, already + missing[:1]]), \
+             patch('services.api_service._try_enable_api', return_value=(True, False)), \
+             patch('services.api_service.verify_api_accessible', return_value=True):
+
+            result = await api_service.enable_apis("test-project")
+
+            assert result["success"] is True
+            assert sleeps == [30, 30]
+
+    @pytest.mark.asyncio
+    async def test_enable_apis_concurrently(self, mock_asyncio_sleep):
+        """Test every missing API's enablement starts before any of them finishes"""
+        import asyncio
+        started = []
+        all_started = asyncio.Event()
+
+        async def enable(project_id, api):
+            started.append(api)
+            if len(started) == 2:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return True, False
+
+        missing = api_service.REQUIRED_APIS[:2]
+        with patch('services.api_service.get_enabled_apis', return_value=api_service.REQUIRED_APIS[2:]), \
+             patch('services.api_service._try_enable_api', side_effect=enable), \
+             patch('services.api_service.verify_api_accessible', return_value=True):
+
+            result = await api_service.enable_apis("test-project")
+
+            assert sorted(started) == sorted(missing)
+            assert result["success"] is True
 
     @pytest.mark.asyncio
     async def test_api_enable_failure(self, mock_asyncio_sleep):
-        """Test when API enablement fails"""
+        """Test when API enablement keeps failing transiently"""
         with patch('services.api_service.get_enabled_apis', return_value=[]), \
-             patch('services.api_service.enable_api', return_value=False):
+             patch('services.api_service._try_enable_api', return_value=(False, True)) as mock_enable:
 
             with pytest.raises(Exception, match="Failed to enable APIs"):
                 await api_service.enable_apis("test-project")
 
+            # Each API is tried ENABLE_API_MAX_ATTEMPTS times before giving up
+            assert mock_enable.await_count == (
+                api_service.ENABLE_API_MAX_ATTEMPTS * len(api_service.REQUIRED_APIS)
+            )
+
+    @pytest.mark.asyncio
+    async def test_api_enable_retry_succeeds(self, monkeypatch):
+        """Test a transient enable failure is retried after a backoff"""
+        sleeps = []
+
+        async def mock_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(api_service.asyncio, 'sleep', mock_sleep)
+        already = api_service.REQUIRED_APIS[1:]
+        with patch('services.api_service.get_enabled_apis', side_effect=[already, api_service.REQUIRED_APIS]), \
+             patch('services.api_service._try_enable_api', side_effect=[(False, True), (True, False)]) as mock_enable, \
+             patch('services.api_service.verify_api_accessible', return_value=True):
+
+            result = await api_service.enable_apis("test-project")
+
+            assert result["success"] is True
+            assert mock_enable.await_count == 2
+            assert sleeps[0] == api_service.ENABLE_API_RETRY_BASE_DELAY
+
+    @pytest.mark.asyncio
+    async def test_api_enable_permanent_failure_not_retried(self, monkeypatch):
+        """Test a permission or billing error fails on the first attempt without a backoff"""
+        sleeps = []
+
+        async def mock_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(api_service.asyncio, 'sleep', mock_sleep)
+        with patch('subprocess.run', return_value=Mock(
+            returncode=1,
+            stdout="",
+            stderr="ERROR: (gcloud.services.enable) PERMISSION_DENIED: Permission denied to enable service"
+        )) as mock_run:
+            result = await api_service._enable_api_with_retry("test-project", "bigquery.googleapis.com")
+
+            assert result is False
+            assert mock_run.call_count == 1
+            assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_api_enable_quota_error_retried(self, monkeypatch):
+        """Test a quota error from gcloud is retried"""
+        async def mock_sleep(seconds):
+            pass
+
+        monkeypatch.setattr(api_service.asyncio, 'sleep', mock_sleep)
+        with patch('subprocess.run', side_effect=[
+            Mock(returncode=1, stdout="", stderr="ERROR: RESOURCE_EXHAUSTED: Quota exceeded for quota metric"),
+            Mock(returncode=0, stdout="", stderr="")
+        ]) as mock_run:
+            result = await api_service._enable_api_with_retry("test-project", "bigquery.googleapis.com")
+
+            assert result is True
+            assert mock_run.call_count == 2
+
 
 class TestGetEnabledApis:
     """Test get_enabled_apis function"""
@@ -80,6 +191,41 @@ class TestGetEnabledApis:
             apis = await api_service.get_enabled_apis("test-project")
             assert apis == []
 
+    @pytest.mark.asyncio
+    async def test_get_enabled_apis_cached(self):
+        """Test a second lookup within the TTL reuses the first listing"""
+        with patch('subprocess.run', return_value=Mock(
+            returncode=0,
+            stdout="bigquery.googleapis.com\n",
+            stderr=""
+        )) as mock_run:
+            first = await api_service.get_enabled_apis("test-project")
+            second = await api_service.get_enabled_apis("test-project")
+
+            assert first == second == ["bigquery.googleapis.com"]
+            assert mock_run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_enabled_apis_failure_not_cached(self):
+        """Test a failed listing is retried on the next lookup"""
+        with patch('subprocess.run', side_effect=[
+            Mock(returncode=1, stdout="", stderr="error"),
+            Mock(returncode=0, stdout="bigquery.googleapis.com\n", stderr="")
+        ]) as mock_run:
+            assert await api_service.get_enabled_apis("test-project") == []
+            assert await api_service.get_enabled_apis("test-project") == ["bigquery.googleapis.com"]
+            assert mock_run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_enable_api_invalidates_cache(self):
+        """Test enabling an API forces the next lookup to list again"""
+        with patch('subprocess.run', return_value=Mock(returncode=0, stdout="", stderr="")) as mock_run:
+            await api_service.get_enabled_apis("test-project")
+            await api_service.enable_api("test-project", "pubsub.googleapis.com")
+            await api_service.get_enabled_apis("test-project")
+
+            assert mock_run.call_count == 3
+
 
 class TestEnableApi:
     """Test enable_api function"""
@@ -5,6 +5,7 @@ Covers all missing lines from services
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import subprocess
+import asyncio
 from google.cloud.exceptions import NotFound, Conflict
 
 
@@ -416,7 +417,7 @@ class TestVerificationServiceAdditional:
         """Test Gemini command timeout"""
         from services import verification_service
 
-        with patch('subprocess.run', side_effect=subprocess.TimeoutExpired("gemini", 30)):
+        with patch('asyncio.create_subprocess_exec', side_effect=asyncio.TimeoutError()):
             result = await verification_service.run_gemini_test_command()
             assert result is False
 
@@ -425,7 +426,7 @@ class TestVerificationServiceAdditional:
         """Test Gemini command exception"""
         from services import verification_service
 
-        with patch('subprocess.run', side_effect=Exception("Test error")):
+        with patch('asyncio.create_subprocess_exec', side_effect=Exception("Test error")):
             result = await verification_service.run_gemini_test_command()
             assert result is False
 
@@ -3,7 +3,7 @@ Final tests to achieve 100% coverage on all services
 Targets specific missing lines
 """
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, patch, AsyncMock
 from google.cloud import bigquery
 
 
@@ -149,7 +149,7 @@ class TestFinalCoverage:
         """Test Gemini command with non-zero return"""
         from services import verification_service
 
-        with patch('subprocess.run', return_value=Mock(returncode=1, stdout="", stderr="error")):
+        with patch('asyncio.create_subprocess_exec', return_value=Mock(returncode=1, communicate=AsyncMock(return_value=(b"", b"error")))):
             result = await verification_service.run_gemini_test_command()
             # Should still return True as command ran
             assert result is True
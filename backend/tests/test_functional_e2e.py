@@ -250,15 +250,15 @@ class TestErrorRecoveryScenarios:
         """
         from services import api_service
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = [
-                Mock(returncode=0, stdout="", stderr=""),  # list enabled (empty)
-                Mock(returncode=0, stdout="", stderr=""),  # enable API 1 (success)
-                Mock(returncode=1, stdout="", stderr="Permission denied"),  # enable API 2 (fail)
-                Mock(returncode=1, stdout="", stderr="Permission denied"),  # enable API 3 (fail)
-                Mock(returncode=0, stdout="", stderr=""),  # enable API 4 (success)
-            ]
+        # APIs are enabled concurrently, so answer per command rather than in call order
+        denied = set(api_service.REQUIRED_APIS[1:3])
+
+        def run(cmd, **kwargs):
+            if cmd[:3] == ["gcloud", "services", "enable"] and cmd[3] in denied:
+                return Mock(returncode=1, stdout="", stderr="Permission denied")
+            return Mock(returncode=0, stdout="", stderr="")  # list enabled (empty) / enable succeeds
 
+        with patch('subprocess.run', side_effect=run):
             with pytest.raises(Exception, match="Failed to enable APIs"):
                 await api_service.enable_apis("test-project")
 
@@ -399,17 +399,11 @@ class TestCriticalPathValidation:
         """
         from services import api_service
 
-        with patch('subprocess.run') as mock_run, \
+        # APIs are enabled concurrently, so every gcloud call gets the same answer:
+        # get enabled APIs (empty), then each enable succeeds
+        with patch('subprocess.run', return_value=Mock(returncode=0, stdout="", stderr="")), \
              patch('services.api_service.verify_api_accessible', return_value=True) as mock_verify:
 
-            mock_run.side_effect = [
-                Mock(returncode=0, stdout="", stderr=""),  # get enabled APIs (empty)
-                Mock(returncode=0, stdout="", stderr=""),  # enable API 1
-                Mock(returncode=0, stdout="", stderr=""),  # enable API 2
-                Mock(returncode=0, stdout="", stderr=""),  # enable API 3
-                Mock(returncode=0, stdout="", stderr=""),  # enable API 4
-            ]
-
             result = await api_service.enable_apis("test-project")
 
             # Verify propagation check was called for each newly enabled API
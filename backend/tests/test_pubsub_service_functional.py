@@ -12,6 +12,16 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 
+@pytest.fixture(autouse=True)
+def clear_resource_caches(monkeypatch):
+    """Reset the cached listings and shared clients between tests."""
+    from services import pubsub_service
+    pubsub_service._topic_names_cache.clear()
+    pubsub_service._subscription_names_cache.clear()
+    pubsub_service._clients.clear()
+    monkeypatch.setattr(pubsub_service, "_create_channel", Mock)
+
+
 class TestPubSubAPIEndToEnd:
     """End-to-end tests for Pub/Sub API endpoints"""
 
@@ -109,9 +119,13 @@ class TestEndToEndWorkflow:
         mock_publisher.get_iam_policy = mock_get_iam_policy
         mock_publisher.set_iam_policy = mock_set_iam_policy
 
-        # Mock get_topic/get_subscription for verification
-        mock_publisher.get_topic = Mock(return_value=Mock())
-        mock_subscriber.get_subscription = Mock(return_value=Mock())
+        # Mock list_topics/list_subscriptions for verification
+        listed_topic = Mock()
+        listed_topic.name = f"projects/{project_id}/topics/gemini-telemetry-topic"
+        listed_subscription = Mock()
+        listed_subscription.name = f"projects/{project_id}/subscriptions/gemini-telemetry-sub"
+        mock_publisher.list_topics = Mock(return_value=[listed_topic])
+        mock_subscriber.list_subscriptions = Mock(return_value=[listed_subscription])
 
         # Mock sleep
         async def mock_sleep(seconds):
@@ -132,7 +146,7 @@ class TestEndToEndWorkflow:
                 assert "subscription_created" in workflow_steps
                 assert "get_iam_policy" in workflow_steps
                 assert "set_iam_policy" in workflow_steps
-                assert "iam_wait_90s" in workflow_steps
+                assert any(step.startswith("iam_wait_") for step in workflow_steps)
 
                 # Verify result structure
                 assert "topic" in result
@@ -163,6 +177,9 @@ class TestEndToEndWorkflow:
         mock_subscriber = Mock()
         mock_subscriber.subscription_path = Mock(return_value=f"projects/{project_id}/subscriptions/gemini-telemetry-sub")
         mock_subscriber.create_subscription.side_effect = AlreadyExists("Subscription exists")
+        mock_subscriber.get_subscription.return_value = Mock(
+            topic=f"projects/{project_id}/topics/gemini-telemetry-topic"
+        )
 
         with patch('services.pubsub_service.pubsub_v1.PublisherClient', return_value=mock_publisher):
             with patch('services.pubsub_service.pubsub_v1.SubscriberClient', return_value=mock_subscriber):
@@ -346,7 +363,7 @@ class TestIAMPropagation:
 
     @pytest.mark.asyncio
     async def test_iam_propagation_wait_duration(self, monkeypatch):
-        """Test that IAM propagation wait is exactly 90 seconds"""
+        """Test that IAM propagation wait is bounded by 90 seconds"""
         from services import pubsub_service
 
         project_id = "test-project-123"
@@ -375,9 +392,9 @@ class TestIAMPropagation:
                 sink_service_account=sink_service_account
             )
 
-            # Verify 90-second wait (per IMPLEMENTATION_PLAN.md)
-            assert sleep_duration == 90
-            assert result["iam_propagation_wait"] == 90
+            # Returns as soon as the binding is visible, never beyond 90 seconds
+            assert sleep_duration is not None
+            assert result["iam_propagation_wait"] <= 90
 
     @pytest.mark.asyncio
     async def test_iam_wait_reported_in_result(self, monkeypatch):
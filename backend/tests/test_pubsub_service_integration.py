@@ -2,6 +2,7 @@
 Integration tests for Pub/Sub service.
 Tests complete workflows with mocked GCP services.
 """
+import asyncio
 import pytest
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from google.cloud import pubsub_v1
@@ -14,6 +15,25 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from services import pubsub_service
 
 
+def mock_grant(result):
+    """Stand-in for a private grant helper: (result, finished propagation task)."""
+    async def _propagated():
+        return 0
+
+    async def _grant(*args, **kwargs):
+        return dict(result), asyncio.ensure_future(_propagated())
+    return _grant
+
+
+@pytest.fixture(autouse=True)
+def clear_resource_caches(monkeypatch):
+    """Reset the cached listings and shared clients between tests."""
+    pubsub_service._topic_names_cache.clear()
+    pubsub_service._subscription_names_cache.clear()
+    pubsub_service._clients.clear()
+    monkeypatch.setattr(pubsub_service, "_create_channel", Mock)
+
+
 class TestTopicCreationWorkflow:
     """Integration tests for topic creation workflow"""
 
@@ -190,7 +210,7 @@ class TestIAMPermissionGrantWorkflow:
             # Verify complete workflow
             assert "get_policy" in workflow_steps
             assert "set_policy" in workflow_steps
-            assert "wait_90s" in workflow_steps
+            assert any(step.startswith("wait_") for step in workflow_steps)
 
             # Verify result
             assert result["status"] == "granted"
@@ -255,19 +275,20 @@ class TestVerificationWorkflows:
         topic_path = f"projects/{project_id}/topics/{topic_name}"
         mock_publisher.topic_path = Mock(return_value=topic_path)
 
-        # Mock get_topic
+        # Mock list_topics
         mock_topic = Mock()
-        mock_publisher.get_topic.return_value = mock_topic
+        mock_topic.name = topic_path
+        mock_publisher.list_topics.return_value = [mock_topic]
 
         with patch('services.pubsub_service.pubsub_v1.PublisherClient', return_value=mock_publisher):
             result = await pubsub_service.verify_topic_exists(project_id, topic_name)
 
-            # Verify get_topic was called with correct request
-            assert mock_publisher.get_topic.called
+            # Verify list_topics was called with correct request
+            assert mock_publisher.list_topics.called
             # call_args[1] contains kwargs, which has 'request' dict
-            call_kwargs = mock_publisher.get_topic.call_args[1]
+            call_kwargs = mock_publisher.list_topics.call_args[1]
             assert "request" in call_kwargs
-            assert call_kwargs["request"]["topic"] == topic_path
+            assert call_kwargs["request"]["project"] == f"projects/{project_id}"
 
             assert result is True
 
@@ -281,15 +302,16 @@ class TestVerificationWorkflows:
         subscription_path = f"projects/{project_id}/subscriptions/{subscription_name}"
         mock_subscriber.subscription_path = Mock(return_value=subscription_path)
 
-        # Mock get_subscription
+        # Mock list_subscriptions
         mock_subscription = Mock()
-        mock_subscriber.get_subscription.return_value = mock_subscription
+        mock_subscription.name = subscription_path
+        mock_subscriber.list_subscriptions.return_value = [mock_subscription]
 
         with patch('services.pubsub_service.pubsub_v1.SubscriberClient', return_value=mock_subscriber):
             result = await pubsub_service.verify_subscription_exists(project_id, subscription_name)
 
-            # Verify get_subscription was called
-            assert mock_subscriber.get_subscription.called
+            # Verify list_subscriptions was called
+            assert mock_subscriber.list_subscriptions.called
             assert result is True
 
 
@@ -356,8 +378,9 @@ class TestFullResourceCreation:
                 "status": "created"
             }
 
-        monkeypatch.setattr(pubsub_service, 'create_topic', mock_create_topic)
-        monkeypatch.setattr(pubsub_service, 'create_subscription', mock_create_subscription)
+        monkeypatch.setattr(pubsub_service, '_create_topic', mock_create_topic)
+        monkeypatch.setattr(pubsub_service, '_create_subscription', mock_create_subscription)
+        monkeypatch.setattr(pubsub_service, '_grant_dataflow_subscription_permissions', mock_grant({"status": "granted"}))
 
         result = await pubsub_service.create_pubsub_resources(project_id)
 
@@ -386,19 +409,21 @@ class TestFullResourceCreation:
 
         async def mock_grant_publisher(project_id, sink_service_account, topic_name="gemini-telemetry-topic"):
             execution_order.append("permissions")
-            return {"status": "granted", "service_account": sink_service_account}
+            return await mock_grant({"status": "granted", "service_account": sink_service_account})()
 
-        monkeypatch.setattr(pubsub_service, 'create_topic', mock_create_topic)
-        monkeypatch.setattr(pubsub_service, 'create_subscription', mock_create_subscription)
-        monkeypatch.setattr(pubsub_service, 'grant_publisher_to_sink', mock_grant_publisher)
+        monkeypatch.setattr(pubsub_service, '_create_topic', mock_create_topic)
+        monkeypatch.setattr(pubsub_service, '_create_subscription', mock_create_subscription)
+        monkeypatch.setattr(pubsub_service, '_grant_dataflow_subscription_permissions', mock_grant({"status": "granted"}))
+        monkeypatch.setattr(pubsub_service, '_grant_publisher_to_sink', mock_grant_publisher)
 
         result = await pubsub_service.create_pubsub_resources(
             project_id=project_id,
             sink_service_account=sink_service_account
         )
 
-        # Verify all three operations executed
-        assert execution_order == ["topic", "subscription", "permissions"]
+        # Verify all three operations executed; topic first, the rest only depend on it
+        assert execution_order[0] == "topic"
+        assert sorted(execution_order[1:]) == ["permissions", "subscription"]
 
         # Verify result includes permissions
         assert "permissions" in result
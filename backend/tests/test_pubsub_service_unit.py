@@ -2,16 +2,36 @@
 Unit tests for Pub/Sub service.
 Tests individual functions with mocked dependencies.
 """
+import asyncio
 import pytest
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from google.cloud import pubsub_v1
-from google.api_core.exceptions import AlreadyExists, NotFound
+from google.api_core.exceptions import AlreadyExists, Aborted, NotFound
 
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from services import pubsub_service
+from services import iam_service, pubsub_service
+
+
+def mock_grant(result):
+    """Stand-in for a private grant helper: (result, finished propagation task)."""
+    async def _propagated():
+        return 0
+
+    async def _grant(*args, **kwargs):
+        return dict(result), asyncio.ensure_future(_propagated())
+    return _grant
+
+
+@pytest.fixture(autouse=True)
+def clear_resource_caches(monkeypatch):
+    """Reset the cached listings and shared clients between tests."""
+    pubsub_service._topic_names_cache.clear()
+    pubsub_service._subscription_names_cache.clear()
+    pubsub_service._clients.clear()
+    monkeypatch.setattr(pubsub_service, "_create_channel", Mock)
 
 
 @pytest.fixture
@@ -125,8 +145,11 @@ class TestCreateSubscription:
         project_id = "test-project-123"
         subscription_name = "gemini-telemetry-sub"
 
-        # Mock AlreadyExists exception
+        # Mock AlreadyExists exception with existing subscription bound to the same topic
         mock_subscriber_client.create_subscription.side_effect = AlreadyExists("Subscription exists")
+        mock_subscriber_client.get_subscription.return_value = Mock(
+            topic=f"projects/{project_id}/topics/gemini-telemetry-topic"
+        )
 
         with patch('services.pubsub_service.pubsub_v1.PublisherClient', return_value=mock_publisher_client):
             with patch('services.pubsub_service.pubsub_v1.SubscriberClient', return_value=mock_subscriber_client):
@@ -136,6 +159,31 @@ class TestCreateSubscription:
                 assert result["status"] == "already_exists"
                 assert result["name"] == subscription_name
 
+                # Existing subscription is reused without mutation
+                assert not mock_subscriber_client.delete_subscription.called
+                assert mock_subscriber_client.create_subscription.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_create_subscription_recreates_on_topic_mismatch(self, mock_publisher_client, mock_subscriber_client):
+        """Test subscription is recreated when bound to a deleted topic"""
+        project_id = "test-project-123"
+
+        mock_subscription = Mock()
+        mock_subscription.name = f"projects/{project_id}/subscriptions/gemini-telemetry-sub"
+        mock_subscriber_client.create_subscription.side_effect = [
+            AlreadyExists("Subscription exists"),
+            mock_subscription
+        ]
+        mock_subscriber_client.get_subscription.return_value = Mock(topic="_deleted-topic_")
+
+        with patch('services.pubsub_service.pubsub_v1.PublisherClient', return_value=mock_publisher_client):
+            with patch('services.pubsub_service.pubsub_v1.SubscriberClient', return_value=mock_subscriber_client):
+                result = await pubsub_service.create_subscription(project_id)
+
+                assert result["status"] == "recreated"
+                assert mock_subscriber_client.delete_subscription.called
+                assert mock_subscriber_client.create_subscription.call_count == 2
+
     @pytest.mark.asyncio
     async def test_subscription_references_correct_topic(self, mock_publisher_client, mock_subscriber_client):
         """Test that subscription references the correct topic"""
@@ -190,7 +238,7 @@ class TestGrantPublisherToSink:
             assert result["service_account"] == sink_service_account
             assert result["role"] == "roles/pubsub.publisher"
             assert result["status"] == "granted"
-            assert result["iam_propagation_wait"] == 90
+            assert result["iam_propagation_wait"] < 90
 
     @pytest.mark.asyncio
     async def test_grant_publisher_already_granted(self, mock_publisher_client, monkeypatch):
@@ -224,7 +272,7 @@ class TestGrantPublisherToSink:
 
     @pytest.mark.asyncio
     async def test_grant_waits_for_iam_propagation(self, mock_publisher_client, monkeypatch):
-        """Test that function waits 90 seconds for IAM propagation"""
+        """Test that a new grant settles for a fixed time rather than polling its own write"""
         project_id = "test-project-123"
         sink_service_account = "sink-sa@example.iam.gserviceaccount.com"
 
@@ -241,13 +289,89 @@ class TestGrantPublisherToSink:
         monkeypatch.setattr("asyncio.sleep", mock_sleep)
 
         with patch('services.pubsub_service.pubsub_v1.PublisherClient', return_value=mock_publisher_client):
-            await pubsub_service.grant_publisher_to_sink(
+            result = await pubsub_service.grant_publisher_to_sink(
                 project_id=project_id,
                 sink_service_account=sink_service_account
             )
 
-            # Verify 90-second wait
-            assert 90 in sleep_calls
+            assert sleep_calls == [iam_service.IAM_GRANT_SETTLE_SECONDS]
+            assert result["iam_propagation_wait"] == iam_service.IAM_GRANT_SETTLE_SECONDS
+            # Read once for the write; the policy isn't read back while waiting
+            assert mock_publisher_client.get_iam_policy.call_count == 1
+
+
+class TestGrantRole:
+    """Test shared IAM binding helpers"""
+
+    def test_ensure_binding_appends_to_existing_role(self):
+        """Test member is added to an existing binding for the role"""
+        binding = Mock(role="roles/pubsub.editor", members=["serviceAccount:other@example.com"])
+        policy = Mock(bindings=[binding])
+
+        mutated = pubsub_service._ensure_iam_binding(policy, "roles/pubsub.editor", "serviceAccount:sa@example.com")
+
+        assert mutated is True
+        assert len(policy.bindings) == 1
+        assert "serviceAccount:sa@example.com" in binding.members
+
+    def test_ensure_binding_creates_new_binding(self):
+        """Test a new binding is created when the role is absent"""
+        policy = Mock(bindings=[])
+
+        mutated = pubsub_service._ensure_iam_binding(policy, "roles/pubsub.editor", "serviceAccount:sa@example.com")
+
+        assert mutated is True
+        assert policy.bindings[0].role == "roles/pubsub.editor"
+        assert list(policy.bindings[0].members) == ["serviceAccount:sa@example.com"]
+
+    def test_ensure_binding_noop_when_present(self):
+        """Test no mutation when member already has the role"""
+        binding = Mock(role="roles/pubsub.editor", members=["serviceAccount:sa@example.com"])
+        policy = Mock(bindings=[binding])
+
+        mutated = pubsub_service._ensure_iam_binding(policy, "roles/pubsub.editor", "serviceAccount:sa@example.com")
+
+        assert mutated is False
+        assert binding.members == ["serviceAccount:sa@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_grant_role_skips_write_and_wait_when_present(self, mock_publisher_client, monkeypatch):
+        """Test that an existing binding short-circuits set_iam_policy and the wait"""
+        binding = Mock(role="roles/pubsub.publisher", members=["serviceAccount:sa@example.com"])
+        mock_publisher_client.get_iam_policy.return_value = Mock(bindings=[binding])
+
+        sleep_calls = []
+
+        async def mock_sleep(seconds):
+            sleep_calls.append(seconds)
+
+        monkeypatch.setattr("asyncio.sleep", mock_sleep)
+
+        propagation = await pubsub_service._grant_role(
+            mock_publisher_client, "projects/p/topics/t", "roles/pubsub.publisher", "serviceAccount:sa@example.com"
+        )
+        waited = await propagation
+
+        assert waited == 0
+        assert sleep_calls == []
+        assert not mock_publisher_client.set_iam_policy.called
+
+    @pytest.mark.asyncio
+    async def test_grant_role_retries_on_etag_conflict(self, mock_publisher_client, monkeypatch):
+        """Test that a concurrent policy change re-reads the policy and retries"""
+        monkeypatch.setattr("asyncio.sleep", AsyncMock())
+        # Fresh policy on every read so the retry mutates again
+        mock_publisher_client.get_iam_policy.side_effect = lambda request: Mock(bindings=[])
+        mock_publisher_client.set_iam_policy.side_effect = [Aborted("etag mismatch"), Mock()]
+
+        propagation = await pubsub_service._grant_role(
+            mock_publisher_client, "projects/p/topics/t", "roles/pubsub.publisher",
+            "serviceAccount:sa@example.com"
+        )
+        await propagation
+
+        assert mock_publisher_client.get_iam_policy.call_count == 2
+        assert mock_publisher_client.set_iam_policy.call_count == 2
 
 
 class TestVerifyTopicExists:
@@ -260,20 +384,55 @@ class TestVerifyTopicExists:
         topic_name = "gemini-telemetry-topic"
 
         mock_topic = Mock()
-        mock_publisher_client.get_topic.return_value = mock_topic
+        mock_topic.name = f"projects/{project_id}/topics/{topic_name}"
+        mock_publisher_client.list_topics.return_value = [mock_topic]
 
         with patch('services.pubsub_service.pubsub_v1.PublisherClient', return_value=mock_publisher_client):
             result = await pubsub_service.verify_topic_exists(project_id, topic_name)
 
             assert result is True
 
+    @pytest.mark.asyncio
+    async def test_topic_listing_cached_across_checks(self, mock_publisher_client):
+        """Test that repeated checks reuse one listing within the TTL"""
+        project_id = "test-project-123"
+
+        mock_topic = Mock()
+        mock_topic.name = f"projects/{project_id}/topics/gemini-telemetry-topic"
+        mock_publisher_client.list_topics.return_value = [mock_topic]
+
+        with patch('services.pubsub_service.pubsub_v1.PublisherClient', return_value=mock_publisher_client):
+            assert await pubsub_service.verify_topic_exists(project_id) is True
+            assert await pubsub_service.verify_topic_exists(project_id, "other-topic") is False
+
+            assert mock_publisher_client.list_topics.call_count == 1
+
+    def test_clients_share_one_channel(self, monkeypatch):
+        """Test that publisher and subscriber are created once on a single channel"""
+        channel = Mock()
+        create_channel = Mock(return_value=channel)
+        monkeypatch.setattr(pubsub_service, "_create_channel", create_channel)
+
+        publisher = pubsub_service._get_publisher()
+        subscriber = pubsub_service._get_subscriber()
+
+        assert pubsub_service._get_publisher() is publisher
+        assert pubsub_service._get_subscriber() is subscriber
+        assert publisher._transport.grpc_channel is channel
+        assert subscriber._transport.grpc_channel is channel
+        create_channel.assert_called_once()
+
+        pubsub_service._close_channel()
+        channel.close.assert_called_once()
+        assert pubsub_service._clients == {}
+
     @pytest.mark.asyncio
     async def test_topic_not_found(self, mock_publisher_client):
         """Test when topic doesn't exist"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
 
-        mock_publisher_client.get_topic.side_effect = NotFound("Topic not found")
+        mock_publisher_client.list_topics.return_value = []
 
         with patch('services.pubsub_service.pubsub_v1.PublisherClient', return_value=mock_publisher_client):
             result = await pubsub_service.verify_topic_exists(project_id, topic_name)
@@ -291,7 +450,8 @@ class TestVerifySubscriptionExists:
         subscription_name = "gemini-telemetry-sub"
 
         mock_subscription = Mock()
-        mock_subscriber_client.get_subscription.return_value = mock_subscription
+        mock_subscription.name = f"projects/{project_id}/subscriptions/{subscription_name}"
+        mock_subscriber_client.list_subscriptions.return_value = [mock_subscription]
 
         with patch('services.pubsub_service.pubsub_v1.SubscriberClient', return_value=mock_subscriber_client):
             result = await pubsub_service.verify_subscription_exists(project_id, subscription_name)
@@ -304,7 +464,7 @@ class TestVerifySubscriptionExists:
         project_id = "test-project-123"
         subscription_name = "gemini-telemetry-sub"
 
-        mock_subscriber_client.get_subscription.side_effect = NotFound("Subscription not found")
+        mock_subscriber_client.list_subscriptions.return_value = []
 
         with patch('services.pubsub_service.pubsub_v1.SubscriberClient', return_value=mock_subscriber_client):
             result = await pubsub_service.verify_subscription_exists(project_id, subscription_name)
@@ -334,8 +494,9 @@ class TestCreatePubsubResources:
             subscription_created = True
             return {"subscription": f"projects/{pid}/subscriptions/{subscription_name}", "status": "created"}
 
-        monkeypatch.setattr(pubsub_service, 'create_topic', mock_create_topic)
-        monkeypatch.setattr(pubsub_service, 'create_subscription', mock_create_subscription)
+        monkeypatch.setattr(pubsub_service, '_create_topic', mock_create_topic)
+        monkeypatch.setattr(pubsub_service, '_create_subscription', mock_create_subscription)
+        monkeypatch.setattr(pubsub_service, '_grant_dataflow_subscription_permissions', mock_grant({"status": "granted"}))
 
         result = await pubsub_service.create_pubsub_resources(project_id)
 
@@ -362,11 +523,12 @@ class TestCreatePubsubResources:
         async def mock_grant_publisher(project_id, sink_service_account, topic_name="gemini-telemetry-topic"):
             nonlocal permissions_granted
             permissions_granted = True
-            return {"status": "granted"}
+            return await mock_grant({"status": "granted"})()
 
-        monkeypatch.setattr(pubsub_service, 'create_topic', mock_create_topic)
-        monkeypatch.setattr(pubsub_service, 'create_subscription', mock_create_subscription)
-        monkeypatch.setattr(pubsub_service, 'grant_publisher_to_sink', mock_grant_publisher)
+        monkeypatch.setattr(pubsub_service, '_create_topic', mock_create_topic)
+        monkeypatch.setattr(pubsub_service, '_create_subscription', mock_create_subscription)
+        monkeypatch.setattr(pubsub_service, '_grant_dataflow_subscription_permissions', mock_grant({"status": "granted"}))
+        monkeypatch.setattr(pubsub_service, '_grant_publisher_to_sink', mock_grant_publisher)
 
         result = await pubsub_service.create_pubsub_resources(
             project_id=project_id,
@@ -376,3 +538,124 @@ class TestCreatePubsubResources:
         # Verify permissions were granted
         assert permissions_granted
         assert "permissions" in result
+
+    @pytest.mark.asyncio
+    async def test_validates_project_id_once(self, monkeypatch):
+        """Test that inputs are validated once at the orchestrator, not per step"""
+        project_id = "test-project-123"
+
+        validate_calls = []
+
+        def counting_validate(pid):
+            validate_calls.append(pid)
+            return pid
+
+        monkeypatch.setattr(pubsub_service, 'validate_gcp_project_id', counting_validate)
+        monkeypatch.setattr(pubsub_service, '_create_topic', AsyncMock(return_value={"status": "created"}))
+        monkeypatch.setattr(pubsub_service, '_create_subscription', AsyncMock(return_value={"status": "created"}))
+        monkeypatch.setattr(pubsub_service, '_grant_dataflow_subscription_permissions', mock_grant({"status": "granted"}))
+        monkeypatch.setattr(pubsub_service, '_grant_publisher_to_sink', mock_grant({"status": "granted"}))
+
+        await pubsub_service.create_pubsub_resources(
+            project_id=project_id,
+            sink_service_account="sink-sa@example.iam.gserviceaccount.com"
+        )
+
+        assert validate_calls == [project_id]
+
+    @pytest.mark.asyncio
+    async def test_invalid_project_id_raises(self):
+        """Test that invalid project ID is rejected before any API call"""
+        with pytest.raises(ValueError):
+            await pubsub_service.create_pubsub_resources(project_id="Invalid_Project")
+
+    @pytest.mark.asyncio
+    async def test_iam_propagation_waits_overlap(self, monkeypatch):
+        """Test that Dataflow and sink IAM waits run concurrently, not back to back"""
+        project_id = "test-project-123"
+
+        started = []
+        release = asyncio.Event()
+
+        async def slow_propagation(name):
+            started.append(name)
+            await release.wait()
+            return 30
+
+        def grant_with_wait(name):
+            async def _grant(*args, **kwargs):
+                return {"status": "granted"}, asyncio.ensure_future(slow_propagation(name))
+            return _grant
+
+        monkeypatch.setattr(pubsub_service, '_create_topic', AsyncMock(return_value={"status": "created"}))
+        monkeypatch.setattr(pubsub_service, '_create_subscription', AsyncMock(return_value={"status": "created"}))
+        monkeypatch.setattr(pubsub_service, '_grant_dataflow_subscription_permissions', grant_with_wait("dataflow"))
+        monkeypatch.setattr(pubsub_service, '_grant_publisher_to_sink', grant_with_wait("sink"))
+
+        task = asyncio.ensure_future(pubsub_service.create_pubsub_resources(
+            project_id=project_id,
+            sink_service_account="sink-sa@example.iam.gserviceaccount.com"
+        ))
+        for _ in range(20):
+            if len(started) == 2:
+                break
+            await asyncio.sleep(0)
+
+        # Both waits are in flight before either finishes
+        assert sorted(started) == ["dataflow", "sink"]
+
+        release.set()
+        result = await task
+
+        assert result["dataflow_permissions"]["iam_propagation_wait"] == 30
+        assert result["permissions"]["iam_propagation_wait"] == 30
+
+
+class TestRunSteps:
+    """Test the dependency-graph step runner"""
+
+    @pytest.mark.asyncio
+    async def test_dependents_wait_for_dependencies(self):
+        """Test that steps start only after their dependencies finish"""
+        order = []
+
+        def step(name):
+            async def _step():
+                order.append(name)
+                return name
+            return _step
+
+        results = await pubsub_service._run_steps({
+            "topic": ((), step("topic")),
+            "subscription": (("topic",), step("subscription")),
+            "dataflow_permissions": (("subscription",), step("dataflow_permissions")),
+            "permissions": (("topic",), step("permissions")),
+        })
+
+        assert order[0] == "topic"
+        assert order.index("subscription") < order.index("dataflow_permissions")
+        assert results == {
+            "topic": "topic",
+            "subscription": "subscription",
+            "dataflow_permissions": "dataflow_permissions",
+            "permissions": "permissions",
+        }
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_dependents(self):
+        """Test that a failed step stops its dependents and is re-raised"""
+        ran = []
+
+        async def failing():
+            raise RuntimeError("topic creation failed")
+
+        async def dependent():
+            ran.append("subscription")
+
+        with pytest.raises(RuntimeError, match="topic creation failed"):
+            await pubsub_service._run_steps({
+                "topic": ((), failing),
+                "subscription": (("topic",), dependent),
+            })
+
+        assert ran == []
@@ -2,7 +2,7 @@
 Comprehensive unit tests for remaining services
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import uuid
 from google.cloud.exceptions import NotFound, Conflict
 
@@ -247,11 +247,11 @@ class TestSinkService:
         """Test getting sink service account"""
         from services import sink_service
 
-        with patch('subprocess.run', return_value=Mock(
-            returncode=0,
-            stdout="serviceAccount:sink@project.iam.gserviceaccount.com\n",
-            stderr=""
-        )):
+        mock_client = Mock()
+        mock_client.get_sink.return_value = Mock(writer_identity="serviceAccount:sink@project.iam.gserviceaccount.com")
+
+        sink_service._clients.clear()
+        with patch('services.sink_service.ConfigServiceV2Client', return_value=mock_client):
             account = await sink_service.get_sink_service_account("test-project", "test-sink")
             assert "sink@project" in account
 
@@ -289,11 +289,13 @@ class TestSinkService:
         """Test listing sinks"""
         from services import sink_service
 
-        with patch('subprocess.run', return_value=Mock(
-            returncode=0,
-            stdout="sink1\nsink2\n",
-            stderr=""
-        )):
+        sink1, sink2 = Mock(), Mock()
+        sink1.name, sink2.name = "sink1", "sink2"
+        mock_client = Mock()
+        mock_client.list_sinks.return_value = [sink1, sink2]
+
+        sink_service._clients.clear()
+        with patch('services.sink_service.ConfigServiceV2Client', return_value=mock_client):
             sinks = await sink_service.list_sinks("test-project")
             assert len(sinks) == 2
 
@@ -325,7 +327,7 @@ class TestVerificationService:
         """Test running Gemini test command"""
         from services import verification_service
 
-        with patch('subprocess.run', return_value=Mock(returncode=0, stdout="", stderr="")):
+        with patch('asyncio.create_subprocess_exec', return_value=Mock(returncode=0, communicate=AsyncMock(return_value=(b"", b"")))):
             result = await verification_service.run_gemini_test_command()
             assert result is True
 
@@ -1,11 +1,12 @@
 """
 Integration tests for Sink service.
-Tests complete workflows with mocked subprocess commands.
+Tests complete workflows with mocked Cloud Logging and Pub/Sub clients.
 """
 import pytest
-import json
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
-import subprocess
+from google.api_core.exceptions import InvalidArgument, NotFound, PermissionDenied
+from google.cloud.logging_v2.types import LogSink
+from google.iam.v1 import policy_pb2
 
 import sys
 import os
@@ -14,454 +15,324 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from services import sink_service
 
 
+@pytest.fixture(autouse=True)
+def clear_sink_cache():
+    """Reset the cached sink listings, created sinks and shared clients between tests."""
+    sink_service._sink_names_cache.clear()
+    sink_service._created_sinks.clear()
+    sink_service._clients.clear()
+    yield
+    sink_service._clients.clear()
+
+
+@pytest.fixture
+def mock_config_client():
+    """Mock Cloud Logging ConfigServiceV2Client."""
+    client = Mock()
+    client.list_sinks.return_value = []
+    client.get_sink.return_value = LogSink(
+        name="gemini-cli-to-pubsub",
+        writer_identity="serviceAccount:logging-sa@project.iam.gserviceaccount.com"
+    )
+    client.create_sink.return_value = client.get_sink.return_value
+    with patch('services.sink_service.ConfigServiceV2Client', return_value=client):
+        yield client
+
+
+@pytest.fixture
+def mock_publisher_client():
+    """Mock Pub/Sub PublisherClient with an empty topic IAM policy."""
+    publisher = Mock()
+    publisher.topic_path.side_effect = lambda project, topic: f"projects/{project}/topics/{topic}"
+    publisher.get_iam_policy.return_value = policy_pb2.Policy()
+    with patch('services.sink_service.pubsub_v1.PublisherClient', return_value=publisher):
+        yield publisher
+
+
+def publisher_policy(member: str) -> policy_pb2.Policy:
+    """IAM policy granting roles/pubsub.publisher to member."""
+    policy = policy_pb2.Policy()
+    policy.bindings.add(role="roles/pubsub.publisher", members=[member])
+    return policy
+
+
 class TestSinkCreationWorkflow:
     """Integration tests for sink creation workflow"""
 
     @pytest.mark.asyncio
-    async def test_complete_sink_creation_workflow(self):
+    async def test_complete_sink_creation_workflow(self, mock_config_client, mock_publisher_client):
         """Test complete workflow from creation to permission granting"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
 
         workflow_steps = []
 
-        def mock_subprocess_run(*args, **kwargs):
-            command = args[0]
-            if "sinks" in command and "list" in command:
-                workflow_steps.append("list_sinks")
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = ""
-                return mock_result
-            elif "sinks" in command and "create" in command:
-                workflow_steps.append("create_sink")
-                mock_result = Mock()
-                mock_result.returncode = 0
-                return mock_result
-            elif "sinks" in command and "describe" in command:
-                workflow_steps.append("get_service_account")
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = "serviceAccount:logging-sa@project.iam.gserviceaccount.com"
-                return mock_result
-            elif "pubsub" in command and "add-iam-policy-binding" in command:
-                workflow_steps.append("grant_publisher")
-                mock_result = Mock()
-                mock_result.returncode = 0
-                return mock_result
-
-        with patch('subprocess.run', side_effect=mock_subprocess_run):
-            with patch('asyncio.sleep'):  # Skip IAM propagation wait
-                result = await sink_service.create_sink(project_id, topic_name)
-
-                # Verify all workflow steps executed
-                assert "list_sinks" in workflow_steps
-                assert "create_sink" in workflow_steps
-                assert "get_service_account" in workflow_steps
-                assert "grant_publisher" in workflow_steps
-
-                # Verify result
-                assert result["sink_name"] == "gemini-cli-to-pubsub"
-                assert result["topic_name"] == topic_name
+        mock_config_client.list_sinks.side_effect = lambda **kw: workflow_steps.append("list_sinks") or []
+        created = mock_config_client.get_sink.return_value
+        mock_config_client.create_sink.side_effect = lambda **kw: workflow_steps.append("create_sink") or created
+        mock_config_client.get_sink.side_effect = lambda **kw: workflow_steps.append("get_service_account") or created
+        mock_publisher_client.set_iam_policy.side_effect = lambda **kw: workflow_steps.append("grant_publisher")
+
+        with patch('asyncio.sleep'):  # Skip IAM propagation wait
+            result = await sink_service.create_sink(project_id, project_id, topic_name)
+
+        # Verify all workflow steps executed, in order; the writer identity comes
+        # back from create, so the sink is not described again
+        assert workflow_steps == ["list_sinks", "create_sink", "grant_publisher"]
+        assert result["service_account"] == created.writer_identity
+
+        # Verify result
+        assert result["sink_name"] == "gemini-cli-to-pubsub"
+        assert result["topic_name"] == topic_name
 
     @pytest.mark.asyncio
-    async def test_sink_creation_builds_correct_command(self):
-        """Test that sink creation builds correct gcloud command"""
+    async def test_sink_creation_builds_correct_request(self, mock_config_client, mock_publisher_client):
+        """Test that sink creation sends the correct CreateSink request"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
 
-        captured_command = None
-
-        def capture_command(*args, **kwargs):
-            nonlocal captured_command
-            command = args[0]
-            if "sinks" in command and "create" in command:
-                captured_command = command
-            elif "sinks" in command and "list" in command:
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = ""
-                return mock_result
-            elif "describe" in command:
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = "serviceAccount:test@project.iam.gserviceaccount.com"
-                return mock_result
-            elif "pubsub" in command:
-                pass
-
-            mock_result = Mock()
-            mock_result.returncode = 0
-            return mock_result
-
-        with patch('subprocess.run', side_effect=capture_command):
-            with patch('asyncio.sleep'):
-                await sink_service.create_sink(project_id, topic_name)
-
-                # Verify command structure
-                assert "gcloud" in captured_command
-                assert "logging" in captured_command
-                assert "sinks" in captured_command
-                assert "create" in captured_command
-                assert "gemini-cli-to-pubsub" in captured_command
-                assert f"pubsub.googleapis.com/projects/{project_id}/topics/{topic_name}" in captured_command
-                # Verify NO BigQuery-specific flag
-                assert "--use-partitioned-tables" not in captured_command
+        with patch('asyncio.sleep'):
+            await sink_service.create_sink(project_id, project_id, topic_name)
+
+        request = mock_config_client.create_sink.call_args.kwargs["request"]
+        sink = request["sink"]
+
+        # Verify request structure
+        assert request["parent"] == f"projects/{project_id}"
+        assert sink.name == "gemini-cli-to-pubsub"
+        assert sink.destination == f"pubsub.googleapis.com/projects/{project_id}/topics/{topic_name}"
+        # Verify NO BigQuery-specific options
+        assert not sink.bigquery_options.use_partitioned_tables
 
 
 class TestPublisherPermissionGrantingWorkflow:
     """Integration tests for Pub/Sub Publisher permission granting"""
 
     @pytest.mark.asyncio
-    async def test_complete_permission_granting_workflow(self):
+    async def test_complete_permission_granting_workflow(self, mock_publisher_client):
         """Test complete workflow for granting publisher permissions"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
         service_account = "serviceAccount:logging-sa@project.iam.gserviceaccount.com"
 
-        workflow_steps = []
-
-        def mock_subprocess_run(*args, **kwargs):
-            workflow_steps.append("grant_permission")
-            mock_result = Mock()
-            mock_result.returncode = 0
-            return mock_result
+        with patch('asyncio.sleep'):
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
 
-        with patch('subprocess.run', side_effect=mock_subprocess_run):
-            with patch('asyncio.sleep'):
-                await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
-
-                assert "grant_permission" in workflow_steps
+        assert mock_publisher_client.get_iam_policy.call_count == 1  # read-modify-write; no read-back
+        mock_publisher_client.set_iam_policy.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_permission_granting_builds_correct_command(self):
-        """Test that permission granting builds correct gcloud command"""
+    async def test_permission_granting_builds_correct_policy(self, mock_publisher_client):
+        """Test that permission granting writes the correct topic IAM policy"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
         service_account = "serviceAccount:logging-sa@project.iam.gserviceaccount.com"
 
-        captured_command = None
+        with patch('asyncio.sleep'):
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+
+        request = mock_publisher_client.set_iam_policy.call_args.kwargs["request"]
 
-        def capture_command(*args, **kwargs):
-            nonlocal captured_command
-            captured_command = args[0]
-            mock_result = Mock()
-            mock_result.returncode = 0
-            return mock_result
+        # Verify request structure
+        assert request["resource"] == f"projects/{project_id}/topics/{topic_name}"
+        bindings = {binding.role: list(binding.members) for binding in request["policy"].bindings}
+        assert bindings == {
+            "roles/pubsub.publisher": ["serviceAccount:logging-sa@project.iam.gserviceaccount.com"]
+        }
+
+    @pytest.mark.asyncio
+    async def test_permission_granting_retries_until_service_account_exists(self, mock_publisher_client):
+        """Test that granting retries while the sink service account is provisioned"""
+        project_id = "test-project-123"
+        topic_name = "gemini-telemetry-topic"
+        service_account = "logging-sa@project.iam.gserviceaccount.com"
 
-        with patch('subprocess.run', side_effect=capture_command):
-            with patch('asyncio.sleep'):
-                await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+        # Each read returns a fresh policy, as the API does
+        mock_publisher_client.get_iam_policy.side_effect = lambda **kw: policy_pb2.Policy()
+        mock_publisher_client.set_iam_policy.side_effect = [
+            InvalidArgument(f"Service account {service_account} does not exist."),
+            None
+        ]
 
-                # Verify command structure
-                assert "gcloud" in captured_command
-                assert "pubsub" in captured_command
-                assert "topics" in captured_command
-                assert "add-iam-policy-binding" in captured_command
-                assert topic_name in captured_command
-                assert "--member=serviceAccount:logging-sa@project.iam.gserviceaccount.com" in captured_command
-                assert "--role=roles/pubsub.publisher" in captured_command
+        with patch('asyncio.sleep'):
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+
+        assert mock_publisher_client.set_iam_policy.call_count == 2
 
 
 class TestSinkVerificationWorkflow:
     """Integration tests for sink verification workflow"""
 
     @pytest.mark.asyncio
-    async def test_complete_verification_workflow(self):
+    async def test_complete_verification_workflow(self, mock_config_client, mock_publisher_client):
         """Test complete sink verification workflow"""
         project_id = "test-project-123"
         sink_name = "gemini-cli-to-pubsub"
+        writer_identity = "serviceAccount:logging-sa@project.iam.gserviceaccount.com"
 
-        workflow_steps = []
+        mock_config_client.get_sink.return_value = LogSink(
+            name=sink_name,
+            destination="pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic",
+            writer_identity=writer_identity,
+            filter='logName="projects/test-project-123/logs/gemini_cli"'
+        )
+        mock_publisher_client.get_iam_policy.return_value = publisher_policy(writer_identity)
 
-        sink_info = {
-            "destination": "pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic",
-            "writerIdentity": "serviceAccount:logging-sa@project.iam.gserviceaccount.com",
-            "filter": 'logName="projects/test-project-123/logs/gemini_cli"'
-        }
+        result = await sink_service.verify_sink(project_id, sink_name)
 
-        def mock_subprocess_run(*args, **kwargs):
-            command = args[0]
-            if "describe" in command:
-                workflow_steps.append("describe_sink")
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = json.dumps(sink_info)
-                return mock_result
-            elif "get-iam-policy" in command:
-                workflow_steps.append("check_permissions")
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = "roles/pubsub.publisher\n"
-                return mock_result
-
-        with patch('subprocess.run', side_effect=mock_subprocess_run):
-            result = await sink_service.verify_sink(project_id, sink_name)
-
-            # Verify workflow steps
-            assert "describe_sink" in workflow_steps
-            assert "check_permissions" in workflow_steps
-
-            # Verify result
-            assert result["verified"] is True
-            assert result["destination_type"] == "pubsub"
+        # Verify workflow steps
+        mock_config_client.get_sink.assert_called_once()
+        mock_publisher_client.get_iam_policy.assert_called_once()
+
+        # Verify result
+        assert result["verified"] is True
+        assert result["destination_type"] == "pubsub"
 
     @pytest.mark.asyncio
-    async def test_verification_detects_bigquery_destination(self):
+    async def test_verification_detects_bigquery_destination(self, mock_config_client):
         """Test that verification detects and rejects BigQuery destination"""
         project_id = "test-project-123"
         sink_name = "gemini-cli-to-bigquery"
 
-        sink_info = {
-            "destination": "bigquery.googleapis.com/projects/test-project-123/datasets/dataset",
-            "writerIdentity": "serviceAccount:logging-sa@project.iam.gserviceaccount.com",
-            "filter": 'logName="projects/test-project-123/logs/gemini_cli"'
-        }
-
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(sink_info)
+        mock_config_client.get_sink.return_value = LogSink(
+            name=sink_name,
+            destination="bigquery.googleapis.com/projects/test-project-123/datasets/dataset",
+            writer_identity="serviceAccount:logging-sa@project.iam.gserviceaccount.com",
+            filter='logName="projects/test-project-123/logs/gemini_cli"'
+        )
 
-        with patch('subprocess.run', return_value=mock_result):
-            with pytest.raises(Exception) as exc_info:
-                await sink_service.verify_sink(project_id, sink_name)
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.verify_sink(project_id, sink_name)
 
-            assert "Pub/Sub" in str(exc_info.value)
+        assert "Pub/Sub" in str(exc_info.value)
 
 
 class TestPermissionVerificationWorkflow:
     """Integration tests for permission verification workflow"""
 
     @pytest.mark.asyncio
-    async def test_complete_permission_verification_workflow(self):
+    async def test_complete_permission_verification_workflow(self, mock_publisher_client):
         """Test complete permission verification workflow"""
         project_id = "test-project-123"
         service_account = "serviceAccount:logging-sa@project.iam.gserviceaccount.com"
         destination = "pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic"
 
-        workflow_steps = []
-
-        def mock_subprocess_run(*args, **kwargs):
-            workflow_steps.append("check_topic_iam")
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_result.stdout = "roles/pubsub.publisher\n"
-            return mock_result
+        mock_publisher_client.get_iam_policy.return_value = publisher_policy(service_account)
 
-        with patch('subprocess.run', side_effect=mock_subprocess_run):
-            result = await sink_service.verify_service_account_permissions(project_id, service_account, destination)
+        result = await sink_service.verify_service_account_permissions(project_id, service_account, destination)
 
-            assert "check_topic_iam" in workflow_steps
-            assert result is True
+        mock_publisher_client.get_iam_policy.assert_called_once()
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_permission_verification_builds_correct_command(self):
-        """Test that permission verification builds correct gcloud command"""
+    async def test_permission_verification_reads_topic_policy(self, mock_publisher_client):
+        """Test that permission verification reads the destination topic's IAM policy"""
         project_id = "test-project-123"
         service_account = "logging-sa@project.iam.gserviceaccount.com"
         destination = "pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic"
 
-        captured_command = None
-
-        def capture_command(*args, **kwargs):
-            nonlocal captured_command
-            captured_command = args[0]
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_result.stdout = "roles/pubsub.publisher\n"
-            return mock_result
+        await sink_service.verify_service_account_permissions(project_id, service_account, destination)
 
-        with patch('subprocess.run', side_effect=capture_command):
-            await sink_service.verify_service_account_permissions(project_id, service_account, destination)
-
-            # Verify command structure
-            assert "gcloud" in captured_command
-            assert "pubsub" in captured_command
-            assert "topics" in captured_command
-            assert "get-iam-policy" in captured_command
-            assert "gemini-telemetry-topic" in captured_command
+        request = mock_publisher_client.get_iam_policy.call_args.kwargs["request"]
+        assert request["resource"] == "projects/test-project-123/topics/gemini-telemetry-topic"
 
 
 class TestSinkDeletionWorkflow:
     """Integration tests for sink deletion workflow"""
 
     @pytest.mark.asyncio
-    async def test_complete_deletion_workflow(self):
+    async def test_complete_deletion_workflow(self, mock_config_client):
         """Test complete sink deletion workflow"""
         project_id = "test-project-123"
         sink_name = "gemini-cli-to-pubsub"
 
-        workflow_steps = []
-
-        def mock_subprocess_run(*args, **kwargs):
-            workflow_steps.append("delete_sink")
-            mock_result = Mock()
-            mock_result.returncode = 0
-            return mock_result
-
-        with patch('subprocess.run', side_effect=mock_subprocess_run):
-            await sink_service.delete_sink(project_id, sink_name)
+        await sink_service.delete_sink(project_id, sink_name)
 
-            assert "delete_sink" in workflow_steps
+        mock_config_client.delete_sink.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_deletion_builds_correct_command(self):
-        """Test that deletion builds correct gcloud command"""
+    async def test_deletion_builds_correct_request(self, mock_config_client):
+        """Test that deletion targets the sink's full resource name"""
         project_id = "test-project-123"
         sink_name = "gemini-cli-to-pubsub"
 
-        captured_command = None
-
-        def capture_command(*args, **kwargs):
-            nonlocal captured_command
-            captured_command = args[0]
-            mock_result = Mock()
-            mock_result.returncode = 0
-            return mock_result
+        await sink_service.delete_sink(project_id, sink_name)
 
-        with patch('subprocess.run', side_effect=capture_command):
-            await sink_service.delete_sink(project_id, sink_name)
-
-            assert "gcloud" in captured_command
-            assert "logging" in captured_command
-            assert "sinks" in captured_command
-            assert "delete" in captured_command
-            assert sink_name in captured_command
-            assert "--quiet" in captured_command
+        request = mock_config_client.delete_sink.call_args.kwargs["request"]
+        assert request["sink_name"] == f"projects/{project_id}/sinks/{sink_name}"
 
 
 class TestErrorHandling:
     """Integration tests for error handling"""
 
     @pytest.mark.asyncio
-    async def test_sink_creation_permission_denied(self):
+    async def test_sink_creation_permission_denied(self, mock_config_client, mock_publisher_client):
         """Test handling of permission denied error during sink creation"""
         project_id = "test-project-123"
 
-        def mock_subprocess_run(*args, **kwargs):
-            command = args[0]
-            if "list" in command:
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = ""
-                return mock_result
-            elif "create" in command:
-                mock_error = Mock()
-                mock_error.returncode = 1
-                mock_error.stderr = "Permission denied"
-                return mock_error
-
-        with patch('subprocess.run', side_effect=mock_subprocess_run):
-            with pytest.raises(Exception) as exc_info:
-                await sink_service.create_sink(project_id)
-
-            assert "Failed to create sink" in str(exc_info.value)
+        mock_config_client.create_sink.side_effect = PermissionDenied("Permission denied")
+
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.create_sink(project_id, project_id)
+
+        assert "Failed to create sink" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_permission_granting_api_error(self):
+    async def test_permission_granting_api_error(self, mock_publisher_client):
         """Test handling of API error during permission granting"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
         service_account = "logging-sa@project.iam.gserviceaccount.com"
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Topic not found"
+        mock_publisher_client.get_iam_policy.side_effect = NotFound("Topic not found")
 
-        with patch('subprocess.run', return_value=mock_result):
-            with pytest.raises(Exception) as exc_info:
-                await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
 
-            assert "Topic not found" in str(exc_info.value)
+        assert "Topic not found" in str(exc_info.value)
 
 
 class TestListSinksWorkflow:
     """Integration tests for listing sinks workflow"""
 
     @pytest.mark.asyncio
-    async def test_complete_listing_workflow(self):
+    async def test_complete_listing_workflow(self, mock_config_client):
         """Test complete sink listing workflow"""
         project_id = "test-project-123"
 
-        workflow_steps = []
-
-        def mock_subprocess_run(*args, **kwargs):
-            workflow_steps.append("list_sinks")
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_result.stdout = "sink1\nsink2\nsink3\n"
-            return mock_result
+        mock_config_client.list_sinks.return_value = [
+            LogSink(name="sink1"), LogSink(name="sink2"), LogSink(name="sink3")
+        ]
 
-        with patch('subprocess.run', side_effect=mock_subprocess_run):
-            result = await sink_service.list_sinks(project_id)
+        result = await sink_service.list_sinks(project_id)
 
-            assert "list_sinks" in workflow_steps
-            assert len(result) == 3
+        mock_config_client.list_sinks.assert_called_once()
+        assert len(result) == 3
 
     @pytest.mark.asyncio
-    async def test_listing_builds_correct_command(self):
-        """Test that listing builds correct gcloud command"""
+    async def test_listing_builds_correct_request(self, mock_config_client):
+        """Test that listing is scoped to the project"""
         project_id = "test-project-123"
 
-        captured_command = None
-
-        def capture_command(*args, **kwargs):
-            nonlocal captured_command
-            captured_command = args[0]
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_result.stdout = ""
-            return mock_result
+        await sink_service.list_sinks(project_id)
 
-        with patch('subprocess.run', side_effect=capture_command):
-            await sink_service.list_sinks(project_id)
-
-            assert "gcloud" in captured_command
-            assert "logging" in captured_command
-            assert "sinks" in captured_command
-            assert "list" in captured_command
-            # project_id is in --project=test-project-123
-            assert any(project_id in arg for arg in captured_command)
+        request = mock_config_client.list_sinks.call_args.kwargs["request"]
+        assert request["parent"] == f"projects/{project_id}"
 
 
 class TestExclusionFilterHandling:
     """Integration tests for exclusion filter handling"""
 
     @pytest.mark.asyncio
-    async def test_sink_creation_includes_exclusion_filter(self):
+    async def test_sink_creation_includes_exclusion_filter(self, mock_config_client, mock_publisher_client):
         """Test that sink creation includes diagnostic log exclusion"""
         project_id = "test-project-123"
 
-        captured_command = None
-
-        def capture_command(*args, **kwargs):
-            nonlocal captured_command
-            command = args[0]
-            if "create" in command:
-                captured_command = command
-            elif "list" in command:
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = ""
-                return mock_result
-            elif "describe" in command:
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = "serviceAccount:test@project.iam.gserviceaccount.com"
-                return mock_result
-            elif "pubsub" in command:
-                pass
-
-            mock_result = Mock()
-            mock_result.returncode = 0
-            return mock_result
-
-        with patch('subprocess.run', side_effect=capture_command):
-            with patch('asyncio.sleep'):
-                await sink_service.create_sink(project_id)
-
-                # Verify exclusion filter is present
-                command_str = " ".join(captured_command)
-                assert "--exclusion=" in command_str
-                assert "exclude-diagnostic-logs" in command_str
-                assert "logging.googleapis.com/diagnostic" in command_str
+        with patch('asyncio.sleep'):
+            await sink_service.create_sink(project_id, project_id)
+
+        # Verify exclusion filter is present
+        sink = mock_config_client.create_sink.call_args.kwargs["request"]["sink"]
+        assert len(sink.exclusions) == 1
+        assert sink.exclusions[0].name == "exclude-diagnostic-logs"
+        assert "logging.googleapis.com/diagnostic" in sink.exclusions[0].filter
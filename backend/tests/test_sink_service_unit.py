@@ -2,23 +2,57 @@
 Unit tests for Sink service.
 Tests individual functions with mocked dependencies.
 """
+import asyncio
+import threading
+
 import pytest
-import json
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
-import subprocess
+from google.api_core.exceptions import Aborted, InvalidArgument, NotFound, PermissionDenied
+from google.cloud.logging_v2.types import LogSink
+from google.iam.v1 import policy_pb2
 
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from services import sink_service
+from services import iam_service, sink_service
+
+
+@pytest.fixture(autouse=True)
+def clear_sink_cache():
+    """Reset the cached sink listings, created sinks and shared clients between tests."""
+    sink_service._sink_names_cache.clear()
+    sink_service._created_sinks.clear()
+    sink_service._clients.clear()
+    yield
+    sink_service._clients.clear()
+
+
+@pytest.fixture
+def mock_config_client():
+    """Mock Cloud Logging ConfigServiceV2Client."""
+    client = Mock()
+    client.list_sinks.return_value = []
+    client.create_sink.return_value = LogSink()
+    with patch('services.sink_service.ConfigServiceV2Client', return_value=client):
+        yield client
+
+
+@pytest.fixture
+def mock_publisher_client():
+    """Mock Pub/Sub PublisherClient with an empty topic IAM policy."""
+    publisher = Mock()
+    publisher.topic_path.side_effect = lambda project, topic: f"projects/{project}/topics/{topic}"
+    publisher.get_iam_policy.return_value = policy_pb2.Policy()
+    with patch('services.sink_service.pubsub_v1.PublisherClient', return_value=publisher):
+        yield publisher
 
 
 class TestCreateSink:
     """Test create_sink function"""
 
     @pytest.mark.asyncio
-    async def test_create_sink_success(self, monkeypatch):
+    async def test_create_sink_success(self, monkeypatch, mock_config_client, mock_publisher_client):
         """Test successful sink creation to Pub/Sub"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
@@ -32,35 +66,34 @@ class TestCreateSink:
             return "serviceAccount:logging-sink@project.iam.gserviceaccount.com"
 
         # Mock grant_pubsub_publisher
-        async def mock_grant(pid, tname, sa):
+        async def mock_grant(pid, tname, sa, policy=None):
             pass
 
         monkeypatch.setattr(sink_service, 'list_sinks', mock_list_sinks)
         monkeypatch.setattr(sink_service, 'get_sink_service_account', mock_get_sa)
         monkeypatch.setattr(sink_service, 'grant_pubsub_publisher', mock_grant)
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
+        result = await sink_service.create_sink(project_id, project_id, topic_name)
 
-        with patch('subprocess.run', return_value=mock_result):
-            result = await sink_service.create_sink(project_id, topic_name)
+        # Verify result structure
+        assert "sink_name" in result
+        assert "destination" in result
+        assert "service_account" in result
+        assert "topic_name" in result
+        assert "filter" in result
 
-            # Verify result structure
-            assert "sink_name" in result
-            assert "destination" in result
-            assert "service_account" in result
-            assert "topic_name" in result
-            assert "filter" in result
+        # Verify values
+        assert result["sink_name"] == "gemini-cli-to-pubsub"
+        assert f"pubsub.googleapis.com/projects/{project_id}/topics/{topic_name}" in result["destination"]
+        assert result["topic_name"] == topic_name
 
-            # Verify values
-            assert result["sink_name"] == "gemini-cli-to-pubsub"
-            assert f"pubsub.googleapis.com/projects/{project_id}/topics/{topic_name}" in result["destination"]
-            assert result["topic_name"] == topic_name
+        # Verify the sink was created in the telemetry project
+        request = mock_config_client.create_sink.call_args.kwargs["request"]
+        assert request["parent"] == f"projects/{project_id}"
+        assert request["sink"].destination == result["destination"]
 
     @pytest.mark.asyncio
-    async def test_create_sink_deletes_existing(self, monkeypatch):
+    async def test_create_sink_deletes_existing(self, monkeypatch, mock_config_client, mock_publisher_client):
         """Test that existing sink is deleted before creating new one"""
         project_id = "test-project-123"
 
@@ -75,7 +108,7 @@ class TestCreateSink:
         async def mock_get_sa(pid, sname):
             return "serviceAccount:test@project.iam.gserviceaccount.com"
 
-        async def mock_grant(pid, tname, sa):
+        async def mock_grant(pid, tname, sa, policy=None):
             pass
 
         monkeypatch.setattr(sink_service, 'list_sinks', mock_list_sinks)
@@ -83,18 +116,14 @@ class TestCreateSink:
         monkeypatch.setattr(sink_service, 'get_sink_service_account', mock_get_sa)
         monkeypatch.setattr(sink_service, 'grant_pubsub_publisher', mock_grant)
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-
-        with patch('subprocess.run', return_value=mock_result):
-            await sink_service.create_sink(project_id)
+        await sink_service.create_sink(project_id, project_id)
 
-            # Verify delete was called
-            assert "gemini-cli-to-pubsub" in delete_called
+        # Verify delete was called
+        assert "gemini-cli-to-pubsub" in delete_called
 
     @pytest.mark.asyncio
-    async def test_create_sink_command_failure(self, monkeypatch):
-        """Test handling of sink creation command failure"""
+    async def test_create_sink_command_failure(self, monkeypatch, mock_config_client, mock_publisher_client):
+        """Test handling of sink creation API failure"""
         project_id = "test-project-123"
 
         async def mock_list_sinks(pid):
@@ -102,18 +131,15 @@ class TestCreateSink:
 
         monkeypatch.setattr(sink_service, 'list_sinks', mock_list_sinks)
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Permission denied"
+        mock_config_client.create_sink.side_effect = PermissionDenied("Permission denied")
 
-        with patch('subprocess.run', return_value=mock_result):
-            with pytest.raises(Exception) as exc_info:
-                await sink_service.create_sink(project_id)
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.create_sink(project_id, project_id)
 
-            assert "Failed to create sink" in str(exc_info.value)
+        assert "Failed to create sink" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_create_sink_no_service_account(self, monkeypatch):
+    async def test_create_sink_no_service_account(self, monkeypatch, mock_config_client, mock_publisher_client):
         """Test handling when service account cannot be retrieved"""
         project_id = "test-project-123"
 
@@ -126,232 +152,440 @@ class TestCreateSink:
         monkeypatch.setattr(sink_service, 'list_sinks', mock_list_sinks)
         monkeypatch.setattr(sink_service, 'get_sink_service_account', mock_get_sa)
 
-        mock_result = Mock()
-        mock_result.returncode = 0
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.create_sink(project_id, project_id)
 
-        with patch('subprocess.run', return_value=mock_result):
-            with pytest.raises(Exception) as exc_info:
-                await sink_service.create_sink(project_id)
+        assert "service account" in str(exc_info.value).lower()
+
+    @pytest.mark.asyncio
+    async def test_create_sink_missing_topic(self, monkeypatch, mock_config_client, mock_publisher_client):
+        """Test that a missing destination topic fails before the sink is created"""
+        project_id = "test-project-123"
+
+        mock_publisher_client.get_iam_policy.side_effect = NotFound("Topic not found")
+
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.create_sink(project_id, project_id)
+
+        assert "gemini-telemetry-topic not found" in str(exc_info.value)
+        mock_config_client.create_sink.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_sink_ignores_cached_listing(self, monkeypatch, mock_config_client, mock_publisher_client):
+        """Test a sink created since the cached listing is still deleted before re-creating"""
+        project_id = "test-project-123"
+
+        # Cached listing from before someone else created the sink
+        await sink_service.list_sinks(project_id)
+        existing = Mock()
+        existing.name = "gemini-cli-to-pubsub"
+        mock_config_client.list_sinks.return_value = [existing]
+
+        deleted = []
+
+        async def mock_delete(pid, sname):
+            deleted.append(sname)
+
+        async def mock_get_sa(pid, sname):
+            return "serviceAccount:test@project.iam.gserviceaccount.com"
+
+        monkeypatch.setattr(sink_service, 'delete_sink', mock_delete)
+        monkeypatch.setattr(sink_service, 'get_sink_service_account', mock_get_sa)
+        monkeypatch.setattr(sink_service, 'grant_pubsub_publisher', AsyncMock())
+
+        await sink_service.create_sink(project_id, project_id)
+
+        assert deleted == ["gemini-cli-to-pubsub"]
+        assert mock_config_client.list_sinks.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_sink_passes_prefetched_policy_to_grant(self, monkeypatch, mock_config_client, mock_publisher_client):
+        """Test that the topic policy read alongside list_sinks is reused for the grant"""
+        project_id = "test-project-123"
+
+        granted = {}
+
+        async def mock_get_sa(pid, sname):
+            return "serviceAccount:test@project.iam.gserviceaccount.com"
+
+        async def mock_grant(pid, tname, sa, policy=None):
+            granted["policy"] = policy
+
+        monkeypatch.setattr(sink_service, 'get_sink_service_account', mock_get_sa)
+        monkeypatch.setattr(sink_service, 'grant_pubsub_publisher', mock_grant)
+
+        await sink_service.create_sink(project_id, project_id)
+
+        assert granted["policy"] is mock_publisher_client.get_iam_policy.return_value
+        mock_publisher_client.get_iam_policy.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_sink_uses_writer_identity_from_response(self, monkeypatch, mock_config_client, mock_publisher_client):
+        """Test that the service account comes from the create response without a describe"""
+        project_id = "test-project-123"
+        writer_identity = "serviceAccount:logging-sink@project.iam.gserviceaccount.com"
 
-            assert "service account" in str(exc_info.value).lower()
+        mock_config_client.create_sink.return_value = LogSink(writer_identity=writer_identity)
+        granted = {}
+
+        async def mock_grant(pid, tname, sa, policy=None):
+            granted["service_account"] = sa
+
+        monkeypatch.setattr(sink_service, 'grant_pubsub_publisher', mock_grant)
+
+        result = await sink_service.create_sink(project_id, project_id)
+
+        assert result["service_account"] == writer_identity
+        assert granted["service_account"] == writer_identity
+        mock_config_client.get_sink.assert_not_called()
 
 
 class TestGetSinkServiceAccount:
     """Test get_sink_service_account function"""
 
     @pytest.mark.asyncio
-    async def test_get_service_account_success(self):
+    async def test_get_service_account_success(self, mock_config_client):
         """Test successful retrieval of sink service account"""
         project_id = "test-project-123"
         sink_name = "gemini-cli-to-pubsub"
         expected_sa = "serviceAccount:logging-123@project.iam.gserviceaccount.com"
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = expected_sa + "\n"
+        mock_config_client.get_sink.return_value = LogSink(name=sink_name, writer_identity=expected_sa)
 
-        with patch('subprocess.run', return_value=mock_result):
-            result = await sink_service.get_sink_service_account(project_id, sink_name)
+        result = await sink_service.get_sink_service_account(project_id, sink_name)
 
-            assert result == expected_sa
+        assert result == expected_sa
+        request = mock_config_client.get_sink.call_args.kwargs["request"]
+        assert request["sink_name"] == f"projects/{project_id}/sinks/{sink_name}"
 
     @pytest.mark.asyncio
-    async def test_get_service_account_failure(self):
+    async def test_get_service_account_failure(self, mock_config_client):
         """Test handling when service account retrieval fails"""
         project_id = "test-project-123"
         sink_name = "nonexistent-sink"
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Sink not found"
+        mock_config_client.get_sink.side_effect = NotFound("Sink not found")
+
+        result = await sink_service.get_sink_service_account(project_id, sink_name)
+
+        assert result == ""
+
+    @pytest.mark.asyncio
+    async def test_get_service_account_does_not_block_event_loop(self, mock_config_client):
+        """Test that the event loop keeps running while the RPC is in flight"""
+        project_id = "test-project-123"
+        loop_ran = threading.Event()
+
+        def slow_get_sink(**kwargs):
+            # Only returns promptly if the loop is free to run mark_loop_ran
+            assert loop_ran.wait(timeout=2)
+            return LogSink(writer_identity="serviceAccount:logging-sa@project.iam.gserviceaccount.com")
 
-        with patch('subprocess.run', return_value=mock_result):
-            result = await sink_service.get_sink_service_account(project_id, sink_name)
+        async def mark_loop_ran():
+            loop_ran.set()
 
-            assert result == ""
+        mock_config_client.get_sink.side_effect = slow_get_sink
+
+        result, _ = await asyncio.gather(
+            sink_service.get_sink_service_account(project_id, "gemini-cli-to-pubsub"),
+            mark_loop_ran()
+        )
+
+        assert result == "serviceAccount:logging-sa@project.iam.gserviceaccount.com"
 
 
 class TestGrantPubSubPublisher:
     """Test grant_pubsub_publisher function"""
 
     @pytest.mark.asyncio
-    async def test_grant_publisher_success(self):
+    async def test_grant_publisher_success(self, mock_publisher_client):
         """Test successful granting of Pub/Sub Publisher role"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
         service_account = "serviceAccount:logging-sa@project.iam.gserviceaccount.com"
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stderr = ""
-
-        with patch('subprocess.run', return_value=mock_result):
-            with patch('asyncio.sleep'):  # Skip IAM propagation wait in tests
-                await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+        with patch('asyncio.sleep'):  # Skip IAM propagation wait in tests
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
 
-                # Should not raise exception
+        request = mock_publisher_client.set_iam_policy.call_args.kwargs["request"]
+        assert request["resource"] == f"projects/{project_id}/topics/{topic_name}"
+        binding = request["policy"].bindings[0]
+        assert binding.role == "roles/pubsub.publisher"
+        assert list(binding.members) == [service_account]
 
     @pytest.mark.asyncio
-    async def test_grant_publisher_already_exists(self):
+    async def test_grant_publisher_already_exists(self, mock_publisher_client):
         """Test handling when permission already exists"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
         service_account = "logging-sa@project.iam.gserviceaccount.com"
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Role already has member"
+        policy = policy_pb2.Policy()
+        policy.bindings.add(role="roles/pubsub.publisher", members=[f"serviceAccount:{service_account}"])
+        mock_publisher_client.get_iam_policy.return_value = policy
 
-        with patch('subprocess.run', return_value=mock_result):
-            with patch('asyncio.sleep'):
-                # Should not raise exception for already exists
-                await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+        with patch('asyncio.sleep'):
+            # Should not raise exception for already exists
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+
+        mock_publisher_client.set_iam_policy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_grant_publisher_adds_to_existing_binding(self, mock_publisher_client):
+        """Test that the member is appended to an existing publisher binding"""
+        project_id = "test-project-123"
+        topic_name = "gemini-telemetry-topic"
+        service_account = "logging-sa@project.iam.gserviceaccount.com"
+
+        policy = policy_pb2.Policy()
+        policy.bindings.add(role="roles/pubsub.publisher", members=["serviceAccount:other@project.iam.gserviceaccount.com"])
+        mock_publisher_client.get_iam_policy.return_value = policy
+
+        with patch('asyncio.sleep'):
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+
+        written = mock_publisher_client.set_iam_policy.call_args.kwargs["request"]["policy"]
+        assert len(written.bindings) == 1
+        assert f"serviceAccount:{service_account}" in written.bindings[0].members
+
+    @pytest.mark.asyncio
+    async def test_grant_publisher_uses_given_policy(self, mock_publisher_client):
+        """Test that a policy supplied by the caller is not read again"""
+        project_id = "test-project-123"
+        topic_name = "gemini-telemetry-topic"
+        service_account = "logging-sa@project.iam.gserviceaccount.com"
+
+        policy = policy_pb2.Policy(etag=b"prefetched")
+        mock_publisher_client.get_iam_policy.return_value = policy
+
+        with patch('asyncio.sleep'):
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account, policy=policy)
+
+        mock_publisher_client.get_iam_policy.assert_not_called()
+        written = mock_publisher_client.set_iam_policy.call_args.kwargs["request"]["policy"]
+        assert written.etag == b"prefetched"
 
     @pytest.mark.asyncio
-    async def test_grant_publisher_permission_denied(self):
+    async def test_grant_publisher_retries_stale_policy_with_fresh_read(self, mock_publisher_client):
+        """Test that an etag conflict on a prefetched policy re-reads the policy and retries"""
+        project_id = "test-project-123"
+        topic_name = "gemini-telemetry-topic"
+        service_account = "logging-sa@project.iam.gserviceaccount.com"
+
+        fresh = policy_pb2.Policy(etag=b"fresh")
+        fresh.bindings.add(role="roles/viewer", members=["user:someone@example.com"])
+        mock_publisher_client.get_iam_policy.return_value = fresh
+        mock_publisher_client.set_iam_policy.side_effect = [Aborted("etag mismatch"), Mock()]
+
+        with patch('asyncio.sleep'):
+            await sink_service.grant_pubsub_publisher(
+                project_id, topic_name, service_account, policy=policy_pb2.Policy(etag=b"stale")
+            )
+
+        assert mock_publisher_client.set_iam_policy.call_count == 2
+        written = mock_publisher_client.set_iam_policy.call_args.kwargs["request"]["policy"]
+        assert written.etag == b"fresh"
+        assert {b.role for b in written.bindings} == {"roles/viewer", "roles/pubsub.publisher"}
+
+    @pytest.mark.asyncio
+    async def test_grant_publisher_permission_denied(self, mock_publisher_client):
         """Test handling of permission denied error"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
         service_account = "logging-sa@project.iam.gserviceaccount.com"
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Permission denied"
+        mock_publisher_client.set_iam_policy.side_effect = PermissionDenied("Permission denied")
 
-        with patch('subprocess.run', return_value=mock_result):
-            with pytest.raises(Exception) as exc_info:
-                await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
 
-            assert "Permission denied" in str(exc_info.value)
+        assert "Permission denied" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_grant_publisher_strips_service_account_prefix(self):
+    async def test_grant_publisher_strips_service_account_prefix(self, mock_publisher_client):
         """Test that serviceAccount: prefix is stripped from SA email"""
         project_id = "test-project-123"
         topic_name = "gemini-telemetry-topic"
         service_account = "serviceAccount:logging-sa@project.iam.gserviceaccount.com"
 
-        captured_command = None
+        with patch('asyncio.sleep'):
+            await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
+
+        # Verify serviceAccount: prefix was not doubled up
+        written = mock_publisher_client.set_iam_policy.call_args.kwargs["request"]["policy"]
+        assert list(written.bindings[0].members) == ["serviceAccount:logging-sa@project.iam.gserviceaccount.com"]
 
-        def capture_command(*args, **kwargs):
-            nonlocal captured_command
-            captured_command = args[0]
-            mock_result = Mock()
-            mock_result.returncode = 0
-            return mock_result
+    @pytest.mark.asyncio
+    async def test_grant_publisher_backs_off_until_account_provisioned(self, mock_publisher_client, monkeypatch):
+        """Test that provisioning retries back off exponentially and give up after the last attempt"""
+        project_id = "test-project-123"
+        topic_name = "gemini-telemetry-topic"
+        service_account = "logging-sa@project.iam.gserviceaccount.com"
+
+        mock_publisher_client.get_iam_policy.side_effect = lambda **kw: policy_pb2.Policy()
+        mock_publisher_client.set_iam_policy.side_effect = InvalidArgument(
+            f"Service account {service_account} does not exist."
+        )
+        monkeypatch.setattr(sink_service.random, "uniform", lambda a, b: 0)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
 
-        with patch('subprocess.run', side_effect=capture_command):
-            with patch('asyncio.sleep'):
+        with patch('asyncio.sleep', fake_sleep):
+            with pytest.raises(Exception) as exc_info:
                 await sink_service.grant_pubsub_publisher(project_id, topic_name, service_account)
 
-                # Verify serviceAccount: prefix was removed
-                assert "--member=serviceAccount:logging-sa@project.iam.gserviceaccount.com" in captured_command
+        assert sleeps == [1, 2, 4, 8]
+        assert mock_publisher_client.set_iam_policy.call_count == sink_service.GRANT_MAX_ATTEMPTS
+        assert "not provisioned after 15s" in str(exc_info.value)
+
+
+class TestWaitForGrantPropagation:
+    """Test _wait_for_grant_propagation function"""
+
+    @pytest.mark.asyncio
+    async def test_settles_for_fixed_time(self, mock_publisher_client, monkeypatch):
+        """Test a new grant waits the shared settle time without reading the policy back"""
+        sleep_calls = []
+
+        async def mock_sleep(seconds):
+            sleep_calls.append(seconds)
+
+        monkeypatch.setattr("asyncio.sleep", mock_sleep)
+
+        waited = await sink_service._wait_for_grant_propagation()
+
+        assert sleep_calls == [iam_service.IAM_GRANT_SETTLE_SECONDS]
+        assert waited == iam_service.IAM_GRANT_SETTLE_SECONDS
+        mock_publisher_client.get_iam_policy.assert_not_called()
 
 
 class TestVerifySink:
     """Test verify_sink function"""
 
     @pytest.mark.asyncio
-    async def test_verify_sink_success(self, monkeypatch):
+    async def test_verify_sink_success(self, monkeypatch, mock_config_client):
         """Test successful sink verification"""
         project_id = "test-project-123"
         sink_name = "gemini-cli-to-pubsub"
 
-        sink_info = {
-            "destination": "pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic",
-            "writerIdentity": "serviceAccount:logging-sa@project.iam.gserviceaccount.com",
-            "filter": 'logName="projects/test-project-123/logs/gemini_cli"'
-        }
+        mock_config_client.get_sink.return_value = LogSink(
+            name=sink_name,
+            destination="pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic",
+            writer_identity="serviceAccount:logging-sa@project.iam.gserviceaccount.com",
+            filter='logName="projects/test-project-123/logs/gemini_cli"'
+        )
 
         async def mock_verify_permissions(pid, sa, dest):
             return True
 
         monkeypatch.setattr(sink_service, 'verify_service_account_permissions', mock_verify_permissions)
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(sink_info)
-
-        with patch('subprocess.run', return_value=mock_result):
-            result = await sink_service.verify_sink(project_id, sink_name)
+        result = await sink_service.verify_sink(project_id, sink_name)
 
-            assert result["verified"] is True
-            assert result["destination_type"] == "pubsub"
-            assert result["has_permissions"] is True
+        assert result["verified"] is True
+        assert result["destination_type"] == "pubsub"
+        assert result["has_permissions"] is True
 
     @pytest.mark.asyncio
-    async def test_verify_sink_bigquery_destination_fails(self, monkeypatch):
+    async def test_verify_sink_bigquery_destination_fails(self, monkeypatch, mock_config_client):
         """Test that BigQuery destination causes verification to fail"""
         project_id = "test-project-123"
         sink_name = "gemini-cli-to-bigquery"
 
-        sink_info = {
-            "destination": "bigquery.googleapis.com/projects/test-project-123/datasets/dataset",
-            "writerIdentity": "serviceAccount:logging-sa@project.iam.gserviceaccount.com",
-            "filter": 'logName="projects/test-project-123/logs/gemini_cli"'
-        }
-
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(sink_info)
+        mock_config_client.get_sink.return_value = LogSink(
+            name=sink_name,
+            destination="bigquery.googleapis.com/projects/test-project-123/datasets/dataset",
+            writer_identity="serviceAccount:logging-sa@project.iam.gserviceaccount.com",
+            filter='logName="projects/test-project-123/logs/gemini_cli"'
+        )
 
-        with patch('subprocess.run', return_value=mock_result):
-            with pytest.raises(Exception) as exc_info:
-                await sink_service.verify_sink(project_id, sink_name)
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.verify_sink(project_id, sink_name)
 
-            assert "should be Pub/Sub" in str(exc_info.value)
+        assert "should be Pub/Sub" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_verify_sink_not_found(self):
+    async def test_verify_sink_not_found(self, mock_config_client):
         """Test handling when sink does not exist"""
         project_id = "test-project-123"
         sink_name = "nonexistent-sink"
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Sink not found"
+        mock_config_client.get_sink.side_effect = NotFound("Sink not found")
 
-        with patch('subprocess.run', return_value=mock_result):
-            with pytest.raises(Exception) as exc_info:
-                await sink_service.verify_sink(project_id, sink_name)
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.verify_sink(project_id, sink_name)
 
-            assert "not found" in str(exc_info.value).lower()
+        assert "not found" in str(exc_info.value).lower()
+
+    @pytest.mark.asyncio
+    async def test_verify_sink_returns_given_result(self, mock_config_client):
+        """Test that a result passed in by the caller is returned without any reads"""
+        cached = {
+            "verified": True,
+            "destination": "pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic",
+            "destination_type": "pubsub",
+            "writer_identity": "serviceAccount:logging-sa@project.iam.gserviceaccount.com",
+            "filter": 'logName="projects/test-project-123/logs/gemini_cli"',
+            "has_permissions": True
+        }
+
+        result = await sink_service.verify_sink("test-project-123", "gemini-cli-to-pubsub", cached=cached)
+
+        assert result == cached
+        mock_config_client.get_sink.assert_not_called()
 
 
 class TestVerifyServiceAccountPermissions:
     """Test verify_service_account_permissions function"""
 
     @pytest.mark.asyncio
-    async def test_verify_permissions_success(self):
+    async def test_verify_permissions_success(self, mock_publisher_client):
         """Test successful permission verification"""
         project_id = "test-project-123"
         service_account = "serviceAccount:logging-sa@project.iam.gserviceaccount.com"
         destination = "pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic"
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "roles/pubsub.publisher\n"
+        policy = policy_pb2.Policy()
+        policy.bindings.add(role="roles/pubsub.publisher", members=[service_account])
+        mock_publisher_client.get_iam_policy.return_value = policy
 
-        with patch('subprocess.run', return_value=mock_result):
-            result = await sink_service.verify_service_account_permissions(project_id, service_account, destination)
+        result = await sink_service.verify_service_account_permissions(project_id, service_account, destination)
 
-            assert result is True
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_verify_permissions_missing_role(self):
+    async def test_verify_permissions_missing_role(self, mock_publisher_client):
         """Test when service account is missing publisher role"""
         project_id = "test-project-123"
         service_account = "logging-sa@project.iam.gserviceaccount.com"
         destination = "pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic"
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "roles/viewer\n"
+        policy = policy_pb2.Policy()
+        policy.bindings.add(role="roles/viewer", members=[f"serviceAccount:{service_account}"])
+        policy.bindings.add(role="roles/pubsub.publisher", members=["serviceAccount:other@project.iam.gserviceaccount.com"])
+        mock_publisher_client.get_iam_policy.return_value = policy
+
+        result = await sink_service.verify_service_account_permissions(project_id, service_account, destination)
+
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_verify_permissions_accepts_broader_pubsub_role(self, mock_publisher_client):
+        """Test that a role which includes publish (e.g. Pub/Sub Editor) counts"""
+        project_id = "test-project-123"
+        service_account = "logging-sa@project.iam.gserviceaccount.com"
+        destination = "pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic"
+
+        policy = policy_pb2.Policy()
+        policy.bindings.add(role="roles/pubsub.editor", members=[f"serviceAccount:{service_account}"])
+        mock_publisher_client.get_iam_policy.return_value = policy
 
-        with patch('subprocess.run', return_value=mock_result):
-            result = await sink_service.verify_service_account_permissions(project_id, service_account, destination)
+        result = await sink_service.verify_service_account_permissions(project_id, service_account, destination)
 
-            assert result is False
+        assert result is True
+        mock_publisher_client.get_iam_policy.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_verify_permissions_not_pubsub_destination(self):
@@ -364,98 +598,187 @@ class TestVerifyServiceAccountPermissions:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_verify_permissions_uses_destination_project(self, mock_publisher_client):
+        """Test that the topic is looked up in the project named by the destination"""
+        service_account = "logging-sa@project.iam.gserviceaccount.com"
+        destination = "pubsub.googleapis.com/projects/telemetry-project/topics/gemini-telemetry-topic"
+
+        await sink_service.verify_service_account_permissions("test-project-123", service_account, destination)
+
+        mock_publisher_client.topic_path.assert_called_once_with("telemetry-project", "gemini-telemetry-topic")
+
+    @pytest.mark.parametrize("destination,expected", [
+        ("pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic",
+         ("test-project-123", "gemini-telemetry-topic")),
+        ("bigquery.googleapis.com/projects/test-project-123/datasets/dataset", None),
+        ("pubsub.googleapis.com/projects/test-project-123/topics/", None),
+    ])
+    def test_parse_pubsub_destination(self, destination, expected):
+        """Test splitting a sink destination into project and topic"""
+        assert sink_service._parse_pubsub_destination(destination) == expected
+
+    @pytest.mark.asyncio
+    async def test_verify_permissions_reuses_publisher(self):
+        """Test that repeated checks share one PublisherClient"""
+        project_id = "test-project-123"
+        service_account = "logging-sa@project.iam.gserviceaccount.com"
+        destination = "pubsub.googleapis.com/projects/test-project-123/topics/gemini-telemetry-topic"
+
+        with patch('services.sink_service.pubsub_v1.PublisherClient') as mock_client_class:
+            mock_client_class.return_value.get_iam_policy.return_value = policy_pb2.Policy()
+
+            await sink_service.verify_service_account_permissions(project_id, service_account, destination)
+            await sink_service.verify_service_account_permissions(project_id, service_account, destination)
+
+        mock_client_class.assert_called_once()
+        assert mock_client_class.return_value.get_iam_policy.call_count == 2
+
 
 class TestListSinks:
     """Test list_sinks function"""
 
     @pytest.mark.asyncio
-    async def test_list_sinks_success(self):
+    async def test_list_sinks_success(self, mock_config_client):
         """Test successful listing of sinks"""
         project_id = "test-project-123"
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "sink1\nsink2\nsink3\n"
+        mock_config_client.list_sinks.return_value = [
+            LogSink(name="sink1"), LogSink(name="sink2"), LogSink(name="sink3")
+        ]
 
-        with patch('subprocess.run', return_value=mock_result):
-            result = await sink_service.list_sinks(project_id)
+        result = await sink_service.list_sinks(project_id)
 
-            assert len(result) == 3
-            assert "sink1" in result
-            assert "sink2" in result
-            assert "sink3" in result
+        assert len(result) == 3
+        assert "sink1" in result
+        assert "sink2" in result
+        assert "sink3" in result
 
     @pytest.mark.asyncio
-    async def test_list_sinks_empty(self):
-        """Test listing when no sinks exist"""
+    async def test_list_sinks_pages_fetched_off_event_loop(self, mock_config_client):
+        """Test that every page of the listing is consumed in the worker thread"""
         project_id = "test-project-123"
+        loop_thread = threading.current_thread()
+        page_threads = []
+
+        def pager():
+            for name in ("sink1", "sink2"):
+                page_threads.append(threading.current_thread())
+                yield LogSink(name=name)
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
+        mock_config_client.list_sinks.side_effect = lambda **kw: pager()
 
-        with patch('subprocess.run', return_value=mock_result):
-            result = await sink_service.list_sinks(project_id)
+        result = await sink_service.list_sinks(project_id)
 
-            assert len(result) == 0
+        assert result == ["sink1", "sink2"]
+        assert loop_thread not in page_threads
 
     @pytest.mark.asyncio
-    async def test_list_sinks_failure(self):
+    async def test_list_sinks_empty(self, mock_config_client):
+        """Test listing when no sinks exist"""
+        project_id = "test-project-123"
+
+        result = await sink_service.list_sinks(project_id)
+
+        assert len(result) == 0
+
+    @pytest.mark.asyncio
+    async def test_list_sinks_failure(self, mock_config_client):
         """Test handling of listing failure"""
         project_id = "test-project-123"
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Permission denied"
+        mock_config_client.list_sinks.side_effect = PermissionDenied("Permission denied")
+
+        result = await sink_service.list_sinks(project_id)
+
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_list_sinks_cached_within_ttl(self, mock_config_client):
+        """Test that repeated listings reuse one RPC within the TTL"""
+        project_id = "test-project-123"
+
+        mock_config_client.list_sinks.return_value = [LogSink(name="sink1")]
+
+        assert await sink_service.list_sinks(project_id) == ["sink1"]
+        assert await sink_service.list_sinks(project_id) == ["sink1"]
+
+        assert mock_config_client.list_sinks.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_list_sinks_refreshed_after_delete(self, mock_config_client):
+        """Test that deleting a sink drops the cached listing"""
+        project_id = "test-project-123"
+
+        mock_config_client.list_sinks.return_value = [LogSink(name="sink1")]
+        await sink_service.list_sinks(project_id)
+
+        await sink_service.delete_sink(project_id, "sink1")
+        mock_config_client.list_sinks.return_value = []
+
+        assert await sink_service.list_sinks(project_id) == []
+        assert mock_config_client.list_sinks.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_sinks_failure_not_cached(self, mock_config_client):
+        """Test that a failed listing is retried on the next call"""
+        project_id = "test-project-123"
 
-        with patch('subprocess.run', return_value=mock_result):
-            result = await sink_service.list_sinks(project_id)
+        mock_config_client.list_sinks.side_effect = [PermissionDenied("Permission denied"), [LogSink(name="sink1")]]
 
-            assert result == []
+        assert await sink_service.list_sinks(project_id) == []
+        assert await sink_service.list_sinks(project_id) == ["sink1"]
 
 
 class TestDeleteSink:
     """Test delete_sink function"""
 
     @pytest.mark.asyncio
-    async def test_delete_sink_success(self):
+    async def test_delete_sink_success(self, mock_config_client):
         """Test successful sink deletion"""
         project_id = "test-project-123"
         sink_name = "gemini-cli-to-pubsub"
 
-        mock_result = Mock()
-        mock_result.returncode = 0
+        # Should not raise exception
+        await sink_service.delete_sink(project_id, sink_name)
 
-        with patch('subprocess.run', return_value=mock_result):
-            # Should not raise exception
-            await sink_service.delete_sink(project_id, sink_name)
+        mock_config_client.delete_sink.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_delete_sink_not_found(self):
+    async def test_delete_sink_not_found(self, mock_config_client):
         """Test deleting sink that doesn't exist"""
         project_id = "test-project-123"
         sink_name = "nonexistent-sink"
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Sink not found"
+        mock_config_client.delete_sink.side_effect = NotFound("Sink not found")
 
-        with patch('subprocess.run', return_value=mock_result):
-            # Should not raise exception for not found
-            await sink_service.delete_sink(project_id, sink_name)
+        # Should not raise exception for not found
+        await sink_service.delete_sink(project_id, sink_name)
 
     @pytest.mark.asyncio
-    async def test_delete_sink_permission_denied(self):
+    async def test_delete_sink_permission_denied(self, mock_config_client):
         """Test handling of permission denied error"""
         project_id = "test-project-123"
         sink_name = "gemini-cli-to-pubsub"
 
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Permission denied"
+        mock_config_client.delete_sink.side_effect = PermissionDenied("Permission denied")
 
-        with patch('subprocess.run', return_value=mock_result):
-            with pytest.raises(Exception) as exc_info:
-                await sink_service.delete_sink(project_id, sink_name)
+        with pytest.raises(Exception) as exc_info:
+            await sink_service.delete_sink(project_id, sink_name)
+
+        assert "Failed to delete sink" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_sink_operations_share_config_client(self):
+        """Test that list and delete reuse one ConfigServiceV2Client"""
+        project_id = "test-project-123"
+
+        with patch('services.sink_service.ConfigServiceV2Client') as mock_client_class:
+            mock_client_class.return_value.list_sinks.return_value = []
+
+            await sink_service.list_sinks(project_id)
+            await sink_service.delete_sink(project_id, "gemini-cli-to-pubsub")
+            await sink_service.list_sinks(project_id)
 
-            assert "Failed to delete sink" in str(exc_info.value)
+        mock_client_class.assert_called_once()
+        assert mock_client_class.return_value.list_sinks.call_count == 2
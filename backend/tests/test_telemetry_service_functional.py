@@ -17,6 +17,13 @@ from unittest.mock import patch, MagicMock
 from services import telemetry_service
 
 
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Reset the cached settings.json contents and shell profile between tests."""
+    telemetry_service._settings_cache.clear()
+    telemetry_service._profile_file_cache.clear()
+
+
 class TestCompleteDeploymentScenarios:
     """Test complete deployment scenarios"""
 
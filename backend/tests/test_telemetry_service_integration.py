@@ -17,6 +17,13 @@ from unittest.mock import patch, MagicMock
 from services import telemetry_service
 
 
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Reset the cached settings.json contents and shell profile between tests."""
+    telemetry_service._settings_cache.clear()
+    telemetry_service._profile_file_cache.clear()
+
+
 class TestTelemetryConfigurationWorkflow:
     """Test complete telemetry configuration workflow"""
 
@@ -398,21 +405,21 @@ class TestConcurrentAccess:
 
             # First configuration
             settings = {}
-            await telemetry_service.configure_environment_variables_in_settings(
+            telemetry_service.configure_environment_variables_in_settings(
                 settings, "proj-1", "proj-1"
             )
             await telemetry_service.write_gemini_settings(settings)
 
             # Second configuration (same project -> different)
             settings = await telemetry_service.read_gemini_settings()
-            await telemetry_service.configure_environment_variables_in_settings(
+            telemetry_service.configure_environment_variables_in_settings(
                 settings, "proj-2", "proj-3"
             )
             await telemetry_service.write_gemini_settings(settings)
 
             # Third configuration (different -> same)
             settings = await telemetry_service.read_gemini_settings()
-            await telemetry_service.configure_environment_variables_in_settings(
+            telemetry_service.configure_environment_variables_in_settings(
                 settings, "final", "final"
             )
             await telemetry_service.write_gemini_settings(settings)
@@ -8,13 +8,30 @@ Tests the dual-project configuration logic:
 3. Same vs different project scenarios
 """
 import pytest
+import asyncio
 import json
 import os
+import threading
 from unittest.mock import Mock, patch, mock_open, MagicMock
 from pathlib import Path
 from services import telemetry_service
 
 
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Reset the cached settings.json contents and shell profile between tests."""
+    telemetry_service._settings_cache.clear()
+    telemetry_service._profile_file_cache.clear()
+
+
+@pytest.fixture
+def mock_profile_swap():
+    """Skip the temp-file swap for tests that mock open() and Path."""
+    with patch('services.telemetry_service.os.replace') as mock_replace, \
+         patch('services.telemetry_service.shutil.copymode'):
+        yield mock_replace
+
+
 class TestConfigureTelemetry:
     """Test main configure_telemetry function"""
 
@@ -101,6 +118,109 @@ class TestConfigureTelemetry:
         assert settings_arg["telemetry"]["target"] == "gcp"
         assert settings_arg["telemetry"]["logPrompts"] is True
 
+    @pytest.mark.asyncio
+    @patch('services.telemetry_service.read_gemini_settings')
+    async def test_configure_telemetry_writes_concurrently(self, mock_read):
+        """Test settings.json and shell profile writes overlap instead of running in sequence"""
+        mock_read.return_value = {}
+        shell_started = asyncio.Event()
+
+        async def slow_write(settings):
+            # Only completes if the shell profile step was started alongside it
+            await asyncio.wait_for(shell_started.wait(), timeout=1)
+
+        async def shell(*args):
+            shell_started.set()
+            return {"profile_file": "/home/user/.bashrc", "shell": "bash"}
+
+        with patch('services.telemetry_service.write_gemini_settings', side_effect=slow_write), \
+             patch('services.telemetry_service.configure_environment_variables_in_shell', side_effect=shell):
+            result = await telemetry_service.configure_telemetry(
+                log_prompts=False,
+                inference_project_id="my-project",
+                telemetry_project_id="my-project"
+            )
+
+        assert result["shell_profile"]["shell"] == "bash"
+
+    @pytest.mark.asyncio
+    @patch('services.telemetry_service.read_gemini_settings')
+    async def test_failed_settings_write_waits_for_shell_step(self, mock_read):
+        """Test a settings.json failure is raised only after the profile write has finished"""
+        mock_read.return_value = {}
+        shell_finished = []
+
+        async def failing_write(settings):
+            raise Exception("disk full")
+
+        async def slow_shell(*args):
+            for _ in range(3):
+                await asyncio.sleep(0)
+            shell_finished.append(True)
+            return {"profile_file": "/home/user/.bashrc", "shell": "bash"}
+
+        with patch('services.telemetry_service.write_gemini_settings', side_effect=failing_write), \
+             patch('services.telemetry_service.configure_environment_variables_in_shell', side_effect=slow_shell):
+            with pytest.raises(Exception, match="disk full"):
+                await telemetry_service.configure_telemetry(
+                    log_prompts=False,
+                    inference_project_id="my-project",
+                    telemetry_project_id="my-project"
+                )
+
+        assert shell_finished == [True]
+
+    @pytest.mark.asyncio
+    @patch('services.telemetry_service.configure_environment_variables_in_shell')
+    @patch('services.telemetry_service.write_gemini_settings')
+    @patch('services.telemetry_service.read_gemini_settings')
+    async def test_configure_telemetry_skips_unchanged_settings(
+        self, mock_read, mock_write, mock_shell
+    ):
+        """Test re-submitting the current configuration doesn't rewrite settings.json"""
+        mock_read.return_value = {
+            "telemetry": {"enabled": True, "target": "gcp", "logPrompts": False},
+            "env": {"GOOGLE_CLOUD_PROJECT": "my-project"}
+        }
+        mock_shell.return_value = {"profile_file": "/home/user/.bashrc", "shell": "bash"}
+
+        result = await telemetry_service.configure_telemetry(
+            log_prompts=False,
+            inference_project_id="my-project",
+            telemetry_project_id="my-project"
+        )
+
+        mock_write.assert_not_called()
+        mock_shell.assert_called_once()
+        assert result["env_vars"] == {"GOOGLE_CLOUD_PROJECT": "my-project"}
+
+    @pytest.mark.asyncio
+    @patch('services.telemetry_service.configure_environment_variables_in_shell')
+    async def test_concurrent_configure_calls_do_not_overlap(self, mock_shell):
+        """Test simultaneous reconfigurations read-modify-write settings one at a time"""
+        mock_shell.return_value = {"profile_file": "/home/user/.bashrc", "shell": "bash"}
+        active = []
+        overlapped = []
+
+        async def read():
+            overlapped.append(bool(active))
+            active.append(True)
+            await asyncio.sleep(0.01)
+            return {}
+
+        async def write(settings):
+            await asyncio.sleep(0.01)
+            active.pop()
+
+        with patch('services.telemetry_service.read_gemini_settings', side_effect=read), \
+             patch('services.telemetry_service.write_gemini_settings', side_effect=write):
+            await asyncio.gather(
+                telemetry_service.configure_telemetry(False, "project-a", "project-a"),
+                telemetry_service.configure_telemetry(True, "project-b", "project-b")
+            )
+
+        assert overlapped == [False, False]
+
     @pytest.mark.asyncio
     @patch('services.telemetry_service.configure_environment_variables_in_shell')
     @patch('services.telemetry_service.write_gemini_settings')
@@ -122,12 +242,11 @@ class TestConfigureTelemetry:
 class TestConfigureEnvironmentVariablesInSettings:
     """Test environment variable configuration in settings.json"""
 
-    @pytest.mark.asyncio
-    async def test_same_project_sets_single_var(self):
+    def test_same_project_sets_single_var(self):
         """Test same project sets only GOOGLE_CLOUD_PROJECT"""
         settings = {}
 
-        await telemetry_service.configure_environment_variables_in_settings(
+        telemetry_service.configure_environment_variables_in_settings(
             settings,
             "my-project",
             "my-project"
@@ -136,12 +255,11 @@ class TestConfigureEnvironmentVariablesInSettings:
         assert settings["env"]["GOOGLE_CLOUD_PROJECT"] == "my-project"
         assert "OTLP_GOOGLE_CLOUD_PROJECT" not in settings["env"]
 
-    @pytest.mark.asyncio
-    async def test_different_projects_sets_both_vars(self):
+    def test_different_projects_sets_both_vars(self):
         """Test different projects sets both environment variables"""
         settings = {}
 
-        await telemetry_service.configure_environment_variables_in_settings(
+        telemetry_service.configure_environment_variables_in_settings(
             settings,
             "inference-proj",
             "telemetry-proj"
@@ -150,8 +268,7 @@ class TestConfigureEnvironmentVariablesInSettings:
         assert settings["env"]["GOOGLE_CLOUD_PROJECT"] == "inference-proj"
         assert settings["env"]["OTLP_GOOGLE_CLOUD_PROJECT"] == "telemetry-proj"
 
-    @pytest.mark.asyncio
-    async def test_removes_otlp_var_when_switching_to_same_project(self):
+    def test_removes_otlp_var_when_switching_to_same_project(self):
         """Test OTLP variable is removed when switching to same project"""
         settings = {
             "env": {
@@ -160,7 +277,7 @@ class TestConfigureEnvironmentVariablesInSettings:
             }
         }
 
-        await telemetry_service.configure_environment_variables_in_settings(
+        telemetry_service.configure_environment_variables_in_settings(
             settings,
             "new-project",
             "new-project"
@@ -169,8 +286,7 @@ class TestConfigureEnvironmentVariablesInSettings:
         assert settings["env"]["GOOGLE_CLOUD_PROJECT"] == "new-project"
         assert "OTLP_GOOGLE_CLOUD_PROJECT" not in settings["env"]
 
-    @pytest.mark.asyncio
-    async def test_updates_existing_env_vars(self):
+    def test_updates_existing_env_vars(self):
         """Test existing environment variables are updated"""
         settings = {
             "env": {
@@ -179,7 +295,7 @@ class TestConfigureEnvironmentVariablesInSettings:
             }
         }
 
-        await telemetry_service.configure_environment_variables_in_settings(
+        telemetry_service.configure_environment_variables_in_settings(
             settings,
             "new-inference",
             "new-telemetry"
@@ -188,8 +304,7 @@ class TestConfigureEnvironmentVariablesInSettings:
         assert settings["env"]["GOOGLE_CLOUD_PROJECT"] == "new-inference"
         assert settings["env"]["OTLP_GOOGLE_CLOUD_PROJECT"] == "new-telemetry"
 
-    @pytest.mark.asyncio
-    async def test_preserves_other_env_vars(self):
+    def test_preserves_other_env_vars(self):
         """Test other environment variables are preserved"""
         settings = {
             "env": {
@@ -198,7 +313,7 @@ class TestConfigureEnvironmentVariablesInSettings:
             }
         }
 
-        await telemetry_service.configure_environment_variables_in_settings(
+        telemetry_service.configure_environment_variables_in_settings(
             settings,
             "inference",
             "telemetry"
@@ -209,18 +324,32 @@ class TestConfigureEnvironmentVariablesInSettings:
         assert settings["env"]["GOOGLE_CLOUD_PROJECT"] == "inference"
         assert settings["env"]["OTLP_GOOGLE_CLOUD_PROJECT"] == "telemetry"
 
-    @pytest.mark.asyncio
-    async def test_error_handling(self):
+    def test_switching_from_vertex_ai_removes_location(self):
+        """Test GOOGLE_CLOUD_LOCATION is set for Vertex AI and removed again for OAuth"""
+        settings = {}
+
+        telemetry_service.configure_environment_variables_in_settings(
+            settings, "inference", "telemetry", "vertex-ai", "us-central1"
+        )
+        assert settings["env"]["GOOGLE_CLOUD_LOCATION"] == "us-central1"
+
+        telemetry_service.configure_environment_variables_in_settings(
+            settings, "inference", "inference", "oauth"
+        )
+        assert settings["env"] == {"GOOGLE_CLOUD_PROJECT": "inference"}
+
+    def test_error_handling(self):
         """Test error handling in settings configuration"""
         # Pass invalid settings object
         with pytest.raises(Exception):
-            await telemetry_service.configure_environment_variables_in_settings(
+            telemetry_service.configure_environment_variables_in_settings(
                 None,
                 "inference",
                 "telemetry"
             )
 
 
+@pytest.mark.usefixtures("mock_profile_swap")
 class TestConfigureEnvironmentVariablesInShell:
     """Test shell profile configuration"""
 
@@ -303,6 +432,33 @@ class TestConfigureEnvironmentVariablesInShell:
         assert 'export GOOGLE_CLOUD_PROJECT="inference-proj"' in written_content
         assert 'export OTLP_GOOGLE_CLOUD_PROJECT="telemetry-proj"' in written_content
 
+    @pytest.mark.asyncio
+    @patch('services.telemetry_service._update_profile_file')
+    @patch.dict(os.environ, {'SHELL': '/bin/bash'})
+    async def test_variables_set_matches_exports(self, mock_update):
+        """Test variables_set lists every exported variable, including the Vertex AI location"""
+        result = await telemetry_service.configure_environment_variables_in_shell(
+            "inference-project", "telemetry-project", "vertex-ai", "us-central1"
+        )
+
+        export_lines = mock_update.call_args.args[1]
+        assert result["variables_set"] == [
+            "GOOGLE_CLOUD_PROJECT", "OTLP_GOOGLE_CLOUD_PROJECT", "GOOGLE_CLOUD_LOCATION"
+        ]
+        assert [line.split("=")[0].split()[1] for line in export_lines] == result["variables_set"]
+
+    @pytest.mark.asyncio
+    @patch('services.telemetry_service._update_profile_file')
+    @patch.dict(os.environ, {'SHELL': '/bin/bash'})
+    async def test_export_values_are_escaped(self, mock_update):
+        """Test shell-special characters in values can't break out of the double quotes"""
+        await telemetry_service.configure_environment_variables_in_shell(
+            "proj", "proj", "vertex-ai", 'us-"$(id)`x`\\'
+        )
+
+        export_lines = mock_update.call_args.args[1]
+        assert export_lines[-1] == 'export GOOGLE_CLOUD_LOCATION="us-\\"\\$(id)\\`x\\`\\\\"'
+
     @pytest.mark.asyncio
     @patch('services.telemetry_service.Path')
     @patch.dict(os.environ, {'SHELL': '/bin/bash'})
@@ -356,12 +512,15 @@ export OTLP_GOOGLE_CLOUD_PROJECT="old-telemetry"
         mock_path_class.home.return_value = mock_home
 
         mock_file = mock_open()
+        # Reading the missing profile fails; writing creates it
+        mock_file.side_effect = [FileNotFoundError(), mock_file.return_value]
         with patch('builtins.open', mock_file):
             result = await telemetry_service.configure_environment_variables_in_shell(
                 "test", "test"
             )
 
         assert result["profile_file"] is not None
+        assert mock_file.call_args_list[-1].args[1] == 'w'
 
     @pytest.mark.asyncio
     @patch('services.telemetry_service.Path')
@@ -398,6 +557,102 @@ export OTLP_GOOGLE_CLOUD_PROJECT="old-telemetry"
 
         assert result["shell"] == "bash"
 
+    @pytest.mark.asyncio
+    @patch('services.telemetry_service.Path')
+    @patch.dict(os.environ, {'SHELL': '/bin/bash'})
+    async def test_profile_file_resolved_once(self, mock_path_class):
+        """Test repeated calls reuse the detected shell and profile file"""
+        mock_home = MagicMock()
+        mock_bashrc = MagicMock()
+        mock_bashrc.exists.return_value = True
+        mock_home.__truediv__.return_value = mock_bashrc
+        mock_path_class.home.return_value = mock_home
+        mock_path_class.return_value.name = "bash"
+
+        with patch('builtins.open', mock_open(read_data="")):
+            first = await telemetry_service.configure_environment_variables_in_shell("test", "test")
+            second = await telemetry_service.configure_environment_variables_in_shell("test", "test")
+
+        assert first["profile_file"] == second["profile_file"]
+        mock_path_class.home.assert_called_once()
+        mock_bashrc.exists.assert_called_once()
+
+
+class TestUpdateProfileFile:
+    """Test rewriting the configuration block in a real profile file"""
+
+    def test_reconfigure_does_not_accumulate_blank_lines(self, tmp_path):
+        """Test replacing the block also removes the blank line written before it"""
+        profile = tmp_path / ".bashrc"
+        profile.write_text('export SOME_VAR="value"\n')
+
+        telemetry_service._update_profile_file(profile, ['export GOOGLE_CLOUD_PROJECT="old-project"'])
+        first = profile.read_text()
+        telemetry_service._update_profile_file(profile, ['export GOOGLE_CLOUD_PROJECT="new-project"'])
+
+        assert profile.read_text() == first.replace("old-project", "new-project")
+
+    def test_lines_around_block_kept_apart(self, tmp_path):
+        """Test removing a block between two lines doesn't join them"""
+        start = telemetry_service._PROFILE_MARKER_START
+        end = telemetry_service._PROFILE_MARKER_END
+        profile = tmp_path / ".bashrc"
+        profile.write_text(f'alias a=1\n{start}\nexport GOOGLE_CLOUD_PROJECT="old"\n{end}\nalias b=2\n')
+
+        telemetry_service._update_profile_file(profile, ['export GOOGLE_CLOUD_PROJECT="new"'])
+
+        assert profile.read_text() == (
+            f'alias a=1\nalias b=2\n\n{start}\nexport GOOGLE_CLOUD_PROJECT="new"\n{end}\n'
+        )
+
+    def test_blank_line_before_block_removed_with_it(self, tmp_path):
+        """Test the blank line written before the block goes, but the preceding line's newline stays"""
+        start = telemetry_service._PROFILE_MARKER_START
+        end = telemetry_service._PROFILE_MARKER_END
+        profile = tmp_path / ".bashrc"
+        profile.write_text(f'alias a=1\n\n{start}\nexport GOOGLE_CLOUD_PROJECT="old"\n{end}\nalias b=2\n')
+
+        telemetry_service._update_profile_file(profile, ['export GOOGLE_CLOUD_PROJECT="new"'])
+
+        assert profile.read_text().startswith("alias a=1\nalias b=2\n\n" + start)
+
+    def test_replaces_file_atomically(self, tmp_path):
+        """Test the profile is swapped in whole and keeps its permissions"""
+        profile = tmp_path / ".bashrc"
+        profile.write_text("# existing\n")
+        profile.chmod(0o600)
+
+        telemetry_service._update_profile_file(profile, ['export GOOGLE_CLOUD_PROJECT="p"'])
+
+        assert 'export GOOGLE_CLOUD_PROJECT="p"' in profile.read_text()
+        assert profile.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in tmp_path.iterdir()] == [".bashrc"]
+
+    def test_unchanged_profile_not_rewritten(self, tmp_path):
+        """Test applying the same exports twice leaves the file untouched the second time"""
+        profile = tmp_path / ".bashrc"
+        export_lines = ['export GOOGLE_CLOUD_PROJECT="p"']
+        telemetry_service._update_profile_file(profile, export_lines)
+
+        with patch('services.telemetry_service.os.replace') as mock_replace:
+            telemetry_service._update_profile_file(profile, export_lines)
+
+        mock_replace.assert_not_called()
+        assert [p.name for p in tmp_path.iterdir()] == [".bashrc"]
+
+    def test_writes_through_symlink(self, tmp_path):
+        """Test a symlinked profile (e.g. from a dotfiles repo) stays a symlink"""
+        real = tmp_path / "dotfiles" / "bashrc"
+        real.parent.mkdir()
+        real.write_text("# dotfiles\n")
+        profile = tmp_path / ".bashrc"
+        profile.symlink_to(real)
+
+        telemetry_service._update_profile_file(profile, ['export GOOGLE_CLOUD_PROJECT="p"'])
+
+        assert profile.is_symlink()
+        assert 'export GOOGLE_CLOUD_PROJECT="p"' in real.read_text()
+
 
 class TestReadGeminiSettings:
     """Test reading Gemini settings"""
@@ -418,7 +673,7 @@ class TestReadGeminiSettings:
     @patch('services.telemetry_service.GEMINI_SETTINGS_PATH')
     async def test_read_nonexistent_settings(self, mock_path):
         """Test reading non-existent settings returns empty dict"""
-        mock_path.exists.return_value = False
+        mock_path.stat.side_effect = FileNotFoundError()
 
         result = await telemetry_service.read_gemini_settings()
 
@@ -434,6 +689,53 @@ class TestReadGeminiSettings:
             with pytest.raises(Exception, match="Invalid JSON"):
                 await telemetry_service.read_gemini_settings()
 
+    @pytest.mark.asyncio
+    async def test_read_runs_off_event_loop(self, tmp_path):
+        """Test the file is read in a worker thread, not on the event loop"""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text(json.dumps({"telemetry": {"enabled": True}}))
+        read_threads = []
+        real_open = open
+
+        def recording_open(*args, **kwargs):
+            read_threads.append(threading.current_thread())
+            return real_open(*args, **kwargs)
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file), \
+             patch('builtins.open', recording_open):
+            result = await telemetry_service.read_gemini_settings()
+
+        assert result == {"telemetry": {"enabled": True}}
+        assert read_threads and threading.current_thread() not in read_threads
+
+    @pytest.mark.asyncio
+    async def test_read_unchanged_file_uses_cache(self, tmp_path):
+        """Test an unchanged settings file is parsed once and each caller gets its own copy"""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text(json.dumps({"telemetry": {"enabled": True}}))
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file), \
+             patch('services.telemetry_service._parse_settings', wraps=telemetry_service._parse_settings) as mock_load:
+            first = await telemetry_service.read_gemini_settings()
+            first["telemetry"]["enabled"] = False
+            second = await telemetry_service.read_gemini_settings()
+
+        assert mock_load.call_count == 1
+        assert second == {"telemetry": {"enabled": True}}
+
+    @pytest.mark.asyncio
+    async def test_read_changed_file_reparses(self, tmp_path):
+        """Test a settings file edited on disk is read again"""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text(json.dumps({"telemetry": {"enabled": True}}))
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file):
+            await telemetry_service.read_gemini_settings()
+            settings_file.write_text(json.dumps({"telemetry": {"enabled": False, "target": "gcp"}}))
+            result = await telemetry_service.read_gemini_settings()
+
+        assert result == {"telemetry": {"enabled": False, "target": "gcp"}}
+
 
 class TestWriteGeminiSettings:
     """Test writing Gemini settings"""
@@ -445,16 +747,22 @@ class TestWriteGeminiSettings:
         mock_path.parent.mkdir = MagicMock()
         settings_data = {"telemetry": {"enabled": True}}
 
+        target = "/home/user/.gemini/settings.json"
         mock_file = mock_open()
-        with patch('builtins.open', mock_file):
+        with patch('builtins.open', mock_file), \
+             patch('services.telemetry_service.os.path.realpath', return_value=target), \
+             patch('services.telemetry_service.shutil.copymode'), \
+             patch('services.telemetry_service.os.replace') as mock_replace:
             await telemetry_service.write_gemini_settings(settings_data)
 
-        # Verify file was opened for writing
-        mock_file.assert_called_once_with(mock_path, 'w')
+        # Verify a temp file was written next to the resolved path and swapped in
+        mock_file.assert_called_once_with(target + ".tmp", 'wb')
+        mock_replace.assert_called_once_with(target + ".tmp", target)
 
         # Verify JSON was written with indent
-        written_content = "".join(call.args[0] for call in mock_file().write.call_args_list)
-        assert "telemetry" in written_content
+        written_content = b"".join(call.args[0] for call in mock_file().write.call_args_list)
+        assert json.loads(written_content) == settings_data
+        assert b'\n  "telemetry"' in written_content
 
     @pytest.mark.asyncio
     @patch('services.telemetry_service.GEMINI_SETTINGS_PATH')
@@ -463,7 +771,107 @@ class TestWriteGeminiSettings:
         mock_parent = MagicMock()
         mock_path.parent = mock_parent
 
-        with patch('builtins.open', mock_open()):
+        with patch('builtins.open', mock_open()), \
+             patch('services.telemetry_service.os.replace'):
             await telemetry_service.write_gemini_settings({})
 
         mock_parent.mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
+    @pytest.mark.asyncio
+    async def test_write_primes_cache(self, tmp_path):
+        """Test reading back what was just written doesn't parse the file again"""
+        settings_file = tmp_path / ".gemini" / "settings.json"
+        settings_data = {"telemetry": {"enabled": True}}
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file):
+            await telemetry_service.write_gemini_settings(settings_data)
+            with patch('services.telemetry_service._parse_settings') as mock_load:
+                result = await telemetry_service.read_gemini_settings()
+
+        mock_load.assert_not_called()
+        assert result == settings_data
+
+    @pytest.mark.asyncio
+    async def test_write_read_round_trip(self, tmp_path):
+        """Test settings survive a write and a fresh read"""
+        settings_file = tmp_path / "settings.json"
+        settings_data = {"telemetry": {"enabled": True, "logPrompts": False}, "env": {"GOOGLE_CLOUD_PROJECT": "p"}}
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file):
+            await telemetry_service.write_gemini_settings(settings_data)
+            telemetry_service._settings_cache.clear()
+            result = await telemetry_service.read_gemini_settings()
+
+        assert result == settings_data
+        assert settings_file.read_text().startswith('{\n  "telemetry"')
+
+    @pytest.mark.asyncio
+    async def test_write_keeps_permissions(self, tmp_path):
+        """Test rewriting settings.json keeps its existing mode"""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text('{}')
+        settings_file.chmod(0o600)
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file):
+            await telemetry_service.write_gemini_settings({"telemetry": {"enabled": True}})
+
+        assert settings_file.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+    @pytest.mark.asyncio
+    async def test_write_through_symlink(self, tmp_path):
+        """Test a symlinked settings.json (e.g. from a dotfiles repo) stays a symlink"""
+        real = tmp_path / "dotfiles" / "settings.json"
+        real.parent.mkdir()
+        real.write_text('{}')
+        settings_file = tmp_path / "settings.json"
+        settings_file.symlink_to(real)
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file):
+            await telemetry_service.write_gemini_settings({"telemetry": {"enabled": True}})
+
+        assert settings_file.is_symlink()
+        assert json.loads(real.read_text()) == {"telemetry": {"enabled": True}}
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_existing_file(self, tmp_path):
+        """Test a write that fails midway leaves the previous settings intact"""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text('{"telemetry": {"enabled": false}}')
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file), \
+             patch('services.telemetry_service.orjson.dumps', side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                await telemetry_service.write_gemini_settings({"telemetry": {"enabled": True}})
+
+        assert json.loads(settings_file.read_text()) == {"telemetry": {"enabled": False}}
+
+
+class TestGetTelemetryConfig:
+    """Test reading the telemetry section of settings"""
+
+    @pytest.mark.asyncio
+    async def test_returns_telemetry_section_copy(self, tmp_path):
+        """Test callers get a copy of only the telemetry section"""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text(json.dumps({
+            "telemetry": {"enabled": True, "target": "gcp"},
+            "mcpServers": {"big": {"command": "x", "args": ["a"] * 100}}
+        }))
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file):
+            config = await telemetry_service.get_telemetry_config()
+            config["enabled"] = False
+            assert await telemetry_service.verify_telemetry_enabled() is True
+
+        assert config == {"enabled": False, "target": "gcp"}
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_reports_disabled(self, tmp_path):
+        """Test a corrupt settings file reads as telemetry disabled"""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text("{not json")
+
+        with patch('services.telemetry_service.GEMINI_SETTINGS_PATH', settings_file):
+            assert await telemetry_service.get_telemetry_config() == {}
+            assert await telemetry_service.verify_telemetry_enabled() is False
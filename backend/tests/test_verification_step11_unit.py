@@ -450,6 +450,178 @@ class TestVerifyELTPipeline:
         assert result["pipeline_ready"] is False
         assert any("ELT pipeline verification failed" in issue for issue in result["issues"])
 
+    @pytest.mark.asyncio
+    async def test_verify_pipeline_checks_run_concurrently(self, monkeypatch):
+        """Test every component check is started before any of them finishes"""
+        import asyncio
+        started = []
+        all_started = asyncio.Event()
+
+        def check(result):
+            async def _check(*args):
+                started.append(args)
+                if len(started) == 7:
+                    all_started.set()
+                await asyncio.wait_for(all_started.wait(), timeout=1)
+                return result
+            return _check
+
+        from services import pubsub_service, sink_service, dataflow_service, gcs_service, bigquery_service
+
+        monkeypatch.setattr(pubsub_service, 'verify_topic_exists', check(True))
+        monkeypatch.setattr(pubsub_service, 'verify_subscription_exists', check(True))
+        monkeypatch.setattr(sink_service, 'verify_sink', check({"verified": True}))
+        monkeypatch.setattr(dataflow_service, 'verify_dataflow_pipeline', check({"is_running": True, "issues": []}))
+        monkeypatch.setattr(gcs_service, 'verify_bucket_exists', check(True))
+        monkeypatch.setattr(gcs_service, 'verify_file_exists', check(True))
+        monkeypatch.setattr(bigquery_service, 'verify_table_exists', check(True))
+
+        result = await verification_service.verify_elt_pipeline("test-project-123", "test_dataset")
+
+        assert len(started) == 7
+        assert result["pipeline_ready"] is True
+
+    @pytest.mark.asyncio
+    async def test_verify_pipeline_fail_fast_skips_downstream_checks(self, monkeypatch):
+        """Test fail_fast stops after Pub/Sub when the subscription is missing"""
+        from services import pubsub_service, sink_service, dataflow_service, gcs_service, bigquery_service
+
+        async def mock_verify_topic(pid, topic):
+            return True
+
+        async def mock_verify_sub(pid, sub):
+            return False
+
+        downstream = AsyncMock()
+        monkeypatch.setattr(pubsub_service, 'verify_topic_exists', mock_verify_topic)
+        monkeypatch.setattr(pubsub_service, 'verify_subscription_exists', mock_verify_sub)
+        monkeypatch.setattr(sink_service, 'verify_sink', downstream)
+        monkeypatch.setattr(dataflow_service, 'verify_dataflow_pipeline', downstream)
+        monkeypatch.setattr(gcs_service, 'verify_bucket_exists', downstream)
+        monkeypatch.setattr(gcs_service, 'verify_file_exists', downstream)
+        monkeypatch.setattr(bigquery_service, 'verify_table_exists', downstream)
+
+        result = await verification_service.verify_elt_pipeline(
+            "test-project-123", "test_dataset", fail_fast=True
+        )
+
+        downstream.assert_not_called()
+        assert result["pipeline_ready"] is False
+        assert result["pubsub_topic_exists"] is True
+        assert result["pubsub_subscription_exists"] is False
+        assert result["dataflow_running"] is False
+        assert result["sink_configured"] is False
+        assert any("subscription" in issue for issue in result["issues"])
+        assert any("Skipped" in issue for issue in result["issues"])
+
+    @pytest.mark.asyncio
+    async def test_verify_pipeline_fail_fast_checks_pubsub_once(self, monkeypatch):
+        """Test fail_fast reuses the Pub/Sub results when they pass"""
+        from services import pubsub_service, sink_service, dataflow_service, gcs_service, bigquery_service
+
+        mock_topic = AsyncMock(return_value=True)
+        mock_sub = AsyncMock(return_value=True)
+        monkeypatch.setattr(pubsub_service, 'verify_topic_exists', mock_topic)
+        monkeypatch.setattr(pubsub_service, 'verify_subscription_exists', mock_sub)
+        monkeypatch.setattr(sink_service, 'verify_sink', AsyncMock(return_value={"verified": True}))
+        monkeypatch.setattr(
+            dataflow_service, 'verify_dataflow_pipeline',
+            AsyncMock(return_value={"is_running": True, "issues": []})
+        )
+        monkeypatch.setattr(gcs_service, 'verify_bucket_exists', AsyncMock(return_value=True))
+        monkeypatch.setattr(gcs_service, 'verify_file_exists', AsyncMock(return_value=True))
+        monkeypatch.setattr(bigquery_service, 'verify_table_exists', AsyncMock(return_value=True))
+
+        result = await verification_service.verify_elt_pipeline(
+            "test-project-123", "test_dataset", fail_fast=True
+        )
+
+        assert mock_topic.await_count == 1
+        assert mock_sub.await_count == 1
+        assert result["pipeline_ready"] is True
+        assert result["issues"] == []
+
+    @pytest.mark.asyncio
+    async def test_verify_pipeline_failure_cancels_remaining_checks(self, monkeypatch):
+        """Test a failing check ends verification without waiting for slower ones"""
+        import asyncio
+        from services import pubsub_service, sink_service, dataflow_service, gcs_service, bigquery_service
+
+        cancelled = []
+
+        async def slow_check(*args):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(args)
+                raise
+
+        async def failing_check(*args):
+            raise Exception("Permission denied on project")
+
+        monkeypatch.setattr(pubsub_service, 'verify_topic_exists', failing_check)
+        monkeypatch.setattr(pubsub_service, 'verify_subscription_exists', slow_check)
+        monkeypatch.setattr(sink_service, 'verify_sink', slow_check)
+        monkeypatch.setattr(dataflow_service, 'verify_dataflow_pipeline', slow_check)
+        monkeypatch.setattr(gcs_service, 'verify_bucket_exists', slow_check)
+        monkeypatch.setattr(gcs_service, 'verify_file_exists', slow_check)
+        monkeypatch.setattr(bigquery_service, 'verify_table_exists', slow_check)
+
+        result = await asyncio.wait_for(
+            verification_service.verify_elt_pipeline("test-project-123", "test_dataset"),
+            timeout=5
+        )
+
+        assert result["pipeline_ready"] is False
+        assert "Permission denied" in result["issues"][0]
+        assert len(cancelled) == 6
+
+    @pytest.mark.asyncio
+    async def test_gather_fail_fast_waits_for_cancelled_checks(self):
+        """Test a failure is re-raised only after the cancelled checks have finished cleaning up"""
+        import asyncio
+
+        cleaned_up = []
+
+        async def slow_check():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                await asyncio.sleep(0)  # cleanup that itself awaits
+                cleaned_up.append(True)
+                raise
+
+        async def failing_check():
+            raise Exception("Permission denied on project")
+
+        with pytest.raises(Exception, match="Permission denied"):
+            await verification_service._gather_fail_fast(slow_check(), failing_check(), slow_check())
+
+        assert cleaned_up == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_verify_pipeline_sink_failure_does_not_stop_checks(self, monkeypatch):
+        """Test a sink failure is reported as an issue while the other checks complete"""
+        from services import pubsub_service, sink_service, dataflow_service, gcs_service, bigquery_service
+
+        monkeypatch.setattr(pubsub_service, 'verify_topic_exists', AsyncMock(return_value=True))
+        monkeypatch.setattr(pubsub_service, 'verify_subscription_exists', AsyncMock(return_value=True))
+        monkeypatch.setattr(sink_service, 'verify_sink', AsyncMock(side_effect=Exception("Sink API error")))
+        monkeypatch.setattr(
+            dataflow_service, 'verify_dataflow_pipeline',
+            AsyncMock(return_value={"is_running": True, "issues": []})
+        )
+        monkeypatch.setattr(gcs_service, 'verify_bucket_exists', AsyncMock(return_value=True))
+        monkeypatch.setattr(gcs_service, 'verify_file_exists', AsyncMock(return_value=True))
+        monkeypatch.setattr(bigquery_service, 'verify_table_exists', AsyncMock(return_value=True))
+
+        result = await verification_service.verify_elt_pipeline("test-project-123", "test_dataset")
+
+        assert result["sink_configured"] is False
+        assert result["dataflow_running"] is True
+        assert result["bigquery_table_exists"] is True
+        assert any("Sink verification failed" in issue for issue in result["issues"])
+
     @pytest.mark.asyncio
     async def test_verify_pipeline_details_structure(self, monkeypatch):
         """Test that verification details have expected structure"""
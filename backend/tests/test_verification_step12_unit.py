@@ -3,6 +3,7 @@ Unit tests for Step 12 end-to-end verification.
 Tests verify_end_to_end function and all helper functions.
 """
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
 import asyncio
 
@@ -13,6 +14,23 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from services import verification_service
 
 
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """
+    Fake clock for the verification module: mocked sleeps are recorded in
+    .sleeps and move .now forward, so polling budgets run out without waiting.
+    """
+    clock = SimpleNamespace(now=0.0, sleeps=[])
+
+    async def mock_sleep(seconds):
+        clock.sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(verification_service.asyncio, 'sleep', mock_sleep)
+    monkeypatch.setattr(verification_service, 'time', SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
 class TestSendTestPrompts:
     """Test _send_test_prompts function"""
 
@@ -21,7 +39,7 @@ class TestSendTestPrompts:
         """Test successful sending of test prompts"""
         test_id = "test-uuid-123"
 
-        async def mock_run_commands():
+        async def mock_run_commands(test_id=None):
             return 5
 
         monkeypatch.setattr(verification_service, 'run_multiple_gemini_test_commands', mock_run_commands)
@@ -37,7 +55,7 @@ class TestSendTestPrompts:
         """Test when no prompts are sent"""
         test_id = "test-uuid-123"
 
-        async def mock_run_commands():
+        async def mock_run_commands(test_id=None):
             return 0
 
         monkeypatch.setattr(verification_service, 'run_multiple_gemini_test_commands', mock_run_commands)
@@ -52,7 +70,7 @@ class TestSendTestPrompts:
         """Test exception handling in _send_test_prompts"""
         test_id = "test-uuid-123"
 
-        async def mock_run_commands_error():
+        async def mock_run_commands_error(test_id=None):
             raise Exception("Gemini CLI not found")
 
         monkeypatch.setattr(verification_service, 'run_multiple_gemini_test_commands', mock_run_commands_error)
@@ -103,6 +121,64 @@ class TestVerifyCloudLogging:
         assert result["log_count"] == 0
 
 
+class TestCheckLogsInCloudLoggingDetailed:
+    """Test check_logs_in_cloud_logging_detailed"""
+
+    @pytest.mark.asyncio
+    async def test_fetches_single_entry(self, monkeypatch):
+        """Test only one entry is requested to prove logs exist"""
+        client = MagicMock()
+        client.list_entries.return_value = iter([Mock(timestamp="t", payload={})])
+        monkeypatch.setattr(verification_service, '_get_logging_client', MagicMock(return_value=client))
+
+        result = await verification_service.check_logs_in_cloud_logging_detailed("test-project")
+
+        assert result == {"found": True, "count": 1, "has_valid_structure": True}
+        assert client.list_entries.call_args.kwargs["max_results"] == 1
+        assert client.list_entries.call_args.kwargs["page_size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_entries(self, monkeypatch):
+        """Test an empty listing reports nothing found"""
+        client = MagicMock()
+        client.list_entries.return_value = iter([])
+        monkeypatch.setattr(verification_service, '_get_logging_client', MagicMock(return_value=client))
+
+        result = await verification_service.check_logs_in_cloud_logging_detailed("test-project")
+
+        assert result == {"found": False, "count": 0, "has_valid_structure": False}
+
+
+class TestCheckSinkErrors:
+    """Test check_sink_errors"""
+
+    @pytest.mark.asyncio
+    async def test_filter_groups_sink_methods(self, monkeypatch):
+        """Test the Create/UpdateSink alternatives are grouped and the time bound applies to both"""
+        client = MagicMock()
+        client.list_entries.return_value = iter([])
+        monkeypatch.setattr(verification_service, '_get_logging_client', MagicMock(return_value=client))
+
+        result = await verification_service.check_sink_errors("test-project")
+
+        assert result["has_errors"] is False
+        filter_str = client.list_entries.call_args.kwargs["filter_"]
+        assert ('AND (protoPayload.methodName:"google.logging.v2.ConfigServiceV2.CreateSink" '
+                'OR protoPayload.methodName:"google.logging.v2.ConfigServiceV2.UpdateSink") '
+                'AND protoPayload.status.code>0 AND timestamp>="') in filter_str
+
+    @pytest.mark.asyncio
+    async def test_counts_entries_returned_by_error_filter(self, monkeypatch):
+        """Test every entry matched by the server-side error filter is counted"""
+        client = MagicMock()
+        client.list_entries.return_value = iter([Mock(), Mock()])
+        monkeypatch.setattr(verification_service, '_get_logging_client', MagicMock(return_value=client))
+
+        result = await verification_service.check_sink_errors("test-project")
+
+        assert result == {"has_errors": True, "has_critical_errors": True, "error_count": 2}
+
+
 class TestVerifyPubSubMessages:
     """Test _verify_pubsub_messages function"""
 
@@ -428,3 +504,540 @@ class TestVerifyEndToEnd:
         assert result["success"] is False
         assert "dataflow" in result["steps"]
         assert result["steps"]["dataflow"]["success"] is False
+
+
+class TestPollUntil:
+    """Test _poll_until backoff polling helper"""
+
+    @pytest.mark.asyncio
+    async def test_returns_as_soon_as_done(self, monkeypatch):
+        """Test polling stops on the first result that satisfies the predicate"""
+        sleeps = []
+
+        async def mock_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(verification_service.asyncio, 'sleep', mock_sleep)
+        check = AsyncMock(side_effect=[{"found": False}, {"found": False}, {"found": True}])
+
+        result, _ = await verification_service._poll_until(check, lambda r: r["found"], 60)
+
+        assert result == {"found": True}
+        assert check.call_count == 3
+        assert sleeps == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_backs_off_until_timeout(self, fake_clock):
+        """Test intervals grow up to the cap and total waiting stays within the timeout"""
+        check = AsyncMock(return_value={"found": False})
+
+        result, elapsed = await verification_service._poll_until(check, lambda r: r["found"], 60)
+
+        assert result == {"found": False}
+        assert elapsed == 60
+        assert sum(fake_clock.sleeps) == 60
+        assert max(fake_clock.sleeps) == verification_service.POLL_MAX_INTERVAL
+        assert fake_clock.sleeps[:3] == [2, 3, 4.5]
+
+    @pytest.mark.asyncio
+    async def test_time_in_check_counts_against_timeout(self, fake_clock):
+        """Test slow checks use up the budget, so polling still stops at the timeout"""
+        async def slow_check(remaining):
+            fake_clock.now += 25  # e.g. a query that ran close to its own deadline
+            return {"found": False}
+
+        result, elapsed = await verification_service._poll_until(slow_check, lambda r: r["found"], 60)
+
+        assert result == {"found": False}
+        # 25s check, 2s sleep, 25s check, 3s sleep, 25s check -> out of budget
+        assert fake_clock.sleeps == [2, 3]
+        assert elapsed == 80
+
+
+class TestVerifyEndToEndPolling:
+    """Test verify_end_to_end waits only as long as the pipeline needs"""
+
+    @pytest.mark.asyncio
+    async def test_stops_waiting_once_data_reaches_bigquery(self, monkeypatch):
+        """Test BigQuery is polled until logs arrive instead of sleeping a fixed time"""
+        sleeps = []
+
+        async def mock_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(verification_service.asyncio, 'sleep', mock_sleep)
+        monkeypatch.setattr(verification_service, '_send_test_prompts', AsyncMock())
+        monkeypatch.setattr(verification_service, '_get_latest_gemini_cli_log', AsyncMock(
+            return_value={"found": True, "latest_timestamp": "2025-01-01T00:00:00+00:00"}
+        ))
+        bigquery_check = AsyncMock(side_effect=[
+            {"matched_count": 0, "total_recent_count": 0},
+            {"matched_count": 3, "total_recent_count": 3},
+        ])
+        monkeypatch.setattr(verification_service, '_check_bigquery_for_timestamp', bigquery_check)
+        monkeypatch.setattr(verification_service, '_query_analytics_view', AsyncMock(return_value={"row_count": 3}))
+
+        result = await verification_service.verify_end_to_end("test-project", "test_dataset")
+
+        assert result["success"] is True
+        assert result["bigquery_matched_count"] == 3
+        assert bigquery_check.call_count == 2
+        assert sleeps == [verification_service.POLL_INITIAL_INTERVAL]
+
+    @pytest.mark.asyncio
+    async def test_rejects_dataset_name_before_querying(self, monkeypatch):
+        """Test identifiers interpolated into SQL are validated before any query runs"""
+        bigquery_check = AsyncMock()
+        monkeypatch.setattr(verification_service, '_send_test_prompts', AsyncMock())
+        monkeypatch.setattr(verification_service, '_check_bigquery_for_timestamp', bigquery_check)
+
+        with pytest.raises(ValueError, match="Invalid input"):
+            await verification_service.verify_end_to_end("test-project", "logs`; DROP TABLE x; --")
+
+        bigquery_check.assert_not_called()
+
+
+class TestLoggingCutoff:
+    """Test the Cloud Logging filter timestamp helper"""
+
+    def test_utc_timestamp_minutes_ago(self):
+        """Test the cutoff is a Z-suffixed UTC timestamp the given minutes in the past"""
+        from datetime import datetime, timedelta, timezone
+
+        cutoff = verification_service._logging_cutoff(minutes=10)
+
+        parsed = datetime.strptime(cutoff, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+        age = datetime.now(timezone.utc) - parsed
+        assert timedelta(minutes=10) <= age < timedelta(minutes=10, seconds=5)
+
+
+class TestGetLatestGeminiCliLog:
+    """Test the latest-log lookup fetches a single entry"""
+
+    @pytest.mark.asyncio
+    async def test_requests_only_newest_entry(self, monkeypatch):
+        """Test Cloud Logging is asked for one entry, newest first"""
+        entry = MagicMock()
+        entry.timestamp.isoformat.return_value = "2025-01-01T00:00:00+00:00"
+        client = MagicMock()
+        client.list_entries.return_value = iter([entry])
+        monkeypatch.setattr(verification_service.cloud_logging, 'Client', MagicMock(return_value=client))
+
+        result = await verification_service._get_latest_gemini_cli_log("test-project")
+
+        assert result == {"found": True, "latest_timestamp": "2025-01-01T00:00:00+00:00"}
+        kwargs = client.list_entries.call_args.kwargs
+        assert kwargs["max_results"] == 1
+        assert kwargs["page_size"] == 1
+        assert kwargs["order_by"] == "timestamp desc"
+
+    @pytest.mark.asyncio
+    async def test_no_entries(self, monkeypatch):
+        """Test an empty result reports no logs found"""
+        client = MagicMock()
+        client.list_entries.return_value = iter([])
+        monkeypatch.setattr(verification_service.cloud_logging, 'Client', MagicMock(return_value=client))
+
+        result = await verification_service._get_latest_gemini_cli_log("test-project")
+
+        assert result == {"found": False, "latest_timestamp": None}
+
+
+class TestSharedClients:
+    """Test clients are created once per project and reused"""
+
+    def test_bigquery_client_reused_per_project(self, monkeypatch):
+        """Test repeated lookups for a project share one BigQuery client"""
+        client_cls = MagicMock(side_effect=lambda project: MagicMock(project=project))
+        monkeypatch.setattr(verification_service.bigquery, 'Client', client_cls)
+
+        first = verification_service._get_bigquery_client("project-a")
+        assert verification_service._get_bigquery_client("project-a") is first
+        assert verification_service._get_bigquery_client("project-b") is not first
+        assert client_cls.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_logging_client_reused_across_polls(self, monkeypatch):
+        """Test polling Cloud Logging doesn't rebuild the client each attempt"""
+        client = MagicMock()
+        client.list_entries.side_effect = lambda **kwargs: iter([])
+        client_cls = MagicMock(return_value=client)
+        monkeypatch.setattr(verification_service.cloud_logging, 'Client', client_cls)
+
+        await verification_service._get_latest_gemini_cli_log("test-project")
+        await verification_service._get_latest_gemini_cli_log("test-project")
+
+        assert client_cls.call_count == 1
+        assert client.list_entries.call_count == 2
+
+
+class TestQueryRows:
+    """Test BigQuery queries run off the event loop"""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_job_in_worker_thread(self):
+        """Test the job's result() is waited on outside the event loop thread"""
+        import threading
+        result_threads = []
+
+        def result(timeout=None):
+            result_threads.append(threading.current_thread())
+            return iter([{"row_count": 1}])
+
+        mock_client = MagicMock()
+        mock_client.query.return_value.result.side_effect = result
+
+        rows = await verification_service._query_rows(mock_client, "SELECT 1")
+
+        assert rows == [{"row_count": 1}]
+        assert result_threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_first_row_stops_after_one_row(self):
+        """Test single-row lookups don't drain the rest of the result iterator"""
+        fetched = []
+
+        def rows():
+            for i in range(3):
+                fetched.append(i)
+                yield Mock(row_count=i)
+
+        mock_client = MagicMock()
+        mock_client.query.return_value.result.return_value = rows()
+
+        row = await verification_service._query_first_row(mock_client, "SELECT COUNT(*) AS row_count")
+
+        assert row.row_count == 0
+        assert fetched == [0]
+
+    @pytest.mark.asyncio
+    async def test_first_row_none_when_empty(self):
+        """Test an empty result gives None"""
+        mock_client = MagicMock()
+        mock_client.query.return_value.result.return_value = iter([])
+
+        assert await verification_service._query_first_row(mock_client, "SELECT 1") is None
+
+    @pytest.mark.asyncio
+    async def test_waits_with_timeout(self):
+        """Test result() is bounded so a hung job can't stall polling"""
+        mock_client = MagicMock()
+        mock_client.query.return_value.result.return_value = iter([])
+
+        await verification_service._query_rows(mock_client, "SELECT 1")
+
+        mock_client.query.return_value.result.assert_called_once_with(
+            timeout=verification_service.BIGQUERY_QUERY_TIMEOUT
+        )
+
+    @pytest.mark.asyncio
+    async def test_wait_capped_by_caller_budget(self):
+        """Test a shorter caller budget lowers the wait, but never below 1s or above the cap"""
+        mock_client = MagicMock()
+        mock_client.query.return_value.result.return_value = iter([])
+
+        await verification_service._query_rows(mock_client, "SELECT 1", timeout=7.5)
+        await verification_service._query_rows(mock_client, "SELECT 1", timeout=0)
+        await verification_service._query_rows(mock_client, "SELECT 1", timeout=600)
+
+        timeouts = [c.kwargs["timeout"] for c in mock_client.query.return_value.result.call_args_list]
+        assert timeouts == [7.5, 1.0, verification_service.BIGQUERY_QUERY_TIMEOUT]
+
+    @pytest.mark.asyncio
+    async def test_timeout_propagates(self):
+        """Test a job that times out raises instead of returning empty rows"""
+        import concurrent.futures
+
+        mock_client = MagicMock()
+        mock_client.query.return_value.result.side_effect = concurrent.futures.TimeoutError()
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            await verification_service._query_first_row(mock_client, "SELECT 1")
+
+
+class TestProbeQueryColumns:
+    """Test verification probes only read the columns they check"""
+
+    @pytest.mark.asyncio
+    async def test_schema_probe_skips_unused_json_columns(self, monkeypatch):
+        """Test the schema check doesn't scan operation/httpRequest JSON"""
+        query_first_row = AsyncMock(return_value=None)
+        monkeypatch.setattr(verification_service, '_query_first_row', query_first_row)
+        monkeypatch.setattr(verification_service, '_get_bigquery_client', MagicMock())
+
+        await verification_service._verify_json_string_schema("test-project", "test_dataset", "test-id")
+
+        query = query_first_row.call_args.args[1]
+        assert "jsonPayload_json" in query
+        assert "operation_json" not in query
+        assert "httpRequest_json" not in query
+
+
+class TestPollBigQueryForData:
+    """Test poll_bigquery_for_data backs off instead of checking on a fixed interval"""
+
+    @pytest.fixture(autouse=True)
+    def mock_bigquery_client(self, monkeypatch):
+        mock_client = MagicMock()
+        mock_client.get_table.return_value = Mock(num_rows=42)
+        monkeypatch.setattr(verification_service, '_get_bigquery_client', MagicMock(return_value=mock_client))
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_returns_once_data_found(self, monkeypatch):
+        """Test the poll returns on the first check that finds data, after a short first wait"""
+        sleeps = []
+
+        async def mock_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(verification_service.asyncio, 'sleep', mock_sleep)
+        monkeypatch.setattr(verification_service.random, 'uniform', lambda a, b: 0)
+        check = AsyncMock(side_effect=[{"has_data": False}, {"has_data": True, "row_count": 4}])
+        monkeypatch.setattr(verification_service, 'check_data_in_bigquery_detailed', check)
+
+        result = await verification_service.poll_bigquery_for_data("test-project", "test_dataset")
+
+        assert result == {"has_data": True, "row_count": 4}
+        assert sleeps == [verification_service.BIGQUERY_POLL_INITIAL_INTERVAL]
+
+    @pytest.mark.asyncio
+    async def test_timeout_bounded_by_max_wait(self, monkeypatch, fake_clock):
+        """Test a poll that never finds data waits max_wait_seconds in total, with growing gaps"""
+        sleeps = fake_clock.sleeps
+        monkeypatch.setattr(verification_service.random, 'uniform', lambda a, b: 0)
+        monkeypatch.setattr(verification_service, 'check_data_in_bigquery_detailed',
+                            AsyncMock(side_effect=lambda *args, **kwargs: {"has_data": False}))
+
+        result = await verification_service.poll_bigquery_for_data("test-project", "test_dataset", max_wait_seconds=60)
+
+        assert result["timeout"] is True
+        assert sum(sleeps) == pytest.approx(60)
+        assert sleeps == sorted(sleeps[:-1]) + sleeps[-1:]
+        assert max(sleeps) <= verification_service.BIGQUERY_POLL_MAX_INTERVAL
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("jitter_draw, expected_checks", [(0, 12), (1, 11)])
+    async def test_check_count_over_default_window(self, monkeypatch, fake_clock, jitter_draw, expected_checks):
+        """Test a poll that never finds data runs fewer billed queries than a flat 20s interval (16 in 300s)"""
+        # jitter_draw picks the shortest (0) or longest (1) jittered gaps
+        monkeypatch.setattr(verification_service.random, 'uniform', lambda a, b: a + (b - a) * jitter_draw)
+        check = AsyncMock(side_effect=lambda *args, **kwargs: {"has_data": False})
+        monkeypatch.setattr(verification_service, 'check_data_in_bigquery_detailed', check)
+
+        result = await verification_service.poll_bigquery_for_data("test-project", "test_dataset")
+
+        assert result["elapsed_seconds"] == 300
+        assert check.call_count == expected_checks
+        assert max(fake_clock.sleeps) <= (
+            verification_service.BIGQUERY_POLL_MAX_INTERVAL * (1 + verification_service.BIGQUERY_POLL_JITTER)
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_queries_stop_at_max_wait(self, monkeypatch, fake_clock, mock_bigquery_client):
+        """Test query waits are capped by the poll budget, so slow jobs can't push past max_wait_seconds"""
+        import concurrent.futures
+
+        def slow_result(timeout):
+            fake_clock.now += timeout  # the job runs until its deadline
+            raise concurrent.futures.TimeoutError()
+
+        mock_bigquery_client.query.return_value.result.side_effect = slow_result
+        monkeypatch.setattr(verification_service.random, 'uniform', lambda a, b: 0)
+
+        result = await verification_service.poll_bigquery_for_data("test-project", "test_dataset", max_wait_seconds=40)
+
+        timeouts = [c.kwargs["timeout"] for c in mock_bigquery_client.query.return_value.result.call_args_list]
+        assert timeouts[0] == verification_service.BIGQUERY_QUERY_TIMEOUT
+        assert timeouts[1] == 40 - 30 - verification_service.BIGQUERY_POLL_INITIAL_INTERVAL
+        assert result["has_data"] is False
+        assert result["elapsed_seconds"] == 40
+
+    @pytest.mark.asyncio
+    async def test_table_looked_up_once(self, monkeypatch, mock_bigquery_client):
+        """Test the table metadata is fetched once and handed to every attempt"""
+        monkeypatch.setattr(verification_service.asyncio, 'sleep', AsyncMock())
+        check = AsyncMock(side_effect=[{"has_data": False}, {"has_data": False}, {"has_data": True}])
+        monkeypatch.setattr(verification_service, 'check_data_in_bigquery_detailed', check)
+
+        await verification_service.poll_bigquery_for_data("test-project", "test_dataset")
+
+        mock_bigquery_client.get_table.assert_called_once_with("test-project.test_dataset.gemini_cli")
+        assert [c.args[2] for c in check.call_args_list] == [42, 42, 42]
+
+    @pytest.mark.asyncio
+    async def test_missing_table_checked_each_attempt(self, monkeypatch, mock_bigquery_client):
+        """Test a table that doesn't exist yet is left for each attempt to look up"""
+        monkeypatch.setattr(verification_service.asyncio, 'sleep', AsyncMock())
+        mock_bigquery_client.get_table.side_effect = Exception("Not found")
+        check = AsyncMock(side_effect=[{"has_data": False}, {"has_data": True}])
+        monkeypatch.setattr(verification_service, 'check_data_in_bigquery_detailed', check)
+
+        await verification_service.poll_bigquery_for_data("test-project", "test_dataset")
+
+        assert [c.args[2] for c in check.call_args_list] == [None, None]
+
+
+class TestCheckDataInBigQueryDetailed:
+    """Test check_data_in_bigquery_detailed"""
+
+    @pytest.mark.asyncio
+    async def test_no_recent_data_uses_table_row_count(self, monkeypatch):
+        """Test the historical total comes from table metadata, not another COUNT(*) job"""
+        mock_client = MagicMock()
+        mock_client.get_table.return_value = Mock(num_rows=42)
+        mock_client.query.return_value.result.return_value = [Mock(row_count=0)]
+        monkeypatch.setattr(verification_service, '_get_bigquery_client', MagicMock(return_value=mock_client))
+
+        result = await verification_service.check_data_in_bigquery_detailed("test-project", "test_dataset")
+
+        assert result["has_data"] is False
+        assert result["row_count"] == 42
+        assert result["recent_row_count"] == 0
+        mock_client.query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_recent_count_and_sample_in_one_query(self, monkeypatch):
+        """Test the recent count and the structure sample come back from a single job"""
+        mock_client = MagicMock()
+        mock_client.get_table.return_value = Mock(num_rows=42)
+        mock_client.query.return_value.result.return_value = [
+            Mock(row_count=3, sample={"timestamp": "2025-01-01T00:00:00Z", "logName": "projects/p/logs/gemini_cli"})
+        ]
+        monkeypatch.setattr(verification_service, '_get_bigquery_client', MagicMock(return_value=mock_client))
+
+        result = await verification_service.check_data_in_bigquery_detailed("test-project", "test_dataset")
+
+        assert result["has_data"] is True
+        assert result["recent_row_count"] == 3
+        assert result["has_valid_structure"] is True
+        mock_client.query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_known_total_rows_skips_table_lookup(self, monkeypatch):
+        """Test a caller-supplied row count replaces get_table, even when it was zero"""
+        mock_client = MagicMock()
+        mock_client.query.return_value.result.return_value = [
+            Mock(row_count=2, sample={"timestamp": "2025-01-01T00:00:00Z", "logName": "projects/p/logs/gemini_cli"})
+        ]
+        monkeypatch.setattr(verification_service, '_get_bigquery_client', MagicMock(return_value=mock_client))
+
+        result = await verification_service.check_data_in_bigquery_detailed("test-project", "test_dataset", 0)
+
+        mock_client.get_table.assert_not_called()
+        assert result["has_data"] is True
+        assert result["recent_row_count"] == 2
+
+
+class TestRunMultipleGeminiTestCommands:
+    """Test run_multiple_gemini_test_commands sends prompts concurrently"""
+
+    @staticmethod
+    def _mock_process(returncode=0, stderr=b"", communicate=None):
+        process = MagicMock()
+        process.returncode = returncode
+        process.communicate = communicate or AsyncMock(return_value=(b"{}", stderr))
+        process.wait = AsyncMock()
+        return process
+
+    @pytest.mark.asyncio
+    async def test_prompts_run_concurrently(self, monkeypatch):
+        """Test all prompts are started before any of them finishes"""
+        started = []
+        all_started = asyncio.Event()
+
+        async def communicate():
+            if len(started) == 5:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return b"{}", b""
+
+        async def mock_exec(*args, **kwargs):
+            started.append(args)
+            return self._mock_process(communicate=communicate)
+
+        monkeypatch.setattr(verification_service.asyncio, 'create_subprocess_exec', mock_exec)
+
+        result = await verification_service.run_multiple_gemini_test_commands()
+
+        assert result == 5
+        assert all(args[:2] == ("gemini", "--prompt") for args in started)
+
+    @pytest.mark.asyncio
+    async def test_projects_from_cached_settings(self, monkeypatch):
+        """Test the prompt env takes its projects from telemetry_service's settings reader"""
+        from services import telemetry_service
+        monkeypatch.setattr(telemetry_service, 'read_gemini_settings', AsyncMock(return_value={
+            "env": {"GOOGLE_CLOUD_PROJECT": "inference-project", "OTLP_GOOGLE_CLOUD_PROJECT": "telemetry-project"}
+        }))
+        exec_mock = AsyncMock(side_effect=lambda *args, **kwargs: self._mock_process())
+        monkeypatch.setattr(verification_service.asyncio, 'create_subprocess_exec', exec_mock)
+
+        await verification_service.run_multiple_gemini_test_commands()
+
+        env = exec_mock.call_args.kwargs["env"]
+        assert env["GOOGLE_CLOUD_PROJECT"] == "inference-project"
+        assert env["OTLP_GOOGLE_CLOUD_PROJECT"] == "telemetry-project"
+
+    @pytest.mark.asyncio
+    async def test_prompts_tagged_with_test_id(self, monkeypatch):
+        """Test each prompt carries the verification test ID"""
+        exec_mock = AsyncMock(side_effect=lambda *args, **kwargs: self._mock_process())
+        monkeypatch.setattr(verification_service.asyncio, 'create_subprocess_exec', exec_mock)
+
+        await verification_service.run_multiple_gemini_test_commands("abc-123")
+
+        prompts = [call.args[2] for call in exec_mock.call_args_list]
+        assert len(prompts) == 5
+        assert all(prompt.startswith("[verification_id=abc-123] ") for prompt in prompts)
+
+    @pytest.mark.asyncio
+    async def test_counts_non_zero_exit_but_not_timeouts(self, monkeypatch):
+        """Test prompts that exit non-zero count as sent, timed-out ones don't"""
+        async def timeout():
+            raise asyncio.TimeoutError()
+
+        processes = [
+            self._mock_process(),
+            self._mock_process(returncode=1, stderr=b"quota exceeded"),
+            self._mock_process(communicate=timeout),
+            self._mock_process(),
+            self._mock_process(),
+        ]
+        monkeypatch.setattr(
+            verification_service.asyncio, 'create_subprocess_exec', AsyncMock(side_effect=processes)
+        )
+
+        result = await verification_service.run_multiple_gemini_test_commands()
+
+        assert result == 4
+        processes[2].kill.assert_called_once()
+
+
+class TestCheckBigQueryForTimestamp:
+    """Test _check_bigquery_for_timestamp"""
+
+    @pytest.mark.asyncio
+    async def test_counts_with_single_parameterized_query(self):
+        """Test matched and recent counts come from one query with the timestamp as a parameter"""
+        timestamp = "2025-01-01T00:00:00+00:00"
+        mock_client = MagicMock()
+        mock_client.query.return_value.result.return_value = [
+            Mock(matched_count=3, recent_count=7, test_id_count=2)
+        ]
+
+        with patch('google.cloud.bigquery.Client', return_value=mock_client):
+            result = await verification_service._check_bigquery_for_timestamp(
+                "test-project", "test_dataset", timestamp, "abc-123"
+            )
+
+        assert result == {"matched_count": 3, "total_recent_count": 7, "test_id_count": 2}
+        mock_client.query.assert_called_once()
+        query = mock_client.query.call_args.args[0]
+        assert timestamp not in query
+        assert "abc-123" not in query
+        params = mock_client.query.call_args.kwargs["job_config"].query_parameters
+        assert [(p.name, p.value) for p in params] == [
+            ("log_timestamp", timestamp),
+            ("test_marker", "verification_id=abc-123"),
+        ]
@@ -11,6 +11,16 @@ import re
 from typing import List
 
 
+# Patterns are compiled once at import time rather than on every call
+_PROJECT_ID_PATTERN = re.compile(r'^[a-z][a-z0-9-]{4,28}[a-z0-9]$')
+_DATASET_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{1,1024}$')
+_REGION_PATTERN = re.compile(r'^[a-z]+-[a-z]+[0-9]+$')
+_NETWORK_NAME_PATTERN = re.compile(r'^[a-z]([a-z0-9-]{0,61}[a-z0-9])?$')
+_BUCKET_NAME_PATTERN = re.compile(r'^[a-z0-9][a-z0-9_-]{1,61}[a-z0-9]$')
+_TOPIC_NAME_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]{2,254}$')
+_TABLE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{1,1024}$')
+
+
 class ValidationError(Exception):
     """Custom exception for validation failures"""
     pass
@@ -38,8 +48,7 @@ def validate_gcp_project_id(project_id: str) -> str:
     if not project_id:
         raise ValidationError("Project ID cannot be empty")
 
-    pattern = r'^[a-z][a-z0-9-]{4,28}[a-z0-9]$'
-    if not re.match(pattern, project_id):
+    if not _PROJECT_ID_PATTERN.match(project_id):
         raise ValidationError(
             f"Invalid GCP project ID: '{project_id}'. "
             f"Must be 6-30 characters, start with lowercase letter, "
@@ -64,8 +73,7 @@ def validate_dataset_name(dataset_name: str) -> str:
     if not dataset_name:
         raise ValidationError("Dataset name cannot be empty")
 
-    pattern = r'^[a-zA-Z0-9_]{1,1024}$'
-    if not re.match(pattern, dataset_name):
+    if not _DATASET_NAME_PATTERN.match(dataset_name):
         raise ValidationError(
             f"Invalid dataset name: '{dataset_name}'. "
             f"Must contain only letters, digits, underscores (1-1024 chars)."
@@ -90,8 +98,7 @@ def validate_region(region: str) -> str:
         raise ValidationError("Region cannot be empty")
 
     # Common GCP region pattern: us-central1, europe-west1, etc.
-    pattern = r'^[a-z]+-[a-z]+[0-9]+$'
-    if not re.match(pattern, region):
+    if not _REGION_PATTERN.match(region):
         raise ValidationError(
             f"Invalid region: '{region}'. "
             f"Expected format: 'us-central1', 'europe-west1', etc."
@@ -116,8 +123,7 @@ def validate_network_name(network_name: str) -> str:
         raise ValidationError("Network name cannot be empty")
 
     # RFC 1035: lowercase letters, digits, hyphens, 1-63 chars
-    pattern = r'^[a-z]([a-z0-9-]{0,61}[a-z0-9])?$'
-    if not re.match(pattern, network_name):
+    if not _NETWORK_NAME_PATTERN.match(network_name):
         raise ValidationError(
             f"Invalid network name: '{network_name}'. "
             f"Must be lowercase letters, digits, hyphens (1-63 chars)."
@@ -142,8 +148,7 @@ def validate_bucket_name(bucket_name: str) -> str:
         raise ValidationError("Bucket name cannot be empty")
 
     # GCS bucket naming rules
-    pattern = r'^[a-z0-9][a-z0-9_-]{1,61}[a-z0-9]$'
-    if not re.match(pattern, bucket_name):
+    if not _BUCKET_NAME_PATTERN.match(bucket_name):
         raise ValidationError(
             f"Invalid bucket name: '{bucket_name}'. "
             f"Must be lowercase letters, digits, hyphens, underscores (3-63 chars)."
@@ -170,8 +175,7 @@ def validate_topic_name(topic_name: str) -> str:
         raise ValidationError("Topic name cannot be empty")
 
     # Pub/Sub topic naming rules
-    pattern = r'^[a-zA-Z][a-zA-Z0-9_-]{2,254}$'
-    if not re.match(pattern, topic_name):
+    if not _TOPIC_NAME_PATTERN.match(topic_name):
         raise ValidationError(
             f"Invalid topic name: '{topic_name}'. "
             f"Must start with letter, contain letters/digits/hyphens/underscores (3-255 chars)."
@@ -195,8 +199,7 @@ def validate_table_name(table_name: str) -> str:
     if not table_name:
         raise ValidationError("Table name cannot be empty")
 
-    pattern = r'^[a-zA-Z0-9_]{1,1024}$'
-    if not re.match(pattern, table_name):
+    if not _TABLE_NAME_PATTERN.match(table_name):
         raise ValidationError(
             f"Invalid table name: '{table_name}'. "
             f"Must contain only letters, digits, underscores (1-1024 chars)."